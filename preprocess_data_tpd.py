@@ -19,17 +19,44 @@ TPD-specific changes:
 
 import os
 import json
+import re
 import sys
+import time
+import functools
+import threading
+import traceback
 import argparse
 import pandas as pd
+import numpy as np
 try:
     import psycopg2  # For Redshift connection
+    import psycopg2.pool
     PSYCOPG2_AVAILABLE = True
 except ImportError:
     PSYCOPG2_AVAILABLE = False
     print("WARNING: psycopg2 not installed. Install it with: pip install psycopg2-binary")
+try:
+    import connectorx as cx  # Optional: reads query results straight into typed columns
+    CONNECTORX_AVAILABLE = True
+except ImportError:
+    CONNECTORX_AVAILABLE = False
+try:
+    import pyarrow as pa  # Optional: faster CSV writer
+    import pyarrow.csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+try:
+    import orjson  # Optional: faster JSON decoding for custom_dimension_1 (and metadata.json)
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
+from multiprocessing import Pool, get_context
 from dotenv import load_dotenv
+from types import MappingProxyType
 from typing import List, Tuple, Optional
 
 # Load environment variables
@@ -45,6 +72,27 @@ REDSHIFT_PASSWORD = os.getenv("REDSHIFT_PASSWORD", "Rlproduct@1234")
 # Schema prefix for all queries
 SCHEMA_PREFIX = "rl_dwh_prod.live"
 
+# psycopg2 connection settings shared by the pool and any standalone connection
+REDSHIFT_CONNECT_KWARGS = dict(
+    host=REDSHIFT_HOST,
+    database=REDSHIFT_DATABASE,
+    port=REDSHIFT_PORT,
+    user=REDSHIFT_USER,
+    password=REDSHIFT_PASSWORD,
+    connect_timeout=60,
+    keepalives=1,  # Enable TCP keepalive
+    keepalives_idle=30,  # Start keepalive after 30 seconds of idle
+    keepalives_interval=10,  # Send keepalive every 10 seconds
+    keepalives_count=5  # Number of keepalive packets before considering connection dead
+)
+
+# Shared Redshift connection pool, created on first use by get_redshift_connection()
+_REDSHIFT_POOL = None
+_REDSHIFT_POOL_LOCK = threading.Lock()
+
+# Verbose debug output: per-record samples and [DEBUG] diagnostics (set PREPROCESS_DEBUG=1 to enable)
+_DEBUG = os.environ.get('PREPROCESS_DEBUG') == '1'
+
 # Print database configuration at startup (only if psycopg2 is available)
 # Note: Question correctness now uses Redshift (same query as score distribution)
 if PSYCOPG2_AVAILABLE:
@@ -72,7 +120,10 @@ else:
 
 # SQL Queries - Updated with new event categorization
 # Event stages: started, introduction, questions, mid_introduction, validation, parent_poll, rewards, completed
+# The event stage is derived from mla.name client-side (see categorize_event in fetch_dataframe)
+# rather than with a per-row CASE in Redshift
 # Optimized query: Filter by action names first to reduce JOIN overhead
+# Not executed by this script: fetch_dataframe loads tpd_conversion_funnel.csv instead
 SQL_QUERY = (
     """
     SELECT DISTINCT
@@ -83,24 +134,7 @@ SQL_QUERY = (
       mla.name,
       mllva.idpageview,
       TO_HEX(mllva.idvisitor) AS idvisitor_hex,
-      mllva.idvisit,
-      CASE 
-        WHEN mla.name LIKE '%_started%' THEN 'started'
-        WHEN mla.name LIKE '%introduction_completed%' AND mla.name NOT LIKE '%mid%' THEN 'introduction'
-        WHEN mla.name LIKE '%_mid_introduction%' THEN 'mid_introduction'
-        WHEN mla.name LIKE '%_poll_completed%' THEN 'parent_poll'
-        WHEN mla.name LIKE '%action_completed%' THEN 'questions'
-        WHEN mla.name LIKE '%reward_completed%' THEN 'rewards'
-        WHEN mla.name LIKE '%question_completed%' THEN 'validation'
-        WHEN mla.name LIKE '%completed%' 
-             AND mla.name NOT LIKE '%introduction%'
-             AND mla.name NOT LIKE '%reward%'
-             AND mla.name NOT LIKE '%question%'
-             AND mla.name NOT LIKE '%mid_introduction%'
-             AND mla.name NOT LIKE '%poll%'
-             AND mla.name NOT LIKE '%action%' THEN 'completed'
-        ELSE NULL
-      END AS event
+      mllva.idvisit
     FROM rl_dwh_prod.live.matomo_log_link_visit_action mllva
     INNER JOIN rl_dwh_prod.live.matomo_log_action mla 
       ON mllva.idaction_name = mla.idaction
@@ -284,7 +318,31 @@ INNER JOIN game_activity_mappings gam ON nai.normalized_activity_id = gam.activi
 WHERE gam.activity_id IS NOT NULL
 """
 
-# Note: Question Correctness now uses SCORE_DISTRIBUTION_QUERY (same as score distribution)
+# Question correctness reads the same rows as score distribution, collapsed to one row per
+# user per distinct payload. Duplicate events parse to the same questions and only distinct
+# users are counted afterwards, so there is no need to ship (or parse) them more than once.
+QUESTION_CORRECTNESS_QUERY = f"""
+SELECT
+  score_rows.game_name,
+  score_rows.action_name,
+  score_rows.custom_dimension_1,
+  score_rows.idvisitor_hex,
+  score_rows.game_code,
+  score_rows.language,
+  MIN(score_rows.idlink_va) AS idlink_va,
+  MIN(score_rows.idvisit) AS idvisit,
+  MIN(score_rows.server_time) AS server_time
+FROM ({SCORE_DISTRIBUTION_QUERY}) score_rows
+GROUP BY
+  score_rows.game_name,
+  score_rows.action_name,
+  score_rows.custom_dimension_1,
+  score_rows.idvisitor_hex,
+  score_rows.game_code,
+  score_rows.language
+"""
+
+# Note: Question Correctness now uses QUESTION_CORRECTNESS_QUERY (built on the score distribution query)
 # The old QUESTION_CORRECTNESS_QUERY_1, QUERY_2, and QUERY_3 are no longer used
 # They are kept below for reference but should not be used
 QUESTION_CORRECTNESS_QUERY_1_DEPRECATED = """
@@ -469,6 +527,68 @@ WHERE hu.phone IS NOT NULL
 """
 
 
+def get_redshift_connection():
+    """Borrow a Redshift connection from the shared pool
+
+    The pipeline runs several queries back to back; reusing pooled connections avoids
+    paying the TCP/TLS handshake and authentication for every one. If the pool is
+    exhausted (e.g. a connection was left checked out by a failed attempt), a standalone
+    connection is opened instead.
+    """
+    global _REDSHIFT_POOL
+    with _REDSHIFT_POOL_LOCK:
+        if _REDSHIFT_POOL is None:
+            # Thread-safe pool: main() prefetches question correctness data on a worker thread
+            # psycopg2 keeps at most minconn idle connections and closes the rest on putconn,
+            # so minconn covers the main thread plus the prefetch thread
+            _REDSHIFT_POOL = psycopg2.pool.ThreadedConnectionPool(2, 4, **REDSHIFT_CONNECT_KWARGS)
+    try:
+        return _REDSHIFT_POOL.getconn()
+    except psycopg2.pool.PoolError:
+        return psycopg2.connect(**REDSHIFT_CONNECT_KWARGS)
+
+
+def release_redshift_connection(conn, discard: bool = False):
+    """Return a connection to the shared pool (rolling back any open transaction), or close it
+
+    discard=True closes a pooled connection instead of keeping it idle (e.g. after an error).
+    """
+    if _REDSHIFT_POOL is not None:
+        if not discard:
+            # Several fetchers SET statement_timeout on the session; put it back to the server
+            # default so it doesn't carry over to the next borrower of this pooled connection
+            try:
+                conn.rollback()
+                with conn.cursor() as cur:
+                    cur.execute("RESET statement_timeout")
+                conn.commit()
+            except psycopg2.Error:
+                discard = True
+        try:
+            _REDSHIFT_POOL.putconn(conn, close=discard)
+            return
+        except psycopg2.pool.PoolError:
+            pass  # Standalone connection opened when the pool was exhausted
+    conn.close()
+
+
+@contextmanager
+def redshift_connection():
+    """Borrow a pooled Redshift connection for the duration of a with block
+
+    The connection goes back to the pool when the block ends; if the block raises, it is
+    discarded instead, so failed attempts neither hold a pool slot nor leave a broken
+    connection idle for the next caller.
+    """
+    conn = get_redshift_connection()
+    try:
+        yield conn
+    except BaseException:
+        release_redshift_connection(conn, discard=True)
+        raise
+    release_redshift_connection(conn)
+
+
 def fetch_mapped_users_data() -> set:
     """Fetch mapped users (phones that appear in both queries) from Redshift
     
@@ -491,50 +611,36 @@ def fetch_mapped_users_data() -> set:
     print(f"  Connection Library: psycopg2 (PostgreSQL/Redshift driver)")
     
     # Retry configuration
-    import time
     max_retries = 3
     retry_delay = 5  # seconds
     
     for attempt in range(1, max_retries + 1):
         try:
             print(f"\n  [ACTION] Connecting to REDSHIFT (Attempt {attempt}/{max_retries})...")
-            conn = psycopg2.connect(
-                host=REDSHIFT_HOST,
-                database=REDSHIFT_DATABASE,
-                port=REDSHIFT_PORT,
-                user=REDSHIFT_USER,
-                password=REDSHIFT_PASSWORD,
-                connect_timeout=60,
-                keepalives=1,
-                keepalives_idle=30,
-                keepalives_interval=10,
-                keepalives_count=5
-            )
-            
-            # Set statement timeout to 30 minutes for large queries
-            with conn.cursor() as cur:
-                cur.execute("SET statement_timeout = '1800000'")  # 30 minutes in milliseconds
-                conn.commit()
+            with redshift_connection() as conn:
+                # Set statement timeout to 30 minutes for large queries
+                with conn.cursor() as cur:
+                    cur.execute("SET statement_timeout = '1800000'")  # 30 minutes in milliseconds
+                    conn.commit()
+            
+                print(f"  ✓ Successfully connected to REDSHIFT")
+            
+                # Fetch phones from query 1 (hybrid_users)
+                print(f"  [ACTION] Executing query 1 (hybrid_users phones)...")
+                df_query1 = pd.read_sql(MAPPED_USERS_QUERY_1, conn)
+                phones_query1 = set(df_query1['phone'].dropna().astype(str).str.strip())
+                print(f"  ✓ Query 1 returned {len(phones_query1)} unique phones from hybrid_users")
+            
+                # Fetch phones from query 2 (guardians)
+                print(f"  [ACTION] Executing query 2 (guardians phones)...")
+                df_query2 = pd.read_sql(MAPPED_USERS_QUERY_2, conn)
+                phones_query2 = set(df_query2['phone'].dropna().astype(str).str.strip())
+                print(f"  ✓ Query 2 returned {len(phones_query2)} unique phones from guardians")
+            
+                # Find mapped phones (phones that appear in both queries)
+                mapped_phones = phones_query1.intersection(phones_query2)
+                print(f"  ✓ Found {len(mapped_phones)} mapped phones (appear in both queries)")
             
-            print(f"  ✓ Successfully connected to REDSHIFT")
-            
-            # Fetch phones from query 1 (hybrid_users)
-            print(f"  [ACTION] Executing query 1 (hybrid_users phones)...")
-            df_query1 = pd.read_sql(MAPPED_USERS_QUERY_1, conn)
-            phones_query1 = set(df_query1['phone'].dropna().astype(str).str.strip())
-            print(f"  ✓ Query 1 returned {len(phones_query1)} unique phones from hybrid_users")
-            
-            # Fetch phones from query 2 (guardians)
-            print(f"  [ACTION] Executing query 2 (guardians phones)...")
-            df_query2 = pd.read_sql(MAPPED_USERS_QUERY_2, conn)
-            phones_query2 = set(df_query2['phone'].dropna().astype(str).str.strip())
-            print(f"  ✓ Query 2 returned {len(phones_query2)} unique phones from guardians")
-            
-            # Find mapped phones (phones that appear in both queries)
-            mapped_phones = phones_query1.intersection(phones_query2)
-            print(f"  ✓ Found {len(mapped_phones)} mapped phones (appear in both queries)")
-            
-            conn.close()
             print(f"  ✓ Connection closed")
             
             return mapped_phones
@@ -586,6 +692,99 @@ def convert_hex_to_int(df: pd.DataFrame, hex_column: str = 'idvisitor_hex', outp
     return df
 
 
+def tighten_id_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Store integer id columns as int32 when their values fit, halving their memory
+
+    Only columns that are already integer-typed and hold no nulls are touched, so ids
+    keep their values and CSV formatting. idvisitor_converted is left alone: it can
+    exceed the int64 range and is merged against other frames by value.
+    """
+    int32_info = np.iinfo(np.int32)
+    for col in ('idvisit', 'custom_dimension_2', 'idaction_name', 'idlink_va'):
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]) and len(df) > 0:
+            if df[col].min() >= int32_info.min and df[col].max() <= int32_info.max:
+                df[col] = df[col].astype(np.int32)
+    return df
+
+
+def tighten_label_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Store the game_name/event label columns as Arrow-backed strings when pyarrow is installed
+
+    Object columns hold a Python str per cell; the Arrow layout keeps the text in one buffer,
+    so the groupby/== passes over these columns run in C. The NaN-valued string dtype keeps
+    missing labels as NaN, so isna()/notna() masks and comparisons behave as before.
+    """
+    if not PYARROW_AVAILABLE:
+        return df
+    try:
+        label_dtype = pd.StringDtype('pyarrow', na_value=np.nan)
+    except TypeError:
+        label_dtype = 'string[pyarrow_numpy]'  # pandas < 2.3
+    for col in ('game_name', 'event'):
+        if col in df.columns and pd.api.types.is_object_dtype(df[col]):
+            df[col] = df[col].astype(label_dtype)
+    return df
+
+
+def empty_frame(dtypes: dict) -> pd.DataFrame:
+    """Zero-row DataFrame with the given column order and dtypes
+
+    pd.DataFrame(columns=[...]) makes every column object, so empty results would not
+    match the dtypes of the populated output (e.g. an int64 count column).
+    """
+    return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in dtypes.items()})
+
+
+# Output schemas for the empty-result paths (text columns stay object, as in the populated output)
+TIME_SERIES_OUTPUT_DTYPES = {
+    'period_label': object, 'game_name': object, 'metric': object, 'event': object,
+    'count': 'int64', 'period_type': object, 'game_code': object, 'language': object
+}
+POLL_OUTPUT_DTYPES = {
+    'game_name': object, 'question': object, 'option': object, 'count': 'int64',
+    'language': object, 'domain': object
+}
+QUESTION_CORRECTNESS_OUTPUT_DTYPES = {
+    'game_name': object, 'question_number': 'int64', 'correctness': object,
+    'percent': 'float64', 'user_count': 'int64', 'total_users': 'int64'
+}
+
+
+def parse_timestamps(values: pd.Series, errors: str = 'raise') -> pd.Series:
+    """Convert a server_time/created_at column to datetime64
+
+    Redshift results and our own CSV exports both carry ISO-8601 timestamps, so
+    format='ISO8601' keeps pandas on its fast parser instead of inferring the format and
+    falling back to per-element parsing. Columns that are already datetime64 are returned as is.
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    return pd.to_datetime(values, format='ISO8601', errors=errors)
+
+
+def time_period_labels(timestamps: pd.Series, periods: Tuple[str, ...] = ('Day', 'Month', 'Week')) -> dict:
+    """Return {'Day' | 'Month' | 'Week': label Series} for a datetime64 column (only the requested periods).
+
+    - Day: YYYY-MM-DD
+    - Month: YYYY_MM (underscore, not hyphen)
+    - Week: starts from Wednesday, YYYY_WW - shift date by -2 days (so Wednesday becomes Monday)
+      and use strftime('%W'), which numbers weeks with Monday as first day (matches MySQL's WEEK())
+
+    Every label depends only on the calendar day, so strftime runs once per distinct day
+    and the labels are broadcast back by factorize code (missing timestamps get NaN).
+    """
+    codes, days = pd.factorize(timestamps.dt.normalize(), use_na_sentinel=False)
+    days = pd.DatetimeIndex(days)
+    # (days shifted, strftime format) per period type
+    label_formats = {'Day': (0, '%Y-%m-%d'), 'Month': (0, '%Y_%m'), 'Week': (2, '%Y_%W')}
+    labels = {}
+    for period_type in periods:
+        shift_days, label_format = label_formats[period_type]
+        day_labels = (days - pd.Timedelta(days=shift_days)).strftime(label_format)
+        labels[period_type] = pd.Series(day_labels.take(codes), index=timestamps.index, name='period_label')
+    return labels
+
+
 def fetch_dataframe() -> pd.DataFrame:
     """Load main dataframe from tpd_conversion_funnel.csv file and process it"""
     print("\n" + "=" * 60)
@@ -637,7 +836,7 @@ def fetch_dataframe() -> pd.DataFrame:
             if 'server_time' in df.columns:
                 print(f"  Converting server_time to datetime...")
                 sys.stdout.flush()
-                df['server_time'] = pd.to_datetime(df['server_time'], errors='coerce')
+                df['server_time'] = parse_timestamps(df['server_time'], errors='coerce')
                 print(f"  Sorting by server_time and removing duplicates...")
                 sys.stdout.flush()
                 df = df.sort_values('server_time').drop_duplicates(subset=['idlink_va'], keep='first')
@@ -692,20 +891,13 @@ def fetch_dataframe() -> pd.DataFrame:
                     return 'completed'
                 return None
             
-            # Process in batches for progress tracking
-            batch_size = 50000
-            total_batches = (len(df) // batch_size) + 1
-            events = []
-            
-            for i in range(0, len(df), batch_size):
-                batch_num = (i // batch_size) + 1
-                batch = df['name'].iloc[i:i+batch_size]
-                batch_events = batch.apply(categorize_event)
-                events.extend(batch_events)
-                print(f"  [Batch {batch_num}/{total_batches}] Processed {min(i+batch_size, len(df)):,} / {len(df):,} records")
-                sys.stdout.flush()
-            
-            df['event'] = events
+            # There are only a few hundred distinct action names, so classify each distinct
+            # name once and broadcast the result back by factorize code (-1 = missing name)
+            name_codes, unique_names = pd.factorize(df['name'])
+            unique_events = np.array([categorize_event(name) for name in unique_names] + [None], dtype=object)
+            df['event'] = unique_events[name_codes]
+            print(f"  ✓ Categorized {len(unique_names):,} distinct action names across {len(df):,} records")
+            sys.stdout.flush()
             
             # Check event column values
             if len(df) > 0:
@@ -746,6 +938,9 @@ def fetch_dataframe() -> pd.DataFrame:
             print(f"  WARNING: Neither idvisitor_converted nor idvisitor column found")
             sys.stdout.flush()
         
+        df = tighten_id_dtypes(df)
+        df = tighten_label_dtypes(df)
+        
         print(f"\n[STEP 5] Final data summary:")
         print(f"  ✓ Final data shape: {df.shape[0]:,} rows × {df.shape[1]} columns")
         print(f"  ✓ Columns: {list(df.columns)}")
@@ -755,15 +950,73 @@ def fetch_dataframe() -> pd.DataFrame:
             
     except Exception as e:
         print(f"ERROR: Failed to load data from CSV file: {str(e)}")
-        import traceback
         traceback.print_exc()
         return pd.DataFrame()
 
 
-def fetch_score_dataframe() -> pd.DataFrame:
+def read_sql_connectorx(query: str) -> Optional[pd.DataFrame]:
+    """Run a query on Redshift through connectorx (if installed)
+
+    connectorx decodes the wire protocol in Rust straight into typed columns, so the
+    result never exists as per-cell Python objects the way pd.read_sql's fetchall does.
+    Returns None if connectorx is unavailable or the read fails, so callers can fall
+    back to their psycopg2 path.
+    """
+    if not CONNECTORX_AVAILABLE:
+        return None
+    from urllib.parse import quote_plus
+    uri = (
+        f"redshift://{quote_plus(REDSHIFT_USER)}:{quote_plus(REDSHIFT_PASSWORD)}"
+        f"@{REDSHIFT_HOST}:{REDSHIFT_PORT}/{REDSHIFT_DATABASE}"
+    )
+    try:
+        print(f"  [ACTION] Executing query on REDSHIFT via connectorx...")
+        df = cx.read_sql(uri, query, return_type="pandas")
+        print(f"  ✓ Query executed successfully via connectorx")
+        return df
+    except Exception as e:
+        print(f"  [WARNING] connectorx read failed ({type(e).__name__}: {e}) - falling back to psycopg2")
+        return None
+
+
+def read_sql_chunked(conn, query: str, chunksize: int = 50000) -> pd.DataFrame:
+    """Run a query through a psycopg2 server-side (named) cursor, fetching rows in chunks
+
+    pd.read_sql on a plain cursor has libpq buffer the whole result set client-side and then
+    copies it into Python tuples. A named cursor streams the rows with fetchmany instead, so
+    only the tuples are held. The DataFrame is built once from all rows, the same way
+    pd.read_sql does, so dtypes don't depend on how NULLs fall across chunks.
+    """
+    rows = []
+    columns = []
+    fetches = 0
+    with conn.cursor(name='chunked_read') as cur:
+        cur.itersize = chunksize
+        cur.execute(query)
+        while True:
+            chunk = cur.fetchmany(chunksize)
+            if not columns and cur.description:
+                columns = [desc[0] for desc in cur.description]
+            if not chunk:
+                break
+            rows.extend(chunk)
+            fetches += 1
+            if fetches % 20 == 0:
+                print(f"    Fetched {len(rows):,} rows so far...", flush=True)
+    # coerce_float matches pd.read_sql (Decimal -> float). Building the frame through pyarrow
+    # (transpose + pa.array per column) is no faster for these tuples and is much slower on
+    # Decimal columns, so from_records stays the row-tuple decoder here; connectorx is the
+    # typed-column path.
+    return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+
+def fetch_score_dataframe(query: str = SCORE_DISTRIBUTION_QUERY) -> pd.DataFrame:
     """Fetch data for score distribution analysis using hybrid_games and hybrid_games_links tables
     
     Includes retry logic and extended timeouts for large queries.
+    
+    Args:
+        query: Query to run (defaults to SCORE_DISTRIBUTION_QUERY)
     """
     if not PSYCOPG2_AVAILABLE:
         print("ERROR: psycopg2 not available. Cannot fetch score data from Redshift.")
@@ -780,39 +1033,38 @@ def fetch_score_dataframe() -> pd.DataFrame:
     print(f"  User: {REDSHIFT_USER}")
     print(f"  Connection Library: psycopg2 (PostgreSQL/Redshift driver)")
     
+    # Fast path: connectorx (falls through to psycopg2 + pd.read_sql if unavailable or failing)
+    df = read_sql_connectorx(query)
+    if df is not None:
+        if 'idvisitor_hex' in df.columns:
+            print(f"  [ACTION] Converting hex to integer in Python...")
+            df = convert_hex_to_int(df, 'idvisitor_hex', 'idvisitor_converted')
+            print(f"  ✓ Converted idvisitor_hex to idvisitor_converted")
+        df = tighten_id_dtypes(df)
+        df = tighten_label_dtypes(df)
+        print(f"SUCCESS: Fetched {len(df)} records from REDSHIFT")
+        return df
+    
     # Retry configuration
-    import time
     max_retries = 3
     retry_delay = 5  # seconds
     
     for attempt in range(1, max_retries + 1):
         try:
             print(f"\n  [ACTION] Connecting to REDSHIFT (Attempt {attempt}/{max_retries})...")
-            conn = psycopg2.connect(
-                host=REDSHIFT_HOST,
-                database=REDSHIFT_DATABASE,
-                port=REDSHIFT_PORT,
-                user=REDSHIFT_USER,
-                password=REDSHIFT_PASSWORD,
-                connect_timeout=60,  # Increased from 30 to 60 seconds
-                keepalives=1,  # Enable TCP keepalive
-                keepalives_idle=30,  # Start keepalive after 30 seconds of idle
-                keepalives_interval=10,  # Send keepalive every 10 seconds
-                keepalives_count=5  # Number of keepalive packets before considering connection dead
-            )
-            print(f"  ✓ Successfully connected to REDSHIFT")
+            with redshift_connection() as conn:
+                print(f"  ✓ Successfully connected to REDSHIFT")
             
-            # Set statement timeout (in milliseconds) - 30 minutes for large queries
-            print(f"  [ACTION] Setting statement timeout to 30 minutes...")
-            with conn.cursor() as cur:
-                cur.execute("SET statement_timeout = '1800000'")  # 30 minutes in milliseconds
-            conn.commit()
-            print(f"  ✓ Statement timeout set")
+                # Set statement timeout (in milliseconds) - 30 minutes for large queries
+                print(f"  [ACTION] Setting statement timeout to 30 minutes...")
+                with conn.cursor() as cur:
+                    cur.execute("SET statement_timeout = '1800000'")  # 30 minutes in milliseconds
+                conn.commit()
+                print(f"  ✓ Statement timeout set")
             
-            print(f"  [ACTION] Executing query on REDSHIFT...")
-            print(f"  [INFO] This may take several minutes for large datasets...")
-            df = pd.read_sql(SCORE_DISTRIBUTION_QUERY, conn)
-            conn.close()
+                print(f"  [ACTION] Executing query on REDSHIFT...")
+                print(f"  [INFO] This may take several minutes for large datasets...")
+                df = read_sql_chunked(conn, query)
             print(f"  ✓ Query executed successfully on REDSHIFT")
             print(f"  ✓ Connection closed")
             
@@ -822,6 +1074,8 @@ def fetch_score_dataframe() -> pd.DataFrame:
                 df = convert_hex_to_int(df, 'idvisitor_hex', 'idvisitor_converted')
                 print(f"  ✓ Converted idvisitor_hex to idvisitor_converted")
             
+            df = tighten_id_dtypes(df)
+            df = tighten_label_dtypes(df)
             print(f"SUCCESS: Fetched {len(df)} records from REDSHIFT")
             return df
             
@@ -852,7 +1106,6 @@ def fetch_score_dataframe() -> pd.DataFrame:
                 print(f"    - Network connectivity to Redshift cluster")
                 print(f"    - Redshift cluster is running and accessible")
                 print(f"    - Query may be too large - consider adding date filters")
-                import traceback
                 traceback.print_exc()
                 return pd.DataFrame()
                 
@@ -866,7 +1119,6 @@ def fetch_score_dataframe() -> pd.DataFrame:
                 retry_delay *= 2
                 continue
             else:
-                import traceback
                 traceback.print_exc()
                 return pd.DataFrame()
     
@@ -874,6 +1126,97 @@ def fetch_score_dataframe() -> pd.DataFrame:
     return pd.DataFrame()
 
 
+def load_json(text):
+    """Decode a custom_dimension_1 JSON string, using orjson when it is installed.
+
+    orjson is stricter than the json module (e.g. it rejects NaN literals and
+    very large integers), so anything it refuses is retried with json.loads.
+    Errors therefore surface exactly as they did with json.loads.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(text)
+
+
+# custom_dimension_1 strings that carry no payload; all of them parse to nothing (or not at all)
+EMPTY_PAYLOADS = frozenset({'', 'null', 'NULL', 'None', 'none'})
+
+
+def is_empty_payload(value) -> bool:
+    """True for a missing custom_dimension_1: None, NaN or one of the EMPTY_PAYLOADS strings"""
+    return value is None or value != value or (isinstance(value, str) and value in EMPTY_PAYLOADS)
+
+
+def safe_parse(default):
+    """Decorator for custom_dimension_1 parsers sharing the same envelope.
+
+    The wrapper returns default() for empty payloads (see is_empty_payload), decodes the
+    JSON once with load_json, and passes the decoded data to the wrapped function.
+    Malformed payloads (decode errors and unexpected shapes) also yield default().
+    Callers still pass the raw custom_dimension_1 value.
+    """
+    def decorator(parse_func):
+        @functools.wraps(parse_func)
+        def wrapper(custom_dim_1, *args, **kwargs):
+            try:
+                if is_empty_payload(custom_dim_1):
+                    return default()
+                return parse_func(load_json(custom_dim_1), *args, **kwargs)
+            except (json.JSONDecodeError, TypeError, AttributeError, KeyError, IndexError, ValueError):
+                return default()
+        return wrapper
+    return decorator
+
+
+def _append_round_results(round_details, game_name, results):
+    """Append one result per roundDetails entry to results.
+
+    A round is correct when its first selection picks the card whose status is true.
+    Rounds without a roundNumber, cards or selections are skipped.
+    """
+    for round_detail in round_details:
+        if 'roundNumber' not in round_detail:
+            continue
+        cards = round_detail.get('cards')
+        selections = round_detail.get('selections')
+        if not cards or not selections:
+            continue
+        correct_card_index = next((idx for idx, card in enumerate(cards) if card.get('status') is True), None)
+        selected_card_index = selections[0].get('card')
+        is_correct = (selected_card_index is not None and
+                      correct_card_index is not None and
+                      selected_card_index == correct_card_index)
+        results.append({
+            'question_number': round_detail['roundNumber'],
+            'is_correct': 1 if is_correct else 0,
+            'game_name': game_name
+        })
+
+
+def _count_correct_levels(json_data) -> int:
+    """Count jsonData levels whose first userResponse has isCorrect true (boolean True or "true")"""
+    total_score = 0
+    for level_data in json_data:
+        if not isinstance(level_data, dict):
+            continue
+        user_responses = level_data.get('userResponse')
+        if not isinstance(user_responses, list) or not user_responses:
+            continue
+        response = user_responses[0]
+        if isinstance(response, dict):
+            is_correct = response.get('isCorrect')
+            if is_correct is True or (isinstance(is_correct, str) and is_correct.lower() == 'true'):
+                total_score += 1
+    return total_score
+
+
+# Keys that parse_correct_selections_questions reads question results from
+ROUND_PAYLOAD_KEYS = ('roundDetails', 'rounds', 'questions')
+
+
 def parse_correct_selections_questions(custom_dim_1, game_name):
     """Parse correctSelections structure to extract question correctness (for "This or That" games)
     
@@ -883,42 +1226,19 @@ def parse_correct_selections_questions(custom_dim_1, game_name):
     """
     results = []
     try:
-        if pd.isna(custom_dim_1) or custom_dim_1 is None or custom_dim_1 == '' or custom_dim_1 == 'null':
+        if is_empty_payload(custom_dim_1):
             return results
         
-        data = json.loads(custom_dim_1)
+        # Every result below comes from a roundDetails, rounds or questions array, so payloads that
+        # mention none of them (e.g. flow-style jsonData records) are rejected without being decoded
+        if isinstance(custom_dim_1, str) and not any(key in custom_dim_1 for key in ROUND_PAYLOAD_KEYS):
+            return results
+        
+        data = load_json(custom_dim_1)
         
         # Method 1: Check for roundDetails structure (for games like Quantitative Comparison)
         if 'roundDetails' in data and isinstance(data['roundDetails'], list):
-            for round_detail in data['roundDetails']:
-                if 'roundNumber' in round_detail:
-                    question_num = round_detail['roundNumber']
-                    cards = round_detail.get('cards', [])
-                    selections = round_detail.get('selections', [])
-                    
-                    if cards and selections:
-                        # Find the correct card (status = true)
-                        correct_card_index = None
-                        for idx, card in enumerate(cards):
-                            if card.get('status') is True:
-                                correct_card_index = idx
-                                break
-                        
-                        # Get selected card
-                        selected_card_index = None
-                        if selections and len(selections) > 0:
-                            selected_card_index = selections[0].get('card')
-                        
-                        # Determine correctness
-                        is_correct = (selected_card_index is not None and 
-                                    correct_card_index is not None and 
-                                    selected_card_index == correct_card_index)
-                        
-                        results.append({
-                            'question_number': question_num,
-                            'is_correct': 1 if is_correct else 0,
-                            'game_name': game_name
-                        })
+            _append_round_results(data['roundDetails'], game_name, results)
         
         # Method 2: Check nested gameData structure for roundDetails
         # Path: gameData[*] (where section="Action") -> gameData[*].gameData[*].roundDetails
@@ -930,35 +1250,7 @@ def parse_correct_selections_questions(custom_dim_1, game_name):
                     for inner_game_data in game_data['gameData']:
                         # Check for roundDetails in the nested structure (this is the key!)
                         if 'roundDetails' in inner_game_data and isinstance(inner_game_data['roundDetails'], list):
-                            for round_detail in inner_game_data['roundDetails']:
-                                if 'roundNumber' in round_detail:
-                                    question_num = round_detail['roundNumber']
-                                    cards = round_detail.get('cards', [])
-                                    selections = round_detail.get('selections', [])
-                                    
-                                    if cards and selections:
-                                        # Find the correct card (status = true)
-                                        correct_card_index = None
-                                        for idx, card in enumerate(cards):
-                                            if card.get('status') is True:
-                                                correct_card_index = idx
-                                                break
-                                        
-                                        # Get selected card
-                                        selected_card_index = None
-                                        if selections and len(selections) > 0:
-                                            selected_card_index = selections[0].get('card')
-                                        
-                                        # Determine correctness
-                                        is_correct = (selected_card_index is not None and 
-                                                    correct_card_index is not None and 
-                                                    selected_card_index == correct_card_index)
-                                        
-                                        results.append({
-                                            'question_number': question_num,
-                                            'is_correct': 1 if is_correct else 0,
-                                            'game_name': game_name
-                                        })
+                            _append_round_results(inner_game_data['roundDetails'], game_name, results)
                         
                         # Also check for rounds array (alternative structure)
                         elif 'rounds' in inner_game_data and isinstance(inner_game_data['rounds'], list):
@@ -1069,14 +1361,14 @@ def extract_action_section_from_string(json_str):
                         end_pos = i + 1
                         json_data_str = json_str[start_pos:end_pos]
                         try:
-                            json_data = json.loads(json_data_str)
+                            json_data = load_json(json_data_str)
                             return json_data
                         except json.JSONDecodeError:
                             # Try cleaning the extracted string
                             try:
                                 # Remove any trailing commas before closing bracket
                                 json_data_str_clean = re.sub(r',\s*\]', ']', json_data_str)
-                                json_data = json.loads(json_data_str_clean)
+                                json_data = load_json(json_data_str_clean)
                                 return json_data
                             except:
                                 break
@@ -1092,7 +1384,7 @@ def extract_action_section_from_string(json_str):
                 json_data_str = simple_match.group(1)
                 # Try to clean common JSON errors
                 json_data_str = re.sub(r',\s*\]', ']', json_data_str)  # Remove trailing commas
-                json_data = json.loads(json_data_str)
+                json_data = load_json(json_data_str)
                 return json_data
             except:
                 pass
@@ -1132,7 +1424,7 @@ def extract_action_section_from_string(json_str):
                         json_data_str = json_str[start_pos:end_pos]
                         try:
                             json_data_str = re.sub(r',\s*\]', ']', json_data_str)
-                            json_data = json.loads(json_data_str)
+                            json_data = load_json(json_data_str)
                             return json_data
                         except:
                             break
@@ -1158,7 +1450,7 @@ def parse_flow_stop_go_questions(custom_dim_1, game_name):
     """
     results = []
     try:
-        if pd.isna(custom_dim_1) or custom_dim_1 is None or custom_dim_1 == '' or custom_dim_1 == 'null':
+        if is_empty_payload(custom_dim_1):
             return results
         
         data = None
@@ -1176,7 +1468,7 @@ def parse_flow_stop_go_questions(custom_dim_1, game_name):
                     json_str = json_str[1:-1]
                 # Clean malformed JSON
                 json_str = clean_malformed_json(json_str)
-                data = json.loads(json_str)
+                data = load_json(json_str)
         except (json.JSONDecodeError, ValueError, TypeError):
             # If full JSON parsing fails, try to extract just the Action section
             json_str = str(custom_dim_1).strip()
@@ -1237,44 +1529,39 @@ def parse_flow_stop_go_questions(custom_dim_1, game_name):
         return results
 
 
-def parse_action_level_questions(custom_dim_1, game_name, level_number):
+@safe_parse(list)
+def parse_action_level_questions(data, game_name, level_number):
     """Parse action_level structure to extract question correctness (for "Action Level" games)"""
     results = []
-    try:
-        if pd.isna(custom_dim_1) or custom_dim_1 is None or custom_dim_1 == '' or custom_dim_1 == 'null':
-            return results
-        
-        data = json.loads(custom_dim_1)
+    
+    # Check for options and chosenOption structure
+    if 'options' in data and 'chosenOption' in data:
+        chosen_option = data.get('chosenOption')
         
-        # Check for options and chosenOption structure
-        if 'options' in data and 'chosenOption' in data:
-            chosen_option = data.get('chosenOption')
-            
-            if chosen_option is None:
-                is_correct = 0
-            else:
-                options = data.get('options', [])
-                if isinstance(options, list) and 0 <= chosen_option < len(options):
-                    chosen_option_data = options[chosen_option]
-                    if isinstance(chosen_option_data, dict):
-                        is_correct = 1 if chosen_option_data.get('isCorrect', False) else 0
-                    else:
-                        is_correct = 0
+        if chosen_option is None:
+            is_correct = 0
+        else:
+            options = data.get('options', [])
+            if isinstance(options, list) and 0 <= chosen_option < len(options):
+                chosen_option_data = options[chosen_option]
+                if isinstance(chosen_option_data, dict):
+                    is_correct = 1 if chosen_option_data.get('isCorrect', False) else 0
                 else:
                     is_correct = 0
-            
-            results.append({
-                'question_number': level_number,
-                'is_correct': is_correct,
-                'game_name': game_name
-            })
+            else:
+                is_correct = 0
         
-        return results
-    except (json.JSONDecodeError, TypeError, AttributeError, KeyError, IndexError, ValueError) as e:
-        return results
+        results.append({
+            'question_number': level_number,
+            'is_correct': is_correct,
+            'game_name': game_name
+        })
+    
+    return results
 
 
-def parse_mcq_completed_questions(custom_dim_1, game_name):
+@safe_parse(list)
+def parse_mcq_completed_questions(data, game_name):
     """Parse mcq_completed structure to extract per-question correctness from Action section
     
     Structure:
@@ -1302,73 +1589,66 @@ def parse_mcq_completed_questions(custom_dim_1, game_name):
     Returns list of question results with question_number and is_correct.
     """
     results = []
-    try:
-        if pd.isna(custom_dim_1) or custom_dim_1 is None or custom_dim_1 == '' or custom_dim_1 == 'null':
-            return results
-        
-        # Parse JSON
-        data = json.loads(custom_dim_1)
-        
-        # Look for Action section - can be at top level or inside gameData array
-        action_section = None
-        
-        # Case 1: Action section at top level
-        if isinstance(data, dict) and 'section' in data and data['section'] == 'Action':
-            action_section = data
-        # Case 2: Action section inside gameData array (similar to other game types)
-        elif isinstance(data, dict) and 'gameData' in data and isinstance(data['gameData'], list):
-            for item in data['gameData']:
-                if isinstance(item, dict) and item.get('section') == 'Action':
-                    action_section = item
-                    break
-        
-        # Extract per-question correctness from Action section
-        if action_section and 'gameData' in action_section and isinstance(action_section['gameData'], list):
-            for question_idx, question in enumerate(action_section['gameData'], 1):
-                if not isinstance(question, dict):
-                    continue
-                
-                # Get options and chosenOption
-                options = question.get('options', [])
-                chosen_option = question.get('chosenOption')
-                
-                # Skip if no options or chosenOption is None
-                if not isinstance(options, list) or len(options) == 0:
-                    continue
-                
-                # Handle chosenOption - convert to int if needed, skip if None
-                if chosen_option is None:
+    
+    # Look for Action section - can be at top level or inside gameData array
+    action_section = None
+    
+    # Case 1: Action section at top level
+    if isinstance(data, dict) and 'section' in data and data['section'] == 'Action':
+        action_section = data
+    # Case 2: Action section inside gameData array (similar to other game types)
+    elif isinstance(data, dict) and 'gameData' in data and isinstance(data['gameData'], list):
+        for item in data['gameData']:
+            if isinstance(item, dict) and item.get('section') == 'Action':
+                action_section = item
+                break
+    
+    # Extract per-question correctness from Action section
+    if action_section and 'gameData' in action_section and isinstance(action_section['gameData'], list):
+        for question_idx, question in enumerate(action_section['gameData'], 1):
+            if not isinstance(question, dict):
+                continue
+            
+            # Get options and chosenOption
+            options = question.get('options', [])
+            chosen_option = question.get('chosenOption')
+            
+            # Skip if no options or chosenOption is None
+            if not isinstance(options, list) or len(options) == 0:
+                continue
+            
+            # Handle chosenOption - convert to int if needed, skip if None
+            if chosen_option is None:
+                is_correct = 0
+            else:
+                try:
+                    chosen_option = int(chosen_option)
+                except (ValueError, TypeError):
                     is_correct = 0
                 else:
-                    try:
-                        chosen_option = int(chosen_option)
-                    except (ValueError, TypeError):
-                        is_correct = 0
-                    else:
-                        # Check if chosenOption is within bounds
-                        if 0 <= chosen_option < len(options):
-                            chosen_option_data = options[chosen_option]
-                            if isinstance(chosen_option_data, dict):
-                                # Check isCorrect - handle both boolean True and string "true"
-                                is_correct_val = chosen_option_data.get('isCorrect', False)
-                                is_correct = 1 if (is_correct_val is True or (isinstance(is_correct_val, str) and is_correct_val.lower() == 'true')) else 0
-                            else:
-                                is_correct = 0
+                    # Check if chosenOption is within bounds
+                    if 0 <= chosen_option < len(options):
+                        chosen_option_data = options[chosen_option]
+                        if isinstance(chosen_option_data, dict):
+                            # Check isCorrect - handle both boolean True and string "true"
+                            is_correct_val = chosen_option_data.get('isCorrect', False)
+                            is_correct = 1 if (is_correct_val is True or (isinstance(is_correct_val, str) and is_correct_val.lower() == 'true')) else 0
                         else:
                             is_correct = 0
-                
-                results.append({
-                    'question_number': question_idx,
-                    'is_correct': is_correct,
-                    'game_name': game_name
-                })
-        
-        return results
-    except (json.JSONDecodeError, TypeError, AttributeError, KeyError, IndexError, ValueError):
-        return results
+                    else:
+                        is_correct = 0
+            
+            results.append({
+                'question_number': question_idx,
+                'is_correct': is_correct,
+                'game_name': game_name
+            })
+    
+    return results
 
 
-def parse_mcq_completed_questions_with_correct_option(custom_dim_1, game_name):
+@safe_parse(list)
+def parse_mcq_completed_questions_with_correct_option(data, game_name):
     """Parse mcq_completed structure to extract per-question correctness using correctOption
     
     This is for games like Positions that use chosenOption and correctOption instead of isCorrect.
@@ -1395,94 +1675,89 @@ def parse_mcq_completed_questions_with_correct_option(custom_dim_1, game_name):
     Returns list of question results with question_number and is_correct.
     """
     results = []
-    try:
-        if pd.isna(custom_dim_1) or custom_dim_1 is None or custom_dim_1 == '' or custom_dim_1 == 'null':
-            return results
-        
-        # Parse JSON
-        data = json.loads(custom_dim_1)
-        
-        # Look for Action section - can be at top level or inside gameData array
-        action_section = None
-        
-        # Case 1: Action section at top level
-        if isinstance(data, dict) and 'section' in data and data['section'] == 'Action':
-            action_section = data
-        # Case 2: Action section inside gameData array (similar to other game types)
-        elif isinstance(data, dict) and 'gameData' in data and isinstance(data['gameData'], list):
-            for item in data['gameData']:
-                if isinstance(item, dict) and item.get('section') == 'Action':
-                    action_section = item
-                    break
-        
-        # Extract per-question correctness from Action section
-        if action_section and 'gameData' in action_section and isinstance(action_section['gameData'], list):
-            for question_idx, question in enumerate(action_section['gameData'], 1):
-                if not isinstance(question, dict):
-                    continue
-                
-                # Get chosenOption and correctOption
-                chosen_option = question.get('chosenOption')
-                correct_option = question.get('correctOption')
-                
-                # If either is None, score = 0
-                if chosen_option is None or correct_option is None:
+    
+    # Look for Action section - can be at top level or inside gameData array
+    action_section = None
+    
+    # Case 1: Action section at top level
+    if isinstance(data, dict) and 'section' in data and data['section'] == 'Action':
+        action_section = data
+    # Case 2: Action section inside gameData array (similar to other game types)
+    elif isinstance(data, dict) and 'gameData' in data and isinstance(data['gameData'], list):
+        for item in data['gameData']:
+            if isinstance(item, dict) and item.get('section') == 'Action':
+                action_section = item
+                break
+    
+    # Extract per-question correctness from Action section
+    if action_section and 'gameData' in action_section and isinstance(action_section['gameData'], list):
+        for question_idx, question in enumerate(action_section['gameData'], 1):
+            if not isinstance(question, dict):
+                continue
+            
+            # Get chosenOption and correctOption
+            chosen_option = question.get('chosenOption')
+            correct_option = question.get('correctOption')
+            
+            # If either is None, score = 0
+            if chosen_option is None or correct_option is None:
+                is_correct = 0
+            else:
+                try:
+                    chosen_option = int(chosen_option)
+                    correct_option = int(correct_option)
+                except (ValueError, TypeError):
                     is_correct = 0
                 else:
-                    try:
-                        chosen_option = int(chosen_option)
-                        correct_option = int(correct_option)
-                    except (ValueError, TypeError):
-                        is_correct = 0
-                    else:
-                        # Compare chosenOption with correctOption
-                        is_correct = 1 if chosen_option == correct_option else 0
-                
-                results.append({
-                    'question_number': question_idx,
-                    'is_correct': is_correct,
-                    'game_name': game_name
-                })
-        
-        return results
-    except (json.JSONDecodeError, TypeError, AttributeError, KeyError, IndexError, ValueError):
-        return results
+                    # Compare chosenOption with correctOption
+                    is_correct = 1 if chosen_option == correct_option else 0
+            
+            results.append({
+                'question_number': question_idx,
+                'is_correct': is_correct,
+                'game_name': game_name
+            })
+    
+    return results
+
+
+# Game name -> processing type (read-only; shared by every get_game_type call)
+GAME_TYPE_MAPPING = MappingProxyType({
+    # correctSelections games
+    'Relational Comparison': 'correctSelections',
+    'Quantitative Comparison': 'correctSelections',
+    'Relational Comparison II': 'correctSelections',
+    'Number Comparison': 'correctSelections',
+    'Primary Emotion Labelling': 'correctSelections',
+    'Emotion Identification': 'correctSelections',
+    'Identification of all emotions': 'correctSelections',
+    'Beginning Sound Pa Cha Sa': 'correctSelections',
+    
+    # flow games
+    'Revision Primary Colors': 'flow',
+    'Revision Primary Shapes': 'flow',
+    'Rhyming Words': 'flow',
+    
+    # action level games
+    'Shape Circle': 'action_level',
+    'Shape Triangle': 'action_level',
+    'Shape Square': 'action_level',
+    'Shape Rectangle': 'action_level',
+    'Color Red': 'action_level',
+    'Color Yellow': 'action_level',
+    'Color Blue': 'action_level',
+    'Numbers I': 'action_level',
+    'Numbers II': 'action_level',
+    'Numerals 1-10': 'action_level',
+    'Beginning Sound Ma Ka La': 'action_level',
+    'Beginning Sound Ba Ra Na': 'action_level',
+    # Note: Beginning Sounds Ma/Cha/Ba is processed through game_completed (jsonData method)
+})
 
 
 def get_game_type(game_name):
     """Map game name to its processing type"""
-    game_type_mapping = {
-        # correctSelections games
-        'Relational Comparison': 'correctSelections',
-        'Quantitative Comparison': 'correctSelections',
-        'Relational Comparison II': 'correctSelections',
-        'Number Comparison': 'correctSelections',
-        'Primary Emotion Labelling': 'correctSelections',
-        'Emotion Identification': 'correctSelections',
-        'Identification of all emotions': 'correctSelections',
-        'Beginning Sound Pa Cha Sa': 'correctSelections',
-        
-        # flow games
-        'Revision Primary Colors': 'flow',
-        'Revision Primary Shapes': 'flow',
-        'Rhyming Words': 'flow',
-        
-        # action level games
-        'Shape Circle': 'action_level',
-        'Shape Triangle': 'action_level',
-        'Shape Square': 'action_level',
-        'Shape Rectangle': 'action_level',
-        'Color Red': 'action_level',
-        'Color Yellow': 'action_level',
-        'Color Blue': 'action_level',
-        'Numbers I': 'action_level',
-        'Numbers II': 'action_level',
-        'Numerals 1-10': 'action_level',
-        'Beginning Sound Ma Ka La': 'action_level',
-        'Beginning Sound Ba Ra Na': 'action_level',
-        # Note: Beginning Sounds Ma/Cha/Ba is processed through game_completed (jsonData method)
-    }
-    return game_type_mapping.get(game_name, None)
+    return GAME_TYPE_MAPPING.get(game_name, None)
 
 
 def fetch_question_correctness_data() -> pd.DataFrame:
@@ -1497,32 +1772,27 @@ def fetch_question_correctness_data() -> pd.DataFrame:
     print("  This function is no longer used.")
     print("  Use process_question_correctness() instead, which uses scores_data.csv")
     print("=" * 60)
-    return pd.DataFrame(columns=['game_name','question_number','correctness','percent','user_count','total_users'])
+    return empty_frame(QUESTION_CORRECTNESS_OUTPUT_DTYPES)
 
 
-def parse_custom_dimension_1_correct_selections(custom_dim_1):
+@safe_parse(int)
+def parse_custom_dimension_1_correct_selections(data):
     """Parse custom_dimension_1 JSON to extract correctSelections (for first query)"""
-    try:
-        if pd.isna(custom_dim_1) or custom_dim_1 is None or custom_dim_1 == '' or custom_dim_1 == 'null':
-            return 0
-        
-        # Parse JSON
-        data = json.loads(custom_dim_1)
-        
-        # Extract correctSelections from nested structure
-        # Path: gameData[*].gameData[*].statistics.correctSelections
-        if 'gameData' in data and len(data['gameData']) > 0:
-            for game_data in data['gameData']:
-                if 'gameData' in game_data and len(game_data['gameData']) > 0:
-                    for inner_game_data in game_data['gameData']:
-                        if 'statistics' in inner_game_data and 'correctSelections' in inner_game_data['statistics']:
-                            correct_selections = inner_game_data['statistics']['correctSelections']
-                            if correct_selections is not None:
-                                return int(correct_selections)
-        
-        return 0
-    except (json.JSONDecodeError, TypeError, AttributeError, KeyError, IndexError, ValueError):
-        return 0
+    
+    # Extract correctSelections from nested structure
+    # Path: gameData[*].gameData[*].statistics.correctSelections
+    if 'gameData' in data:
+        for game_data in data['gameData']:
+            if 'gameData' not in game_data:
+                continue
+            for inner_game_data in game_data['gameData']:
+                statistics = inner_game_data.get('statistics')
+                if statistics and 'correctSelections' in statistics:
+                    correct_selections = statistics['correctSelections']
+                    if correct_selections is not None:
+                        return int(correct_selections)
+    
+    return 0
 
 
 def clean_malformed_json(json_str):
@@ -1571,7 +1841,7 @@ def parse_custom_dimension_1_json_data(custom_dim_1):
     - Sum all level scores to get total_score
     """
     try:
-        if pd.isna(custom_dim_1) or custom_dim_1 is None or custom_dim_1 == '' or custom_dim_1 == 'null':
+        if is_empty_payload(custom_dim_1):
             return 0
         
         # Handle case where custom_dim_1 might already be a dict
@@ -1589,72 +1859,38 @@ def parse_custom_dimension_1_json_data(custom_dim_1):
             json_str = clean_malformed_json(json_str)
             
             try:
-                data = json.loads(json_str)
+                data = load_json(json_str)
             except json.JSONDecodeError:
                 # Try additional fixes
                 try:
                     # Try unescaping
                     json_str = json_str.encode().decode('unicode_escape')
-                    data = json.loads(json_str)
+                    data = load_json(json_str)
                 except:
                     # If full JSON parsing fails, try to extract just the Action section
                     json_data = extract_action_section_from_string(json_str)
                     if json_data:
                         # Successfully extracted Action section, process it directly
-                        total_score = 0
-                        for level_data in json_data:
-                            if isinstance(level_data, dict) and 'userResponse' in level_data:
-                                user_responses = level_data.get('userResponse', [])
-                                if isinstance(user_responses, list) and len(user_responses) > 0:
-                                    # Use first userResponse
-                                    response = user_responses[0]
-                                    if isinstance(response, dict) and 'isCorrect' in response:
-                                        is_correct = response['isCorrect']
-                                        # Handle both boolean True and string "true"
-                                        if is_correct is True or (isinstance(is_correct, str) and is_correct.lower() == 'true'):
-                                            total_score += 1
-                        return total_score
+                        return _count_correct_levels(json_data)
                     # If we can't extract Action section, return 0
                     return 0
         
-        total_score = 0
-        
         # Case 1: Check if Action section is at root level (for Beginning Sounds Ma/Cha/Ba)
         if isinstance(data, dict) and data.get('section') == 'Action' and 'jsonData' in data:
             json_data = data['jsonData']
             if isinstance(json_data, list):
-                for level_data in json_data:
-                            if isinstance(level_data, dict) and 'userResponse' in level_data:
-                                user_responses = level_data.get('userResponse', [])
-                                if isinstance(user_responses, list) and len(user_responses) > 0:
-                                    # Use first userResponse
-                                    response = user_responses[0]
-                                    if isinstance(response, dict) and 'isCorrect' in response:
-                                        is_correct = response['isCorrect']
-                                        # Handle both boolean True and string "true"
-                                        if is_correct is True or (isinstance(is_correct, str) and is_correct.lower() == 'true'):
-                                            total_score += 1
-            return total_score
+                return _count_correct_levels(json_data)
+            return 0
         
         # Case 2: Check nested structure (gameData[*] where section="Action")
-        if 'gameData' in data and len(data['gameData']) > 0:
+        total_score = 0
+        if 'gameData' in data:
             for game_data in data['gameData']:
                 # Look for section = "Action"
                 if game_data.get('section') == 'Action' and 'jsonData' in game_data:
                     json_data = game_data['jsonData']
-                    
                     if isinstance(json_data, list):
-                        for level_data in json_data:
-                            if isinstance(level_data, dict) and 'userResponse' in level_data:
-                                user_responses = level_data.get('userResponse', [])
-                                if isinstance(user_responses, list) and len(user_responses) > 0:
-                                    # Use first userResponse
-                                    response = user_responses[0]
-                                    if isinstance(response, dict) and 'isCorrect' in response:
-                                        is_correct = response['isCorrect']
-                                        # Handle both boolean True and string "true"
-                                        if is_correct is True or (isinstance(is_correct, str) and is_correct.lower() == 'true'):
-                                            total_score += 1
+                        total_score += _count_correct_levels(json_data)
             
             return total_score
         
@@ -1663,7 +1899,8 @@ def parse_custom_dimension_1_json_data(custom_dim_1):
         return 0
 
 
-def parse_custom_dimension_1_mcq_completed(custom_dim_1):
+@safe_parse(int)
+def parse_custom_dimension_1_mcq_completed(data):
     """Parse custom_dimension_1 JSON to extract total score from mcq_completed games
     
     Structure:
@@ -1691,66 +1928,59 @@ def parse_custom_dimension_1_mcq_completed(custom_dim_1):
     
     Note: Different questions can have different numbers of options.
     """
-    try:
-        if pd.isna(custom_dim_1) or custom_dim_1 is None or custom_dim_1 == '' or custom_dim_1 == 'null':
-            return 0
-        
-        # Parse JSON
-        data = json.loads(custom_dim_1)
-        
-        total_score = 0
-        
-        # Look for Action section - can be at top level or inside gameData array
-        action_section = None
-        
-        # Case 1: Action section at top level
-        if isinstance(data, dict) and 'section' in data and data['section'] == 'Action':
-            action_section = data
-        # Case 2: Action section inside gameData array (similar to other game types)
-        elif isinstance(data, dict) and 'gameData' in data and isinstance(data['gameData'], list):
-            for item in data['gameData']:
-                if isinstance(item, dict) and item.get('section') == 'Action':
-                    action_section = item
-                    break
-        
-        # Extract scores from Action section
-        if action_section and 'gameData' in action_section and isinstance(action_section['gameData'], list):
-            for question in action_section['gameData']:
-                if not isinstance(question, dict):
-                    continue
-                
-                # Get options and chosenOption
-                options = question.get('options', [])
-                chosen_option = question.get('chosenOption')
-                
-                # Skip if no options or chosenOption is None
-                if not isinstance(options, list) or len(options) == 0:
-                    continue
-                
-                # Handle chosenOption - convert to int if needed, skip if None
-                if chosen_option is None:
-                    continue
-                try:
-                    chosen_option = int(chosen_option)
-                except (ValueError, TypeError):
-                    continue
-                
-                # Check if chosenOption is within bounds
-                if 0 <= chosen_option < len(options):
-                    chosen_option_data = options[chosen_option]
-                    if isinstance(chosen_option_data, dict):
-                        # Check isCorrect - handle both boolean True and string "true"
-                        is_correct = chosen_option_data.get('isCorrect', False)
-                        if is_correct is True or (isinstance(is_correct, str) and is_correct.lower() == 'true'):
-                            total_score += 1
-                        # else: score = 0 (already initialized)
-        
-        return total_score
-    except (json.JSONDecodeError, TypeError, AttributeError, KeyError, IndexError, ValueError):
-        return 0
+    
+    total_score = 0
+    
+    # Look for Action section - can be at top level or inside gameData array
+    action_section = None
+    
+    # Case 1: Action section at top level
+    if isinstance(data, dict) and 'section' in data and data['section'] == 'Action':
+        action_section = data
+    # Case 2: Action section inside gameData array (similar to other game types)
+    elif isinstance(data, dict) and 'gameData' in data and isinstance(data['gameData'], list):
+        for item in data['gameData']:
+            if isinstance(item, dict) and item.get('section') == 'Action':
+                action_section = item
+                break
+    
+    # Extract scores from Action section
+    if action_section and 'gameData' in action_section and isinstance(action_section['gameData'], list):
+        for question in action_section['gameData']:
+            if not isinstance(question, dict):
+                continue
+            
+            # Get options and chosenOption
+            options = question.get('options', [])
+            chosen_option = question.get('chosenOption')
+            
+            # Skip if no options or chosenOption is None
+            if not isinstance(options, list) or len(options) == 0:
+                continue
+            
+            # Handle chosenOption - convert to int if needed, skip if None
+            if chosen_option is None:
+                continue
+            try:
+                chosen_option = int(chosen_option)
+            except (ValueError, TypeError):
+                continue
+            
+            # Check if chosenOption is within bounds
+            if 0 <= chosen_option < len(options):
+                chosen_option_data = options[chosen_option]
+                if isinstance(chosen_option_data, dict):
+                    # Check isCorrect - handle both boolean True and string "true"
+                    is_correct = chosen_option_data.get('isCorrect', False)
+                    if is_correct is True or (isinstance(is_correct, str) and is_correct.lower() == 'true'):
+                        total_score += 1
+                    # else: score = 0 (already initialized)
+    
+    return total_score
 
 
-def parse_custom_dimension_1_mcq_completed_with_correct_option(custom_dim_1):
+@safe_parse(int)
+def parse_custom_dimension_1_mcq_completed_with_correct_option(data):
     """Parse custom_dimension_1 JSON to extract total score from mcq_completed games using correctOption
     
     This is for games like Positions that use chosenOption and correctOption instead of isCorrect.
@@ -1777,93 +2007,78 @@ def parse_custom_dimension_1_mcq_completed_with_correct_option(custom_dim_1):
     
     Note: Different questions can have different numbers of options.
     """
-    try:
-        if pd.isna(custom_dim_1) or custom_dim_1 is None or custom_dim_1 == '' or custom_dim_1 == 'null':
-            return 0
-        
-        # Parse JSON
-        data = json.loads(custom_dim_1)
-        
-        total_score = 0
-        
-        # Look for Action section - can be at top level or inside gameData array
-        action_section = None
-        
-        # Case 1: Action section at top level
-        if isinstance(data, dict) and 'section' in data and data['section'] == 'Action':
-            action_section = data
-        # Case 2: Action section inside gameData array (similar to other game types)
-        elif isinstance(data, dict) and 'gameData' in data and isinstance(data['gameData'], list):
-            for item in data['gameData']:
-                if isinstance(item, dict) and item.get('section') == 'Action':
-                    action_section = item
-                    break
-        
-        # Extract scores from Action section
-        if action_section and 'gameData' in action_section and isinstance(action_section['gameData'], list):
-            for question in action_section['gameData']:
-                if not isinstance(question, dict):
-                    continue
-                
-                # Get chosenOption and correctOption
-                chosen_option = question.get('chosenOption')
-                correct_option = question.get('correctOption')
-                
-                # Skip if either is None
-                if chosen_option is None or correct_option is None:
-                    continue
-                
-                try:
-                    chosen_option = int(chosen_option)
-                    correct_option = int(correct_option)
-                except (ValueError, TypeError):
-                    continue
-                
-                # Compare chosenOption with correctOption
-                if chosen_option == correct_option:
-                    total_score += 1
-                # else: score = 0 (already initialized)
-        
-        return total_score
-    except (json.JSONDecodeError, TypeError, AttributeError, KeyError, IndexError, ValueError):
-        return 0
+    
+    total_score = 0
+    
+    # Look for Action section - can be at top level or inside gameData array
+    action_section = None
+    
+    # Case 1: Action section at top level
+    if isinstance(data, dict) and 'section' in data and data['section'] == 'Action':
+        action_section = data
+    # Case 2: Action section inside gameData array (similar to other game types)
+    elif isinstance(data, dict) and 'gameData' in data and isinstance(data['gameData'], list):
+        for item in data['gameData']:
+            if isinstance(item, dict) and item.get('section') == 'Action':
+                action_section = item
+                break
+    
+    # Extract scores from Action section
+    if action_section and 'gameData' in action_section and isinstance(action_section['gameData'], list):
+        for question in action_section['gameData']:
+            if not isinstance(question, dict):
+                continue
+            
+            # Get chosenOption and correctOption
+            chosen_option = question.get('chosenOption')
+            correct_option = question.get('correctOption')
+            
+            # Skip if either is None
+            if chosen_option is None or correct_option is None:
+                continue
+            
+            try:
+                chosen_option = int(chosen_option)
+                correct_option = int(correct_option)
+            except (ValueError, TypeError):
+                continue
+            
+            # Compare chosenOption with correctOption
+            if chosen_option == correct_option:
+                total_score += 1
+            # else: score = 0 (already initialized)
+    
+    return total_score
 
 
-def parse_custom_dimension_1_action_games(custom_dim_1):
+@safe_parse(int)
+def parse_custom_dimension_1_action_games(data):
     """Parse custom_dimension_1 JSON to extract total score from action games (for third query)"""
-    try:
-        if pd.isna(custom_dim_1) or custom_dim_1 is None or custom_dim_1 == '' or custom_dim_1 == 'null':
-            return 0
-        
-        # Parse JSON
-        data = json.loads(custom_dim_1)
+    
+    # Extract score from action games structure
+    # Structure: {"options": [{"path": "o1.png", "isCorrect": false}, ...], "chosenOption": 1, "totalTaps": 2, "time": 1754568484640}
+    total_score = 0
+    
+    # Check if this is a single question record
+    if 'options' in data and 'chosenOption' in data:
+        chosen_option = data.get('chosenOption')
         
-        # Extract score from action games structure
-        # Structure: {"options": [{"path": "o1.png", "isCorrect": false}, ...], "chosenOption": 1, "totalTaps": 2, "time": 1754568484640}
-        total_score = 0
+        # If chosenOption is null, score = 0
+        if chosen_option is None:
+            return 0
         
-        # Check if this is a single question record
-        if 'options' in data and 'chosenOption' in data:
-            chosen_option = data.get('chosenOption')
-            
-            # If chosenOption is null, score = 0
-            if chosen_option is None:
-                return 0
-            
-            # Check if chosenOption is within bounds and if the chosen option is correct
-            options = data.get('options', [])
-            if isinstance(options, list) and 0 <= chosen_option < len(options):
-                chosen_option_data = options[chosen_option]
-                if isinstance(chosen_option_data, dict) and chosen_option_data.get('isCorrect', False):
-                    total_score = 1
-                else:
-                    total_score = 0
+        # Check if chosenOption is within bounds and if the chosen option is correct
+        options = data.get('options', [])
+        if isinstance(options, list) and 0 <= chosen_option < len(options):
+            chosen_option_data = options[chosen_option]
+            if isinstance(chosen_option_data, dict) and chosen_option_data.get('isCorrect', False):
+                total_score = 1
             else:
                 total_score = 0
-        
-        return total_score
-    except (json.JSONDecodeError, TypeError, AttributeError, KeyError, IndexError, ValueError):
-        return 0
+        else:
+            total_score = 0
+    
+    return total_score
 
 
 def get_game_name_from_custom_dimension_2(custom_dim_2):
@@ -1900,6 +2115,69 @@ def get_game_name_from_custom_dimension_2(custom_dim_2):
     return game_mapping.get(custom_dim_2, f'Game {custom_dim_2}')
 
 
+# Records of one user/game/visit more than this far apart start a new session instance
+SESSION_GAP = pd.Timedelta(minutes=5)
+
+# Level number embedded in action_level action names (e.g. color_red_action_level_3)
+ACTION_LEVEL_PATTERN = re.compile(r'action_level[_\- ]?(\d+)')
+
+# Games whose question correctness comes from action_level records, normalized (stripped, lower case)
+# Beginning Sound Ba/Ra/Na and Beginning Sounds Ma/Cha/Ba, Ka/Na/Ta, Ta/Va/Ga are not here: they
+# come as game_completed records
+ACTION_LEVEL_GAMES = frozenset(g.strip().lower() for g in (
+    'Beginning Sounds Ma/Ka/La', 'Color Blue', 'Color Red', 'Color Yellow',
+    'Numbers I', 'Numbers II', 'Numerals 1-10', 'Shape Circle', 'Shape Rectangle',
+    'Shape Square', 'Shape Triangle', 'Positions', 'Sorting Primary Colors'
+))
+
+# game_completed games scored from gameData -> jsonData (isCorrect per level) in preference to
+# correctSelections; their action_name looks like "beginning_sound_ma_cha_ba_hindi_hybrid_game_completed"
+JSON_DATA_GAMES = ('Beginning Sound Ba/Ra/Na', 'Beginning Sounds Ma/Cha/Ba', 'Beginning Sounds Ka/Na/Ta', 'Beginning Sounds Ta/Va/Ga')
+JSON_DATA_GAMES_NORMALIZED = frozenset(g.strip().lower() for g in JSON_DATA_GAMES)
+
+
+def action_name_masks(action_names: pd.Series, *needles, case: bool = False) -> dict:
+    """Return {needle: boolean row mask} for substring matches on action_names.
+
+    A score frame has only a handful of distinct action names, so each substring check runs
+    on the distinct names and the result is broadcast back by factorize code (-1 = missing
+    name, which never matches).
+    """
+    codes, unique_names = pd.factorize(action_names)
+    unique_names = pd.Series(unique_names, dtype=object)
+    masks = {}
+    for needle in needles:
+        hits = unique_names.str.contains(needle, case=case, na=False, regex=False).to_numpy(dtype=bool)
+        masks[needle] = pd.Series(np.append(hits, False)[codes], index=action_names.index)
+    return masks
+
+
+def game_name_mask(game_names: pd.Series, game_list) -> pd.Series:
+    """Return a boolean row mask of game_names that match a game in game_list.
+
+    Matching ignores case and surrounding whitespace. The normalized targets go into a set
+    once, and each distinct game name is looked up once and broadcast back by factorize code
+    (missing names never match).
+    """
+    targets = frozenset(str(g).strip().lower() for g in game_list)
+    codes, unique_names = pd.factorize(game_names)
+    hits = np.fromiter((str(name).strip().lower() in targets for name in unique_names), dtype=bool, count=len(unique_names))
+    return pd.Series(np.append(hits, False)[codes], index=game_names.index)
+
+
+def map_distinct(values: pd.Series, func) -> pd.Series:
+    """Equivalent of values.apply(func) for low-cardinality columns (game codes, languages, names).
+
+    func runs once per distinct value (missing values included, as NaN) and the results are
+    broadcast back by factorize code, so there is no Python call per row.
+    """
+    if values.empty:
+        return values.apply(func)
+    codes, unique_values = pd.factorize(values, use_na_sentinel=False)
+    mapped = pd.Series([func(value) for value in unique_values])
+    return pd.Series(mapped.to_numpy()[codes], index=values.index, name=values.name, dtype=mapped.dtype)
+
+
 def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
     """Extract per-question correctness across games using the same processing method as score distribution.
     
@@ -1942,33 +2220,74 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
     # Parse timestamps
     df_score = df_score.copy()
     try:
-        df_score['server_time'] = pd.to_datetime(df_score['server_time'])
-    except Exception:
-        pass
+        df_score['server_time'] = parse_timestamps(df_score['server_time'])
+    except (ValueError, TypeError) as e:
+        print(f"  [WARNING] Could not convert server_time: {e}")
 
     # Note: We no longer exclude sorting games - they should be processed like other games
     
-    # Helper function to create row dict with optional columns
-    def create_question_row(game_name_val, idvisitor, idvisit, session_instance, question_number, is_correct, row_tuple=None):
-        """Create a question row dict, including language and game_code (domain extracted) if available"""
-        row_dict = {
-            'game_name': game_name_val,
-            'idvisitor_converted': idvisitor,
-            'idvisit': idvisit,
-            'session_instance': session_instance,
-            'question_number': question_number,
-            'is_correct': is_correct
-        }
-        if has_language and row_tuple is not None:
-            row_dict['language'] = getattr(row_tuple, 'language', None)
-        if has_game_code and row_tuple is not None:
-            # Extract domain from game_code (e.g., HY-29-LL-06 -> LL)
-            full_game_code = getattr(row_tuple, 'game_code', None)
-            if full_game_code is not None and not pd.isna(full_game_code):
-                row_dict['game_code'] = extract_domain_from_game_code(full_game_code)
-            else:
-                row_dict['game_code'] = None
-        return row_dict
+    # Helpers that append questions to the output columns (language/game_code only if available)
+    def add_record_questions(results, game_name_val, idvisitor, idvisit, language=None, full_game_code=None):
+        """Append the parsed questions of one record (session 1), extracting the domain once per record.
+
+        Questions are appended in order; if one has a non-integer number or correctness the
+        error propagates and the questions before it are kept.
+        """
+        n_before = len(question_columns['question_number'])
+        try:
+            for q_result in results:
+                question_number = int(q_result['question_number'])
+                is_correct = int(q_result['is_correct'])
+                question_columns['question_number'].append(question_number)
+                question_columns['is_correct'].append(is_correct)
+        finally:
+            n_added = len(question_columns['question_number']) - n_before
+            if n_added:
+                question_columns['game_name'].extend([game_name_val] * n_added)
+                question_columns['idvisitor_converted'].extend([idvisitor] * n_added)
+                question_columns['idvisit'].extend([idvisit] * n_added)
+                question_columns['session_instance'].extend([1] * n_added)
+                if has_language:
+                    question_columns['language'].extend([language] * n_added)
+                if has_game_code:
+                    domain = None
+                    if full_game_code is not None and not pd.isna(full_game_code):
+                        domain = extract_domain_from_game_code(full_game_code)
+                    question_columns['game_code'].extend([domain] * n_added)
+
+    def add_question_columns(frame, session_instances, question_numbers, is_correct):
+        """Add one question per row of frame as a columnar part, taking the per-row values from aligned Series"""
+        part = pd.DataFrame({
+            'game_name': frame['game_name'],
+            'idvisitor_converted': frame['idvisitor_converted'],
+            'idvisit': frame['idvisit'],
+            'session_instance': session_instances,
+            'question_number': question_numbers,
+            'is_correct': is_correct,
+        })
+        if has_language:
+            part['language'] = frame['language']
+        if has_game_code:
+            part['game_code'] = map_distinct(frame['game_code'], extract_domain_from_game_code)
+        question_frames.append(part)
+
+    def iter_score_columns(frame):
+        """Iterate the columns needed for per-question rows as plain tuples.
+
+        Zipping column lists avoids building a namedtuple and doing getattr
+        lookups for every record the way itertuples() does.
+        """
+        n = len(frame)
+        languages = frame['language'].tolist() if has_language else [None] * n
+        game_codes = frame['game_code'].tolist() if has_game_code else [None] * n
+        return zip(
+            frame['custom_dimension_1'].tolist(),
+            frame['game_name'].tolist(),
+            frame['idvisitor_converted'].tolist(),
+            frame['idvisit'].tolist(),
+            languages,
+            game_codes,
+        )
 
     print(f"\nProcessing per-question correctness for {df_score['game_name'].nunique()} unique games")
     print(f"  - Total records: {len(df_score):,}")
@@ -1987,19 +2306,14 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
     #       and "Beginning Sound Ba/Ra/Na" all have action_name like "beginning_sound_ma_cha_ba_hindi_hybrid_game_completed"
     #       (contains "hybrid_game_completed") and should use flow/jsonData method, so they go to game_completed_data
     games_to_use_mcq_completed_method = ['Shape Rectangle', 'Numerals 1-10', 'Positions']
-    games_to_use_json_data_method = ['Beginning Sound Ba/Ra/Na', 'Beginning Sounds Ma/Cha/Ba', 'Beginning Sounds Ka/Na/Ta', 'Beginning Sounds Ta/Va/Ga']
-    
-    # Helper function for case-insensitive game name matching (handles whitespace and case variations)
-    def _is_game_in_list(game_name, game_list):
-        """Check if game_name matches any game in game_list (case-insensitive, handles whitespace)"""
-        if pd.isna(game_name):
-            return False
-        game_name_clean = str(game_name).strip().lower()
-        return any(game_name_clean == str(g).strip().lower() for g in game_list)
+    games_to_use_json_data_method = JSON_DATA_GAMES
     
     # Create boolean masks for case-insensitive matching
-    is_json_data_game = df_score['game_name'].apply(lambda x: _is_game_in_list(x, games_to_use_json_data_method))
-    is_mcq_completed_game = df_score['game_name'].apply(lambda x: _is_game_in_list(x, games_to_use_mcq_completed_method))
+    is_json_data_game = game_name_mask(df_score['game_name'], games_to_use_json_data_method)
+    is_mcq_completed_game = game_name_mask(df_score['game_name'], games_to_use_mcq_completed_method)
+    action_masks = action_name_masks(df_score['action_name'], 'game_completed', 'mcq_completed')
+    is_game_completed_action = action_masks['game_completed']
+    is_mcq_completed_action = action_masks['mcq_completed']
     
     # Filter for game_completed_data:
     # - Includes action_name containing 'game_completed' (matches "hybrid_game_completed" too)
@@ -2007,21 +2321,20 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
     # - Also includes mcq_completed records for jsonData games (to route them correctly)
     # - Excludes games that should use mcq_completed method
     game_completed_data = df_score[
-        ((df_score['action_name'].str.contains('game_completed', na=False, case=False) & 
-          ~df_score['action_name'].str.contains('mcq_completed', na=False, case=False)) |
-         (df_score['action_name'].str.contains('mcq_completed', na=False, case=False) &
-          is_json_data_game)) &
+        ((is_game_completed_action & ~is_mcq_completed_action) |
+         (is_mcq_completed_action & is_json_data_game)) &
         ~is_mcq_completed_game
-    ].copy()
+    ]
     
     mcq_completed_data = df_score[
-        (df_score['action_name'].str.contains('mcq_completed', na=False, case=False) &
-         ~is_json_data_game) |
-        (df_score['action_name'].str.contains('game_completed', na=False, case=False) &
-         is_mcq_completed_game)
-    ].copy()
+        (is_mcq_completed_action & ~is_json_data_game) |
+        (is_game_completed_action & is_mcq_completed_game)
+    ]
     
-    action_level_data = df_score[df_score['action_name'].str.contains('action_level', na=False)].copy()
+    # The three subsets are only read (action_level_data is re-created by drop_duplicates/sort_values
+    # before columns are added), so the boolean-mask results are used without defensive copies
+    is_action_level = action_name_masks(df_score['action_name'], 'action_level', case=True)['action_level']
+    action_level_data = df_score[is_action_level]
 
     print(f"  - game_completed records: {len(game_completed_data):,}")
     print(f"  - mcq_completed records: {len(mcq_completed_data):,}")
@@ -2031,41 +2344,40 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
     print(f"  - Unique games in action_level: {action_level_data['game_name'].nunique()}")
     
     # Debug: Check if Beginning Sounds games are in the data
-    beginning_sounds_games = ['Beginning Sound Ba/Ra/Na', 'Beginning Sounds Ma/Cha/Ba', 'Beginning Sounds Ka/Na/Ta', 'Beginning Sounds Ta/Va/Ga']
-    print(f"\n  [DEBUG] Checking Beginning Sounds games in data:")
-    for game in beginning_sounds_games:
-        in_game_completed = game_completed_data[game_completed_data['game_name'].str.strip().str.lower() == game.strip().lower()]
-        in_mcq_completed = mcq_completed_data[mcq_completed_data['game_name'].str.strip().str.lower() == game.strip().lower()]
-        in_all = df_score[df_score['game_name'].str.strip().str.lower() == game.strip().lower()]
-        print(f"    - {game}:")
-        print(f"      In all data: {len(in_all):,} records")
-        print(f"      In game_completed: {len(in_game_completed):,} records")
-        print(f"      In mcq_completed: {len(in_mcq_completed):,} records")
-        if len(in_all) > 0 and len(in_game_completed) == 0 and len(in_mcq_completed) == 0:
-            # Show sample game names to see what the actual names are
-            sample_names = in_all['game_name'].unique()[:3]
-            print(f"      WARNING: Game exists in data but not in filtered sets!")
-            print(f"      Sample actual game names: {list(sample_names)}")
-
-    per_question_rows: list[dict] = []
+    if _DEBUG:
+        beginning_sounds_games = ['Beginning Sound Ba/Ra/Na', 'Beginning Sounds Ma/Cha/Ba', 'Beginning Sounds Ka/Na/Ta', 'Beginning Sounds Ta/Va/Ga']
+        print(f"\n  [DEBUG] Checking Beginning Sounds games in data:")
+        for game in beginning_sounds_games:
+            in_game_completed = game_completed_data[game_completed_data['game_name'].str.strip().str.lower() == game.strip().lower()]
+            in_mcq_completed = mcq_completed_data[mcq_completed_data['game_name'].str.strip().str.lower() == game.strip().lower()]
+            in_all = df_score[df_score['game_name'].str.strip().str.lower() == game.strip().lower()]
+            print(f"    - {game}:")
+            print(f"      In all data: {len(in_all):,} records")
+            print(f"      In game_completed: {len(in_game_completed):,} records")
+            print(f"      In mcq_completed: {len(in_mcq_completed):,} records")
+            if len(in_all) > 0 and len(in_game_completed) == 0 and len(in_mcq_completed) == 0:
+                # Show sample game names to see what the actual names are
+                sample_names = in_all['game_name'].unique()[:3]
+                print(f"      WARNING: Game exists in data but not in filtered sets!")
+                print(f"      Sample actual game names: {list(sample_names)}")
+
+    # One list per output column; building the frame from columns avoids a dict per question
+    question_columns = {
+        c: [] for c in ['game_name', 'idvisitor_converted', 'idvisit', 'session_instance', 'question_number', 'is_correct']
+    }
+    if has_language:
+        question_columns['language'] = []
+    if has_game_code:
+        question_columns['game_code'] = []
+    # Vectorized (action_level) questions stay as DataFrames instead of being boxed into the lists
+    question_frames = []
 
     # Helper function to find matching game name (case-insensitive, handles variations)
     # Used only for action_level filtering
     def _find_game_method(game_name: str) -> str:
         """Find processing method for a game name (case-insensitive match) - used for action_level filtering only"""
         # Only check if it's action_level (games that should be in action_level_data)
-        # Note: Beginning Sound Ba/Ra/Na, Beginning Sounds Ma/Cha/Ba, Ka/Na/Ta, and Ta/Va/Ga are processed through game_completed
-        # (they come as game_completed records, not action_level records)
-        action_level_games = {
-            'Beginning Sounds Ma/Ka/La', 'Color Blue', 'Color Red', 'Color Yellow',
-            'Numbers I', 'Numbers II', 'Numerals 1-10', 'Shape Circle', 'Shape Rectangle',
-            'Shape Square', 'Shape Triangle', 'Positions', 'Sorting Primary Colors'
-        }
-        game_name_clean = str(game_name).strip().lower()
-        for mapped_game in action_level_games:
-            if game_name_clean == str(mapped_game).strip().lower():
-                return 'action_level'
-        return None
+        return 'action_level' if str(game_name).strip().lower() in ACTION_LEVEL_GAMES else None
 
     # 1) Handle game_completed/mcq_completed - Process each game dynamically (same as score distribution)
     if not game_completed_data.empty:
@@ -2076,17 +2388,16 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
         print(f"  - Using dynamic method selection (same as score distribution)...")
         print(f"  - Games to process: {sorted(game_completed_data['game_name'].unique())}")
         
-        import time
         step_start_time = time.time()
         
         # Process each game dynamically - try both methods and pick the best one (same as score distribution)
         games_processed = 0
         games_skipped = 0
-        all_games_list = sorted(game_completed_data['game_name'].unique())
+        # One groupby pass splits the records by game instead of a boolean mask per game
+        games_grouped = game_completed_data.groupby('game_name', sort=True, observed=True)
         
-        for game_idx, game_name in enumerate(all_games_list, 1):
-            print(f"\n    [GAME {game_idx}/{len(all_games_list)}] Processing: {game_name}")
-            game_data = game_completed_data[game_completed_data['game_name'] == game_name].copy()
+        for game_idx, (game_name, game_data) in enumerate(games_grouped, 1):
+            print(f"\n    [GAME {game_idx}/{games_grouped.ngroups}] Processing: {game_name}")
             
             # Skip action_level games in game_completed (they should be in action_level_data)
             if _find_game_method(game_name) == 'action_level':
@@ -2109,9 +2420,8 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
             test_sample_size = min(200, total_records)
             test_sample = game_data.head(test_sample_size)
             
-            for row_tuple in test_sample.itertuples(index=False):
-                raw = getattr(row_tuple, 'custom_dimension_1', None)
-                if pd.isna(raw) or raw in (None, '', 'null'):
+            for raw in test_sample['custom_dimension_1'].tolist():
+                if is_empty_payload(raw):
                     continue
                 
                 # Test Method 1: correct_selections
@@ -2132,18 +2442,12 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
                 except Exception:
                     pass
             
-            # Games that should prefer flow method (jsonData structure, same as Beginning Sound Ba/Ra/Na)
-            # These games have action_name like "beginning_sound_ma_cha_ba_hindi_hybrid_game_completed"
-            # Includes: Beginning Sound Ba/Ra/Na, Beginning Sounds Ma/Cha/Ba, Ka/Na/Ta, Ta/Va/Ga
-            games_prefer_flow = ['Beginning Sound Ba/Ra/Na', 'Beginning Sounds Ma/Cha/Ba', 'Beginning Sounds Ka/Na/Ta', 'Beginning Sounds Ta/Va/Ga']
-            
             # Choose the method that produces more valid results (same logic as score distribution)
             # Prefer the method that extracts more questions overall, not just more records
-            # For specific games, prefer flow if both methods work
+            # For the JSON_DATA_GAMES (jsonData structure), prefer flow if both methods work
             # Use case-insensitive matching to handle any name variations
             game_name_normalized = str(game_name).strip().lower()
-            games_prefer_flow_normalized = [g.strip().lower() for g in games_prefer_flow]
-            if game_name_normalized in games_prefer_flow_normalized and flow_total_questions > 0:
+            if game_name_normalized in JSON_DATA_GAMES_NORMALIZED and flow_total_questions > 0:
                 processing_method = 'flow'
                 print(f"    - {game_name}: Using flow method (preferred for this game, {flow_count} valid records, {flow_total_questions} questions in sample)")
             elif correct_selections_total_questions >= flow_total_questions and correct_selections_count > 0:
@@ -2168,17 +2472,20 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
             
             print(f"    [PROCESS] {game_name}: Using method '{processing_method}' ({total_records:,} records)")
             games_processed += 1
+            # Method 1: correct_selections (roundDetails); Method 2: flow stop&go
+            parse_func = parse_correct_selections_questions if processing_method == 'correct_selections' else parse_flow_stop_go_questions
             
             # Process records using the determined method (use itertuples for better performance)
             records_processed = 0
             records_with_data = 0
             questions_extracted = 0
             progress_interval = max(1000, total_records // 10)  # Show progress every 10% or 1000 records
+            # Identical payloads are common, so each distinct payload is parsed once per game
+            results_by_payload = {}
             
-            import time
             start_time = time.time()
             
-            for idx, row_tuple in enumerate(game_data.itertuples(index=False), 1):
+            for idx, (raw, game_name_val, idvisitor, idvisit, language, full_game_code) in enumerate(iter_score_columns(game_data), 1):
                 # Show progress at intervals
                 if idx % progress_interval == 0 or idx == total_records:
                     elapsed = time.time() - start_time
@@ -2188,50 +2495,21 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
                           f"Processed: {records_processed:,} | Questions: {questions_extracted:,} | "
                           f"Rate: {rate:.0f} rec/s | ETA: {remaining:.0f}s", flush=True)
                 
-                # Get values from named tuple
-                raw = getattr(row_tuple, 'custom_dimension_1', None)
-                if pd.isna(raw) or raw in (None, '', 'null'):
+                if is_empty_payload(raw):
                     continue
                 
-                game_name_val = getattr(row_tuple, 'game_name', game_name)
-                idvisitor = getattr(row_tuple, 'idvisitor_converted', None)
-                idvisit = getattr(row_tuple, 'idvisit', None)
-                
-                # Method 1: correct_selections (roundDetails)
-                if processing_method == 'correct_selections':
-                    try:
-                        results = parse_correct_selections_questions(raw, game_name)
-                        if len(results) > 0:
-                            records_with_data += 1
-                            questions_extracted += len(results)
-                            for q_result in results:
-                                per_question_rows.append(create_question_row(
-                                    game_name_val, idvisitor, idvisit, 1,
-                                    int(q_result['question_number']),
-                                    int(q_result['is_correct']), row_tuple
-                                ))
-                        records_processed += 1
-                    except Exception:
-                        records_processed += 1
-                        pass
-                
-                # Method 2: flow stop&go
-                elif processing_method == 'flow':
-                    try:
-                        results = parse_flow_stop_go_questions(raw, game_name)
-                        if len(results) > 0:
-                            records_with_data += 1
-                            questions_extracted += len(results)
-                            for q_result in results:
-                                per_question_rows.append(create_question_row(
-                                    game_name_val, idvisitor, idvisit, 1,
-                                    int(q_result['question_number']),
-                                    int(q_result['is_correct']), row_tuple
-                                ))
-                        records_processed += 1
-                    except Exception:
-                        records_processed += 1
-                        pass
+                try:
+                    results = results_by_payload.get(raw)
+                    if results is None:
+                        results = results_by_payload[raw] = parse_func(raw, game_name)
+                    if len(results) > 0:
+                        records_with_data += 1
+                        questions_extracted += len(results)
+                        add_record_questions(results, game_name_val, idvisitor, idvisit, language, full_game_code)
+                    records_processed += 1
+                except Exception:
+                    records_processed += 1
+                    pass
             
             elapsed_total = time.time() - start_time
             print(f"      [OK] {game_name}: Completed in {elapsed_total:.1f}s | "
@@ -2241,7 +2519,7 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
                 
 
         step_elapsed = time.time() - step_start_time
-        total_questions = len([r for r in per_question_rows])
+        total_questions = len(question_columns['game_name'])
         print(f"\n  [STEP 1 SUMMARY] Completed in {step_elapsed:.1f}s")
         print(f"    - Processed: {games_processed} games")
         print(f"    - Skipped: {games_skipped} games")
@@ -2256,15 +2534,13 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
         # Note: Positions now uses isCorrect method, so this list is empty
         games_with_correct_option = []
         
-        import time
         step_start_time = time.time()
         mcq_games_processed = 0
         mcq_records_processed = 0
         mcq_records_with_data = 0
         mcq_questions_extracted = 0
         
-        for game_name in sorted(mcq_completed_data['game_name'].unique()):
-            game_data = mcq_completed_data[mcq_completed_data['game_name'] == game_name].copy()
+        for game_name, game_data in mcq_completed_data.groupby('game_name', sort=True, observed=True):
             total_records = len(game_data)
             print(f"\n    [GAME] Processing {game_name}: {total_records:,} records")
             mcq_games_processed += 1
@@ -2283,8 +2559,10 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
             game_records_processed = 0
             game_records_with_data = 0
             game_questions_extracted = 0
+            # Identical payloads are common, so each distinct payload is parsed once per game
+            results_by_payload = {}
             
-            for idx, row_tuple in enumerate(game_data.itertuples(index=False), 1):
+            for idx, (raw, game_name_val, idvisitor, idvisit, language, full_game_code) in enumerate(iter_score_columns(game_data), 1):
                 if idx % progress_interval == 0 or idx == total_records:
                     elapsed = time.time() - start_time
                     rate = idx / elapsed if elapsed > 0 else 0
@@ -2293,25 +2571,17 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
                           f"Processed: {game_records_processed:,} | Questions: {game_questions_extracted:,} | "
                           f"Rate: {rate:.0f} rec/s | ETA: {remaining:.0f}s", flush=True)
                 
-                raw = getattr(row_tuple, 'custom_dimension_1', None)
-                if pd.isna(raw) or raw in (None, '', 'null'):
+                if is_empty_payload(raw):
                     continue
                 
-                game_name_val = getattr(row_tuple, 'game_name', game_name)
-                idvisitor = getattr(row_tuple, 'idvisitor_converted', None)
-                idvisit = getattr(row_tuple, 'idvisit', None)
-                
                 try:
-                    results = parse_func(raw, game_name)
+                    results = results_by_payload.get(raw)
+                    if results is None:
+                        results = results_by_payload[raw] = parse_func(raw, game_name)
                     if len(results) > 0:
                         game_records_with_data += 1
                         game_questions_extracted += len(results)
-                        for q_result in results:
-                            per_question_rows.append(create_question_row(
-                                game_name_val, idvisitor, idvisit, 1,
-                                int(q_result['question_number']),
-                                int(q_result['is_correct']), row_tuple
-                            ))
+                        add_record_questions(results, game_name_val, idvisitor, idvisit, language, full_game_code)
                     game_records_processed += 1
                 except Exception:
                     game_records_processed += 1
@@ -2361,41 +2631,22 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
         print(f"    - Sorting records and creating session instances...")
         action_level_data = action_level_data.sort_values(['idvisitor_converted', 'game_name', 'idvisit', 'server_time'])
         
-        session_instances = []
-        current_session = 1
-        prev_user = prev_game = prev_visit = None
-        prev_time = None
-        
-        # Use itertuples for better performance
-        total_action_records = len(action_level_data)
-        print(f"    - Processing {total_action_records:,} records to create session instances...")
-        progress_interval = max(5000, total_action_records // 10)  # Show progress every 10% or 5000 records
-        
-        import time
+        # A new session starts at every user/game/visit boundary, and again within one visit
+        # after a gap of more than 5 minutes; numbering restarts at 1 for each visit
+        # The boundaries are found on integer factorize codes (missing keys, coded -1, never match)
+        # and the per-visit counter is a running sum reset at each visit start
         start_time = time.time()
-        
-        for idx, row_tuple in enumerate(action_level_data.itertuples(index=False), 1):
-            # Show progress at intervals
-            if idx % progress_interval == 0 or idx == total_action_records:
-                elapsed = time.time() - start_time
-                rate = idx / elapsed if elapsed > 0 else 0
-                remaining = (total_action_records - idx) / rate if rate > 0 else 0
-                print(f"      [PROGRESS] Session instances: {idx:,}/{total_action_records:,} ({idx*100//total_action_records}%) | "
-                      f"Rate: {rate:.0f} rec/s | ETA: {remaining:.0f}s", flush=True)
-            
-            user = getattr(row_tuple, 'idvisitor_converted', None)
-            game = getattr(row_tuple, 'game_name', None)
-            visit = getattr(row_tuple, 'idvisit', None)
-            time_val = getattr(row_tuple, 'server_time', None)
-            
-            if user != prev_user or game != prev_game or visit != prev_visit:
-                current_session = 1
-            elif prev_time is not None and (time_val - prev_time).total_seconds() > 300:
-                current_session += 1
-            
-            session_instances.append(current_session)
-            prev_user, prev_game, prev_visit, prev_time = user, game, visit, time_val
-        
+        new_visit = np.zeros(len(action_level_data), dtype=bool)
+        new_visit[:1] = True
+        for key in ['idvisitor_converted', 'game_name', 'idvisit']:
+            codes = pd.factorize(action_level_data[key])[0]
+            new_visit[1:] |= (codes[1:] != codes[:-1]) | (codes[1:] == -1)
+        long_gap = action_level_data['server_time'].diff().gt(SESSION_GAP).to_numpy() & ~new_visit
+        gap_count = np.cumsum(long_gap, dtype=np.int32)
+        visit_start = np.maximum.accumulate(np.where(new_visit, np.arange(len(new_visit)), 0))
+        session_instances = pd.Series(
+            gap_count - gap_count[visit_start] + 1, index=action_level_data.index
+        )
         elapsed_total = time.time() - start_time
         print(f"    [OK] Created session instances in {elapsed_total:.1f}s")
         
@@ -2403,19 +2654,14 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
         unique_sessions = action_level_data.groupby(['idvisitor_converted', 'game_name', 'idvisit', 'session_instance']).size()
         print(f"    [OK] Created {len(unique_sessions):,} unique game sessions")
         
-        # Extract question number from action_name
-        import re
-        def _extract_level(action_name: str):
-            try:
-                m = re.search(r'action_level[_\- ]?(\d+)', str(action_name))
-                if m:
-                    return int(m.group(1))
-            except Exception:
-                pass
-            return None
-        
-        levels = action_level_data['action_name'].apply(_extract_level)
-        action_level_data['question_number'] = levels
+        # Extract question number from action_name, once per distinct action name
+        name_codes, unique_names = pd.factorize(action_level_data['action_name'])
+        unique_levels = (
+            pd.Series(unique_names, dtype=object)
+            .str.extract(ACTION_LEVEL_PATTERN, expand=False)
+            .astype('Int32')
+        )
+        action_level_data['question_number'] = unique_levels.array.take(name_codes)
         # Fallback numbering where level not found
         mask_missing = action_level_data['question_number'].isna()
         if mask_missing.any():
@@ -2425,96 +2671,76 @@ def extract_per_question_correctness(df_score: pd.DataFrame) -> pd.DataFrame:
                 .cumcount() + 1
             )
         
-        # Compute correctness per record using parse_action_level_questions (same as score distribution)
+        # Compute correctness per record (same parser as score distribution); every record
+        # yields one question row, scored 0 when custom_dimension_1 is missing or malformed
         total_action_records = len(action_level_data)
-        print(f"    - Parsing question scores from custom_dimension_1 using parse_action_level_questions...")
+        print(f"    - Parsing question scores from custom_dimension_1 using parse_custom_dimension_1_action_games...")
         print(f"    - Processing {total_action_records:,} records...")
-        correct_count = 0
-        incorrect_count = 0
-        progress_interval = max(5000, total_action_records // 10)  # Show progress every 10% or 5000 records
-        
-        import time
         start_time = time.time()
-        
-        # Use itertuples for better performance
-        for idx, row_tuple in enumerate(action_level_data.itertuples(index=False), 1):
-            # Show progress at intervals
-            if idx % progress_interval == 0 or idx == total_action_records:
-                elapsed = time.time() - start_time
-                rate = idx / elapsed if elapsed > 0 else 0
-                remaining = (total_action_records - idx) / rate if rate > 0 else 0
-                print(f"      [PROGRESS] Parsing: {idx:,}/{total_action_records:,} ({idx*100//total_action_records}%) | "
-                      f"Correct: {correct_count:,} | Incorrect: {incorrect_count:,} | "
-                      f"Rate: {rate:.0f} rec/s | ETA: {remaining:.0f}s", flush=True)
-            
-            try:
-                custom_dim = getattr(row_tuple, 'custom_dimension_1', None)
-                game_name_val = getattr(row_tuple, 'game_name', None)
-                question_num = int(getattr(row_tuple, 'question_number', 0))
-                
-                results = parse_action_level_questions(custom_dim, game_name_val, question_num)
-                if len(results) > 0:
-                    q_result = results[0]  # Should only have one result per record
-                    is_correct = q_result['is_correct']
-                    if is_correct == 1:
-                        correct_count += 1
-                    else:
-                        incorrect_count += 1
-                    
-                    per_question_rows.append(create_question_row(
-                        game_name_val,
-                        getattr(row_tuple, 'idvisitor_converted', None),
-                        getattr(row_tuple, 'idvisit', None),
-                        int(getattr(row_tuple, 'session_instance', 1)),
-                        question_num,
-                        int(is_correct),
-                        row_tuple
-                    ))
-                else:
-                    incorrect_count += 1
-                    # Still add record with is_correct=0 if no results
-                    per_question_rows.append(create_question_row(
-                        game_name_val,
-                        getattr(row_tuple, 'idvisitor_converted', None),
-                        getattr(row_tuple, 'idvisit', None),
-                        int(getattr(row_tuple, 'session_instance', 1)),
-                        question_num,
-                        0,
-                        row_tuple
-                    ))
-            except Exception:
-                incorrect_count += 1
-                # Still add record with is_correct=0 if parsing fails
-                try:
-                    per_question_rows.append(create_question_row(
-                        getattr(row_tuple, 'game_name', None),
-                        getattr(row_tuple, 'idvisitor_converted', None),
-                        getattr(row_tuple, 'idvisit', None),
-                        int(getattr(row_tuple, 'session_instance', 1)),
-                        int(getattr(row_tuple, 'question_number', 0)),
-                        0,
-                        row_tuple
-                    ))
-                except:
-                    pass
+        is_correct = score_payloads(
+            action_level_data['custom_dimension_1'], 'chosenOption', parse_custom_dimension_1_action_games
+        )
+        add_question_columns(
+            action_level_data,
+            session_instances=action_level_data['session_instance'],
+            question_numbers=action_level_data['question_number'].astype('int32'),
+            is_correct=is_correct.astype('int8'),
+        )
+        correct_count = int(is_correct.eq(1).sum())
+        incorrect_count = total_action_records - correct_count
         
         elapsed_total = time.time() - start_time
         print(f"    [OK] Parsed scores in {elapsed_total:.1f}s: {correct_count:,} correct (1), {incorrect_count:,} incorrect (0)")
 
         # Pre-compute unique game names as a set for O(1) lookup instead of calling .unique() in the comprehension
         action_level_game_names = set(action_level_data['game_name'].unique())
-        print(f"    [OK] Extracted {len([r for r in per_question_rows if r.get('game_name') in action_level_game_names])} per-question records from action_level")
+        action_level_rows = sum(1 for g in question_columns['game_name'] if g in action_level_game_names) + total_action_records
+        print(f"    [OK] Extracted {action_level_rows} per-question records from action_level")
         print(f"\n  [STEP 2 SUMMARY] Processed {unique_action_games} action_level games")
     
-    total_extracted = len(per_question_rows)
+    total_extracted = len(question_columns['game_name']) + sum(len(part) for part in question_frames)
     print(f"\n  [FINAL] Total per-question records extracted: {total_extracted:,}")
     
-    if not per_question_rows:
+    if not total_extracted:
         return pd.DataFrame(columns=[
             'game_name', 'idvisitor_converted', 'idvisit', 'session_instance', 'question_number', 'is_correct'
         ])
 
-    return pd.DataFrame.from_records(per_question_rows)
+    # Tiny value ranges: store the counters in the narrowest integer type that fits, and
+    # game_name (few distinct games) as a category for the groupbys and merge downstream
+    parts = [pd.DataFrame(question_columns)] if question_columns['game_name'] else []
+    per_question_df = pd.concat(parts + question_frames, ignore_index=True)
+    for col in ('question_number', 'session_instance'):
+        per_question_df[col] = pd.to_numeric(per_question_df[col], downcast='integer')
+    per_question_df['is_correct'] = per_question_df['is_correct'].astype(np.int8)
+    per_question_df['game_name'] = per_question_df['game_name'].astype('category')
+    return per_question_df
+
+
+def score_payloads(payloads: pd.Series, marker: str, parser) -> pd.Series:
+    """Score custom_dimension_1 payloads with parser, skipping the JSON decode where it cannot score.
+
+    A payload that does not contain marker (the JSON key the parser reads its score from)
+    always scores 0, so a vectorized substring scan picks the rows worth decoding and the
+    rest are filled with 0 directly. Missing payloads (None/NaN) score 0 without a parser
+    call, matching the parsers' own guard; other non-string values are passed to the parser.
+    Identical payloads are common in telemetry, so each distinct payload is parsed once and
+    its score is broadcast back to every row that carries it.
+    """
+    if not (pd.api.types.is_object_dtype(payloads) or pd.api.types.is_string_dtype(payloads)):
+        return payloads.apply(parser)
+    may_score = payloads.str.contains(marker, regex=False, na=True).astype(bool) & payloads.notna()
+    scores = pd.Series(0, index=payloads.index, dtype='int64')
+    if may_score.any():
+        candidates = payloads[may_score]
+        try:
+            codes, uniques = pd.factorize(candidates)
+        except TypeError:  # unhashable values (e.g. already-decoded dicts)
+            scores[may_score] = candidates.apply(parser)
+        else:
+            unique_scores = np.fromiter((parser(payload) for payload in uniques), dtype='int64', count=len(uniques))
+            scores[may_score] = unique_scores[codes]
+    return scores
 
 
 def calculate_score_distribution_combined(df_score):
@@ -2537,7 +2763,8 @@ def calculate_score_distribution_combined(df_score):
     
     # The game_name is now directly available from the hybrid_games table
     # We need to determine the score calculation method based on the action_name
-    combined_df = pd.DataFrame()
+    # Scored frames are collected here and concatenated once at the end
+    score_parts = []
     
     # Separate data based on action type for different score calculation methods
     # Separate game_completed and mcq_completed (action_level is no longer used)
@@ -2549,19 +2776,14 @@ def calculate_score_distribution_combined(df_score):
     #       and "Beginning Sound Ba/Ra/Na" all have action_name like "beginning_sound_ma_cha_ba_hindi_hybrid_game_completed"
     #       (contains "hybrid_game_completed") and should use jsonData method, so they go to game_completed_data
     games_to_use_mcq_completed_method = ['Shape Rectangle', 'Numerals 1-10', 'Positions']
-    games_to_use_json_data_method = ['Beginning Sound Ba/Ra/Na', 'Beginning Sounds Ma/Cha/Ba', 'Beginning Sounds Ka/Na/Ta', 'Beginning Sounds Ta/Va/Ga']
-    
-    # Helper function for case-insensitive game name matching (handles whitespace and case variations)
-    def _is_game_in_list(game_name, game_list):
-        """Check if game_name matches any game in game_list (case-insensitive, handles whitespace)"""
-        if pd.isna(game_name):
-            return False
-        game_name_clean = str(game_name).strip().lower()
-        return any(game_name_clean == str(g).strip().lower() for g in game_list)
+    games_to_use_json_data_method = JSON_DATA_GAMES
     
     # Create boolean masks for case-insensitive matching
-    is_json_data_game = df_score['game_name'].apply(lambda x: _is_game_in_list(x, games_to_use_json_data_method))
-    is_mcq_completed_game = df_score['game_name'].apply(lambda x: _is_game_in_list(x, games_to_use_mcq_completed_method))
+    is_json_data_game = game_name_mask(df_score['game_name'], games_to_use_json_data_method)
+    is_mcq_completed_game = game_name_mask(df_score['game_name'], games_to_use_mcq_completed_method)
+    action_masks = action_name_masks(df_score['action_name'], 'game_completed', 'mcq_completed')
+    is_game_completed_action = action_masks['game_completed']
+    is_mcq_completed_action = action_masks['mcq_completed']
     
     # Filter for game_completed_data:
     # - Includes action_name containing 'game_completed' (matches "hybrid_game_completed" too)
@@ -2569,18 +2791,15 @@ def calculate_score_distribution_combined(df_score):
     # - Also includes mcq_completed records for jsonData games (to route them correctly)
     # - Excludes games that should use mcq_completed method
     game_completed_data = df_score[
-        ((df_score['action_name'].str.contains('game_completed', na=False, case=False) & 
-          ~df_score['action_name'].str.contains('mcq_completed', na=False, case=False)) |
-         (df_score['action_name'].str.contains('mcq_completed', na=False, case=False) &
-          is_json_data_game)) &
+        ((is_game_completed_action & ~is_mcq_completed_action) |
+         (is_mcq_completed_action & is_json_data_game)) &
         ~is_mcq_completed_game
-    ].copy()
+    ]
     
+    # Only mcq_completed_data gets a column (total_score) added, so only it is copied
     mcq_completed_data = df_score[
-        (df_score['action_name'].str.contains('mcq_completed', na=False, case=False) &
-         ~is_json_data_game) |
-        (df_score['action_name'].str.contains('game_completed', na=False, case=False) &
-         is_mcq_completed_game)
+        (is_mcq_completed_action & ~is_json_data_game) |
+        (is_game_completed_action & is_mcq_completed_game)
     ].copy()
     
     print(f"  - game_completed records: {len(game_completed_data)}")
@@ -2597,40 +2816,39 @@ def calculate_score_distribution_combined(df_score):
         print(f"    - Processing {game_completed_data['game_name'].nunique()} unique games")
         
         # Process each game individually to determine the correct score calculation method
-        for game_name in game_completed_data['game_name'].unique():
-            game_records = len(game_completed_data[game_completed_data['game_name'] == game_name])
-            print(f"    - Processing {game_name}: {game_records} records")
-            game_data = game_completed_data[game_completed_data['game_name'] == game_name].copy()
+        # One groupby pass splits the records by game (in order of first appearance)
+        for game_name, game_data in game_completed_data.groupby('game_name', sort=False, observed=True):
+            print(f"    - Processing {game_name}: {len(game_data)} records")
             
             # Try different score calculation methods and use the one that produces valid results
+            # Both candidates stay as standalone Series; only the chosen one is attached below
             # Method 1: correctSelections (for Relational Comparison, Quantity Comparison, etc.)
-            game_data['total_score_correct'] = game_data['custom_dimension_1'].apply(parse_custom_dimension_1_correct_selections)
-            correct_count = (game_data['total_score_correct'] > 0).sum()
+            total_score_correct = score_payloads(
+                game_data['custom_dimension_1'], 'correctSelections', parse_custom_dimension_1_correct_selections
+            )
+            correct_count = (total_score_correct > 0).sum()
             
             # Method 2: jsonData (for Revision games, Rhyming Words, Beginning Sound Ba/Ra/Na, etc.)
-            game_data['total_score_json'] = game_data['custom_dimension_1'].apply(parse_custom_dimension_1_json_data)
-            json_count = (game_data['total_score_json'] > 0).sum()
-            
-            # Games that should prefer jsonData method (same structure as Beginning Sound Ba/Ra/Na)
-            # These games have action_name like "beginning_sound_ma_cha_ba_hindi_hybrid_game_completed"
-            # Includes: Beginning Sound Ba/Ra/Na, Beginning Sounds Ma/Cha/Ba, Ka/Na/Ta, Ta/Va/Ga
-            games_prefer_json_data = ['Beginning Sound Ba/Ra/Na', 'Beginning Sounds Ma/Cha/Ba', 'Beginning Sounds Ka/Na/Ta', 'Beginning Sounds Ta/Va/Ga']
+            total_score_json = score_payloads(
+                game_data['custom_dimension_1'], 'isCorrect', parse_custom_dimension_1_json_data
+            )
+            json_count = (total_score_json > 0).sum()
             
-            # Debug: For Beginning Sounds games, check a sample record if no scores found
-            if game_name in games_prefer_json_data and json_count == 0 and correct_count == 0:
+            # Debug: For Beginning Sounds games (JSON_DATA_GAMES), check a sample record if no scores found
+            if game_name in JSON_DATA_GAMES and json_count == 0 and correct_count == 0:
                 # Try to debug by checking a sample record
-                sample_records = game_data[game_data['custom_dimension_1'].notna()].head(5)
-                if len(sample_records) > 0:
+                sample_values = game_data['custom_dimension_1'].dropna().head(5).tolist()
+                if sample_values:
                     print(f"    - DEBUG: Checking sample record structure for {game_name}...")
-                    for idx, row in sample_records.iterrows():
+                    for sample_value in sample_values:
                         try:
-                            raw_json_str = str(row['custom_dimension_1'])
+                            raw_json_str = str(sample_value)
                             # Try to clean the JSON string
                             # Remove any leading/trailing whitespace
                             raw_json_str = raw_json_str.strip()
                             # Check if it's already a dict (sometimes pandas stores it as dict)
-                            if isinstance(row['custom_dimension_1'], dict):
-                                sample_json = row['custom_dimension_1']
+                            if isinstance(sample_value, dict):
+                                sample_json = sample_value
                             else:
                                 # Clean malformed JSON before parsing
                                 raw_json_str = clean_malformed_json(raw_json_str)
@@ -2665,7 +2883,7 @@ def calculate_score_distribution_combined(df_score):
                         except json.JSONDecodeError as e:
                             print(f"      JSON Parse Error at position {e.pos}: {str(e)[:200]}")
                             # Show a snippet of the JSON around the error
-                            raw_str = str(row['custom_dimension_1'])
+                            raw_str = str(sample_value)
                             if len(raw_str) > 500:
                                 # Show area around error if possible
                                 error_pos = min(e.pos if hasattr(e, 'pos') else 0, len(raw_str))
@@ -2675,55 +2893,55 @@ def calculate_score_distribution_combined(df_score):
                             else:
                                 print(f"      Full JSON (first 500 chars): {raw_str[:500]}")
                             # Try to see if it's already a dict
-                            if isinstance(row['custom_dimension_1'], dict):
+                            if isinstance(sample_value, dict):
                                 print(f"      Note: custom_dimension_1 is already a dict, not a JSON string")
-                                sample_json = row['custom_dimension_1']
+                                sample_json = sample_value
                                 print(f"      Dict keys: {list(sample_json.keys())[:10]}")
                         except Exception as e:
                             print(f"      Error parsing sample: {type(e).__name__}: {str(e)[:200]}")
                             # Check if it's already a dict
-                            if isinstance(row['custom_dimension_1'], dict):
+                            if isinstance(sample_value, dict):
                                 print(f"      Note: custom_dimension_1 is already a dict")
                                 try:
-                                    sample_json = row['custom_dimension_1']
+                                    sample_json = sample_value
                                     print(f"      Dict keys: {list(sample_json.keys())[:10]}")
                                 except:
                                     pass
                         break  # Only check first sample
             
             # Choose the method that produces more valid scores
-            # For specific games, prefer jsonData if both methods work
+            # For the JSON_DATA_GAMES, prefer jsonData if both methods work
             # Use case-insensitive matching to handle any name variations
             game_name_normalized = str(game_name).strip().lower()
-            games_prefer_json_data_normalized = [g.strip().lower() for g in games_prefer_json_data]
-            if game_name_normalized in games_prefer_json_data_normalized and json_count > 0:
+            if game_name_normalized in JSON_DATA_GAMES_NORMALIZED and json_count > 0:
                 print(f"    - {game_name}: Using jsonData method (preferred for this game, {json_count} valid scores)")
-                game_data['total_score'] = game_data['total_score_json']
+                total_score = total_score_json
             elif correct_count >= json_count and correct_count > 0:
                 print(f"    - {game_name}: Using correctSelections method ({correct_count} valid scores)")
-                game_data['total_score'] = game_data['total_score_correct']
+                total_score = total_score_correct
             elif json_count > 0:
                 print(f"    - {game_name}: Using jsonData method ({json_count} valid scores)")
-                game_data['total_score'] = game_data['total_score_json']
+                total_score = total_score_json
             else:
                 print(f"    - {game_name}: No valid scores found, skipping")
                 continue
             
             # Filter out zero scores and add to combined data
-            game_data = game_data[game_data['total_score'] > 0]
-            if not game_data.empty:
-                # Select only needed columns for combined_df
+            keep = total_score > 0
+            if keep.any():
+                # Select only needed columns (and surviving rows) for combined_df in one step
                 cols_to_keep = ['game_name', 'idvisitor_converted', 'idvisit', 'total_score']
                 if has_language:
                     cols_to_keep.append('language')
                 if has_game_code:
                     cols_to_keep.append('game_code')
-                game_data = game_data[cols_to_keep].copy()
+                id_cols = [col for col in cols_to_keep if col != 'total_score']
+                game_data = game_data.loc[keep, id_cols].assign(total_score=total_score[keep])[cols_to_keep]
                 
                 valid_scores = len(game_data)
                 score_range = f"{game_data['total_score'].min()}-{game_data['total_score'].max()}"
                 print(f"      - Added {valid_scores} valid scores (range: {score_range})")
-                combined_df = pd.concat([combined_df, game_data], ignore_index=True)
+                score_parts.append(game_data)
             else:
                 print(f"      - No valid scores after filtering")
     
@@ -2738,30 +2956,32 @@ def calculate_score_distribution_combined(df_score):
         games_with_correct_option = []
         
         # Process each game individually to determine the correct parsing method
-        mcq_completed_data = mcq_completed_data.copy()
+        # mcq_completed_data is already its own copy (see the split above), so the column is added in place
         mcq_completed_data['total_score'] = 0
         
-        for game_name in sorted(mcq_completed_data['game_name'].unique()):
-            game_records = len(mcq_completed_data[mcq_completed_data['game_name'] == game_name])
-            print(f"    - Processing {game_name}: {game_records} records")
-            
-            game_mask = mcq_completed_data['game_name'] == game_name
+        # Positions of each game's rows, from one groupby pass instead of a mask per game
+        game_positions = mcq_completed_data.groupby('game_name', sort=True, observed=True).indices
+        total_score_col = mcq_completed_data.columns.get_loc('total_score')
+        
+        for game_name, positions in game_positions.items():
+            print(f"    - Processing {game_name}: {len(positions)} records")
+            game_payloads = mcq_completed_data['custom_dimension_1'].iloc[positions]
             
             # Choose the appropriate parsing method
             if game_name in games_with_correct_option:
                 print(f"      - {game_name}: Using correctOption method (chosenOption vs correctOption)")
-                mcq_completed_data.loc[game_mask, 'total_score'] = mcq_completed_data.loc[game_mask, 'custom_dimension_1'].apply(
-                    parse_custom_dimension_1_mcq_completed_with_correct_option
-                )
+                mcq_completed_data.iloc[positions, total_score_col] = score_payloads(
+                    game_payloads, 'chosenOption', parse_custom_dimension_1_mcq_completed_with_correct_option
+                ).to_numpy()
             else:
                 print(f"      - {game_name}: Using isCorrect method (options[chosenOption].isCorrect)")
-                mcq_completed_data.loc[game_mask, 'total_score'] = mcq_completed_data.loc[game_mask, 'custom_dimension_1'].apply(
-                    parse_custom_dimension_1_mcq_completed
-                )
+                mcq_completed_data.iloc[positions, total_score_col] = score_payloads(
+                    game_payloads, 'chosenOption', parse_custom_dimension_1_mcq_completed
+                ).to_numpy()
         
         # Log score parsing results by game
-        for game_name in sorted(mcq_completed_data['game_name'].unique()):
-            game_data = mcq_completed_data[mcq_completed_data['game_name'] == game_name]
+        for game_name, positions in game_positions.items():
+            game_data = mcq_completed_data.iloc[positions]
             valid_scores = (game_data['total_score'] > 0).sum()
             zero_scores = (game_data['total_score'] == 0).sum()
             if valid_scores > 0:
@@ -2785,22 +3005,25 @@ def calculate_score_distribution_combined(df_score):
                 cols_to_keep.append('language')
             if has_game_code:
                 cols_to_keep.append('game_code')
-            mcq_completed_data = mcq_completed_data[cols_to_keep].copy()
+            mcq_completed_data = mcq_completed_data[cols_to_keep]
             
             valid_scores_count = len(mcq_completed_data)
             score_range = f"{mcq_completed_data['total_score'].min()}-{mcq_completed_data['total_score'].max()}"
             print(f"    - Added {valid_scores_count} valid scores (range: {score_range})")
             print(f"    - Games with valid scores: {sorted(mcq_completed_data['game_name'].unique())}")
-            combined_df = pd.concat([combined_df, mcq_completed_data], ignore_index=True)
+            score_parts.append(mcq_completed_data)
         else:
             print(f"    - No valid scores after filtering")
     
     # Process action_level data - REMOVED: No longer used
     # Action level processing has been removed as scores_data.csv now only contains game_completed and mcq_completed
     
+    combined_df = pd.concat(score_parts, ignore_index=True) if score_parts else pd.DataFrame()
     if combined_df.empty:
         print("WARNING: No score distribution data found")
         return pd.DataFrame()
+    # Scores are small counts; the narrowest integer type keeps the groupby key compact
+    combined_df['total_score'] = pd.to_numeric(combined_df['total_score'], downcast='integer')
     
     print(f"\n  - Combined data summary:")
     print(f"    - Total records: {len(combined_df)}")
@@ -2811,7 +3034,7 @@ def calculate_score_distribution_combined(df_score):
     # Extract domain from game_code if it exists
     if has_game_code and 'game_code' in combined_df.columns:
         print("  - Extracting domain from game_code...")
-        combined_df['game_code'] = combined_df['game_code'].apply(extract_domain_from_game_code)
+        combined_df['game_code'] = map_distinct(combined_df['game_code'], extract_domain_from_game_code)
         print("  - Domain extraction complete")
     
     # Group by game and total score (and optionally language and game_code), then count distinct users
@@ -2842,16 +3065,19 @@ def calculate_score_distribution_combined(df_score):
     return score_distribution
 
 
-def _distinct_count_ignore_blank(series: pd.Series) -> int:
-    """Power BI DISTINCTCOUNTNOBLANK logic: ignore NULLs and empty strings"""
-    if series.dtype == object:
-        # For string columns: drop NULLs and empty strings
-        cleaned = series.dropna()
-        cleaned = cleaned[cleaned.astype(str).str.strip() != ""]
-    else:
-        # For numeric columns: just drop NULLs
-        cleaned = series.dropna()
-    return int(cleaned.nunique())
+def _distinct_counts_ignore_blank(df: pd.DataFrame, by) -> pd.DataFrame:
+    """Power BI DISTINCTCOUNTNOBLANK logic: per-group distinct users, visits and instances,
+    ignoring NULLs and empty strings
+
+    Blank strings in object columns are masked to NaN once for the whole frame, so a single
+    built-in groupby nunique() (which skips NaN) does the counting for every group.
+    """
+    ids = df[['idvisitor_converted', 'idvisit', 'idlink_va']].copy()
+    for col in ids.columns:
+        if ids[col].dtype == object:
+            ids[col] = ids[col].mask(ids[col].astype(str).str.strip() == "")
+    keys = [df[col] for col in ([by] if isinstance(by, str) else by)]
+    return ids.groupby(keys).nunique()
 
 
 def build_summary(df: pd.DataFrame) -> pd.DataFrame:
@@ -2869,7 +3095,7 @@ def build_summary(df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame()
     
     # Filter out NULL/None events before grouping
-    df_filtered = df[df['event'].notna()].copy()
+    df_filtered = df[df['event'].notna()]
     if df_filtered.empty:
         print("WARNING: No records with valid event values after filtering NULLs")
         return pd.DataFrame()
@@ -2879,11 +3105,7 @@ def build_summary(df: pd.DataFrame) -> pd.DataFrame:
     # Group by event and compute distinct counts
     # This ensures each user is counted only once per event (if they triggered it at least once)
     print("Calculating distinct counts per event...")
-    grouped = df_filtered.groupby('event').agg({
-        'idvisitor_converted': _distinct_count_ignore_blank,  # Unique users per event
-        'idvisit': _distinct_count_ignore_blank,              # Unique visits per event
-        'idlink_va': _distinct_count_ignore_blank,            # Unique instances per event (total count)
-    })
+    grouped = _distinct_counts_ignore_blank(df_filtered, 'event')
     
     # Log the counts for verification
     print("Event-wise distinct counts:")
@@ -2932,51 +3154,37 @@ def fetch_user_phone_mapping() -> pd.DataFrame:
     print("=" * 60)
     
     # Retry configuration
-    import time
     max_retries = 3
     retry_delay = 5  # seconds
     
     for attempt in range(1, max_retries + 1):
         try:
             print(f"\n  [ACTION] Connecting to REDSHIFT (Attempt {attempt}/{max_retries})...")
-            conn = psycopg2.connect(
-                host=REDSHIFT_HOST,
-                database=REDSHIFT_DATABASE,
-                port=REDSHIFT_PORT,
-                user=REDSHIFT_USER,
-                password=REDSHIFT_PASSWORD,
-                connect_timeout=60,
-                keepalives=1,
-                keepalives_idle=30,
-                keepalives_interval=10,
-                keepalives_count=5
-            )
-            
-            # Set statement timeout to 30 minutes for large queries
-            with conn.cursor() as cur:
-                cur.execute("SET statement_timeout = '1800000'")  # 30 minutes in milliseconds
-                conn.commit()
+            with redshift_connection() as conn:
+                # Set statement timeout to 30 minutes for large queries
+                with conn.cursor() as cur:
+                    cur.execute("SET statement_timeout = '1800000'")  # 30 minutes in milliseconds
+                    conn.commit()
             
-            print(f"  ✓ Successfully connected to REDSHIFT")
+                print(f"  ✓ Successfully connected to REDSHIFT")
             
-            # Fetch user phone mapping
-            print(f"  [ACTION] Executing user phone mapping query...")
-            df_mapping = pd.read_sql(USER_PHONE_QUERY, conn)
+                # Fetch user phone mapping
+                print(f"  [ACTION] Executing user phone mapping query...")
+                df_mapping = pd.read_sql(USER_PHONE_QUERY, conn)
             
-            # Convert hex to int
-            if 'idvisitor_hex' in df_mapping.columns:
-                df_mapping = convert_hex_to_int(df_mapping, 'idvisitor_hex', 'idvisitor_converted')
+                # Convert hex to int
+                if 'idvisitor_hex' in df_mapping.columns:
+                    df_mapping = convert_hex_to_int(df_mapping, 'idvisitor_hex', 'idvisitor_converted')
             
-            # Clean phone numbers (remove whitespace, convert to string)
-            if 'phone' in df_mapping.columns:
-                df_mapping['phone'] = df_mapping['phone'].astype(str).str.strip()
-                df_mapping = df_mapping[df_mapping['phone'] != '']
-                df_mapping = df_mapping[df_mapping['phone'] != 'None']
-                df_mapping = df_mapping[df_mapping['phone'].notna()]
+                # Clean phone numbers (remove whitespace, convert to string)
+                if 'phone' in df_mapping.columns:
+                    df_mapping['phone'] = df_mapping['phone'].astype(str).str.strip()
+                    df_mapping = df_mapping[df_mapping['phone'] != '']
+                    df_mapping = df_mapping[df_mapping['phone'] != 'None']
+                    df_mapping = df_mapping[df_mapping['phone'].notna()]
             
-            print(f"  ✓ Query returned {len(df_mapping)} user-phone mappings")
+                print(f"  ✓ Query returned {len(df_mapping)} user-phone mappings")
             
-            conn.close()
             print(f"  ✓ Connection closed")
             
             return df_mapping
@@ -3021,7 +3229,7 @@ def build_summary_with_filters(df: pd.DataFrame) -> pd.DataFrame:
         return pd.DataFrame()
     
     # Filter out NULL/None events before grouping
-    df_filtered = df[df['event'].notna()].copy()
+    df_filtered = df[df['event'].notna()]
     if df_filtered.empty:
         print("WARNING: No records with valid event values after filtering NULLs")
         return pd.DataFrame()
@@ -3063,11 +3271,7 @@ def build_summary_with_filters(df: pd.DataFrame) -> pd.DataFrame:
     
     # 1. Overall summary (domain='All', language='All')
     print("Calculating overall summary (domain='All', language='All')...")
-    overall = df_filtered.groupby('event').agg({
-        'idvisitor_converted': _distinct_count_ignore_blank,
-        'idvisit': _distinct_count_ignore_blank,
-        'idlink_va': _distinct_count_ignore_blank,
-    })
+    overall = _distinct_counts_ignore_blank(df_filtered, 'event')
     overall.columns = ['Users', 'Visits', 'Instances']
     overall = overall.reset_index()
     overall.rename(columns={'event': 'Event'}, inplace=True)
@@ -3081,11 +3285,7 @@ def build_summary_with_filters(df: pd.DataFrame) -> pd.DataFrame:
     # 2. By domain only (language='All')
     if 'domain' in df_filtered.columns:
         print("Calculating summary by domain (language='All')...")
-        by_domain = df_filtered.groupby(['event', 'domain']).agg({
-            'idvisitor_converted': _distinct_count_ignore_blank,
-            'idvisit': _distinct_count_ignore_blank,
-            'idlink_va': _distinct_count_ignore_blank,
-        })
+        by_domain = _distinct_counts_ignore_blank(df_filtered, ['event', 'domain'])
         by_domain.columns = ['Users', 'Visits', 'Instances']
         by_domain = by_domain.reset_index()
         by_domain.rename(columns={'event': 'Event'}, inplace=True)
@@ -3100,11 +3300,7 @@ def build_summary_with_filters(df: pd.DataFrame) -> pd.DataFrame:
     # 3. By language only (domain='All')
     if 'language' in df_filtered.columns:
         print("Calculating summary by language (domain='All')...")
-        by_language = df_filtered.groupby(['event', 'language']).agg({
-            'idvisitor_converted': _distinct_count_ignore_blank,
-            'idvisit': _distinct_count_ignore_blank,
-            'idlink_va': _distinct_count_ignore_blank,
-        })
+        by_language = _distinct_counts_ignore_blank(df_filtered, ['event', 'language'])
         by_language.columns = ['Users', 'Visits', 'Instances']
         by_language = by_language.reset_index()
         by_language.rename(columns={'event': 'Event'}, inplace=True)
@@ -3119,11 +3315,7 @@ def build_summary_with_filters(df: pd.DataFrame) -> pd.DataFrame:
     # 4. By both domain and language
     if 'domain' in df_filtered.columns and 'language' in df_filtered.columns:
         print("Calculating summary by domain and language...")
-        by_both = df_filtered.groupby(['event', 'domain', 'language']).agg({
-            'idvisitor_converted': _distinct_count_ignore_blank,
-            'idvisit': _distinct_count_ignore_blank,
-            'idlink_va': _distinct_count_ignore_blank,
-        })
+        by_both = _distinct_counts_ignore_blank(df_filtered, ['event', 'domain', 'language'])
         by_both.columns = ['Users', 'Visits', 'Instances']
         by_both = by_both.reset_index()
         by_both.rename(columns={'event': 'Event'}, inplace=True)
@@ -3177,11 +3369,11 @@ def preprocess_time_series_data_instances(df_instances: pd.DataFrame) -> pd.Data
         return pd.DataFrame(columns=['period_label', 'game_name', 'instances', 'period_type'])
     
     # Convert created_at to datetime
-    df_instances['created_at'] = pd.to_datetime(df_instances['created_at'])
+    df_instances['created_at'] = parse_timestamps(df_instances['created_at'])
     
     # Filter data to only include records from July 2nd, 2025 onwards
     july_2_2025 = pd.Timestamp('2025-07-02')
-    df_instances = df_instances[df_instances['created_at'] >= july_2_2025].copy()
+    df_instances = df_instances[df_instances['created_at'] >= july_2_2025]
     print(f"Filtered instances data to July 2nd, 2025 onwards: {len(df_instances)} records")
     
     if df_instances.empty:
@@ -3192,82 +3384,20 @@ def preprocess_time_series_data_instances(df_instances: pd.DataFrame) -> pd.Data
     unique_games = df_instances['game_name'].unique()
     print(f"Processing time series for {len(unique_games)} games")
     
-    # Prepare time series data for different periods
-    time_series_data = []
+    # Derive each period's labels once for all rows
+    period_labels = time_period_labels(df_instances['created_at'])
     
-    # Process each game individually + "All Games" combined
-    games_to_process = list(unique_games) + ['All Games']
+    # One groupby per period covers every game, and a second one gives the "All Games" totals
+    time_series_parts = []
+    for period_type, labels in period_labels.items():
+        by_game = df_instances.groupby([labels, 'game_name'])['id'].nunique().reset_index(name='instances')
+        all_games = df_instances.groupby(labels)['id'].nunique().reset_index(name='instances')
+        all_games['game_name'] = 'All Games'
+        for period_agg in (by_game, all_games):
+            period_agg['period_type'] = period_type
+            time_series_parts.append(period_agg[['period_label', 'game_name', 'instances', 'period_type']])
     
-    for game_name in games_to_process:
-        if game_name == 'All Games':
-            game_df = df_instances.copy()
-        else:
-            game_df = df_instances[df_instances['game_name'] == game_name].copy()
-        
-        if game_df.empty:
-            continue
-            
-        print(f"  Processing time series for: {game_name}")
-    
-        # Daily aggregation - format: YYYY-MM-DD
-        game_df['date'] = game_df['created_at'].dt.date
-        if game_name == 'All Games':
-            # For "All Games", aggregate across all games (don't group by game_name)
-            daily_agg = game_df.groupby('date')['id'].nunique().reset_index()
-            daily_agg.columns = ['period_label', 'instances']
-            daily_agg['period_label'] = daily_agg['period_label'].astype(str)
-            daily_agg['game_name'] = 'All Games'
-        else:
-            # For individual games, group by date and game_name
-            daily_agg = game_df.groupby(['date', 'game_name'])['id'].nunique().reset_index()
-            daily_agg.columns = ['period_label', 'game_name', 'instances']
-            daily_agg['period_label'] = daily_agg['period_label'].astype(str)
-        daily_agg['period_type'] = 'Day'
-        time_series_data.extend(daily_agg.to_dict('records'))
-        
-        # Monthly aggregation - format: YYYY_MM (underscore, not hyphen)
-        game_df['year'] = game_df['created_at'].dt.year
-        game_df['month'] = game_df['created_at'].dt.month
-        game_df['period_label'] = game_df['year'].astype(str) + '_' + game_df['month'].astype(str).str.zfill(2)
-        if game_name == 'All Games':
-            # For "All Games", aggregate across all games
-            monthly_agg = game_df.groupby('period_label')['id'].nunique().reset_index()
-            monthly_agg.columns = ['period_label', 'instances']
-            monthly_agg['game_name'] = 'All Games'
-        else:
-            # For individual games, group by period_label and game_name
-            monthly_agg = game_df.groupby(['period_label', 'game_name'])['id'].nunique().reset_index()
-            monthly_agg.columns = ['period_label', 'game_name', 'instances']
-        monthly_agg['period_type'] = 'Month'
-        time_series_data.extend(monthly_agg.to_dict('records'))
-            
-        # Weekly aggregation - starts from Wednesday, format: YYYY_WW
-        # Reset game_df to original for weekly processing
-        if game_name == 'All Games':
-            game_df = df_instances.copy()
-        else:
-            game_df = df_instances[df_instances['game_name'] == game_name].copy()
-        # Shift date by -2 days before calculating week number (so Wednesday becomes Monday)
-        game_df['shifted_date'] = game_df['created_at'] - pd.Timedelta(days=2)
-        game_df['year'] = game_df['shifted_date'].dt.year
-        # Use strftime('%W') which calculates week number with Monday as first day of week
-        # This matches MySQL's WEEK() function behavior
-        game_df['week'] = game_df['shifted_date'].dt.strftime('%W').astype(int)
-        game_df['period_label'] = game_df['year'].astype(str) + '_' + game_df['week'].astype(str).str.zfill(2)
-        
-        if game_name == 'All Games':
-            # For "All Games", aggregate across all games
-            weekly_agg = game_df.groupby('period_label')['id'].nunique().reset_index()
-            weekly_agg.columns = ['period_label', 'instances']
-            weekly_agg['game_name'] = 'All Games'
-        else:
-            # For individual games, group by period_label and game_name
-            weekly_agg = game_df.groupby(['period_label', 'game_name'])['id'].nunique().reset_index()
-            weekly_agg.columns = ['period_label', 'game_name', 'instances']
-        weekly_agg['period_type'] = 'Week'
-        time_series_data.extend(weekly_agg.to_dict('records'))
-            
-    time_series_df = pd.DataFrame(time_series_data)
+    time_series_df = pd.concat(time_series_parts, ignore_index=True)
     print(f"SUCCESS: Time series instances data: {len(time_series_df)} records")
     print(f"  Daily records: {len(time_series_df[time_series_df['period_type'] == 'Day'])}")
     print(f"  Weekly records: {len(time_series_df[time_series_df['period_type'] == 'Week'])}")
@@ -3284,22 +3414,22 @@ def preprocess_time_series_data_visits_users(df_visits_users: pd.DataFrame) -> p
     
     if df_visits_users.empty:
         print("WARNING: No time series data to process")
-        return pd.DataFrame(columns=['period_label', 'game_name', 'metric', 'event', 'count', 'period_type', 'game_code', 'language'])
+        return empty_frame(TIME_SERIES_OUTPUT_DTYPES)
     
     # Convert server_time to datetime
-    df_visits_users['server_time'] = pd.to_datetime(df_visits_users['server_time'])
+    df_visits_users['server_time'] = parse_timestamps(df_visits_users['server_time'])
     
-    # Filter out NULL events
-    df_visits_users = df_visits_users[df_visits_users['event'].notna()].copy()
-    
-    # Filter data to only include records from January 3rd, 2026 onwards (TPD Games Dashboard)
+    # Filter out NULL events and only include records from January 3rd, 2026 onwards (TPD Games Dashboard)
+    # One combined mask, one copy - the columns below are rewritten in place
     jan_3_2026 = pd.Timestamp('2026-01-03')
-    df_visits_users = df_visits_users[df_visits_users['server_time'] >= jan_3_2026].copy()
+    df_visits_users = df_visits_users.loc[
+        df_visits_users['event'].notna() & (df_visits_users['server_time'] >= jan_3_2026)
+    ].copy()
     print(f"Filtered time series data to January 3rd, 2026 onwards: {len(df_visits_users)} records")
     
     if df_visits_users.empty:
         print("WARNING: No time series data after filtering")
-        return pd.DataFrame(columns=['period_label', 'game_name', 'metric', 'event', 'count', 'period_type', 'game_code', 'language'])
+        return empty_frame(TIME_SERIES_OUTPUT_DTYPES)
     
     # Check what columns we have
     print(f"  [INFO] Available columns after query: {list(df_visits_users.columns)}")
@@ -3307,11 +3437,13 @@ def preprocess_time_series_data_visits_users(df_visits_users: pd.DataFrame) -> p
     # Transform language: if contains "mr-IN" then "mr", else "hi"
     if 'language' in df_visits_users.columns:
         print("  [ACTION] Transforming language column...")
-        print(f"  [DEBUG] Language column sample values: {df_visits_users['language'].head(10).tolist()}")
-        df_visits_users['language'] = df_visits_users['language'].apply(
-            lambda x: 'mr' if pd.notna(x) and 'mr-IN' in str(x) else 'hi'
+        if _DEBUG:
+            print(f"  [DEBUG] Language column sample values: {df_visits_users['language'].head(10).tolist()}")
+        df_visits_users['language'] = map_distinct(
+            df_visits_users['language'], lambda x: 'mr' if pd.notna(x) and 'mr-IN' in str(x) else 'hi'
         )
-        print(f"  [DEBUG] Language after transformation sample: {df_visits_users['language'].head(10).tolist()}")
+        if _DEBUG:
+            print(f"  [DEBUG] Language after transformation sample: {df_visits_users['language'].head(10).tolist()}")
         print("  [OK] Language transformation complete")
     else:
         print("  [WARNING] Language column not found in time series data")
@@ -3321,9 +3453,11 @@ def preprocess_time_series_data_visits_users(df_visits_users: pd.DataFrame) -> p
     # The TPD query doesn't return game_code, only game_name
     if 'game_code' in df_visits_users.columns:
         print("  [ACTION] Extracting domain from game_code...")
-        print(f"  [DEBUG] Game code column sample values: {df_visits_users['game_code'].head(10).tolist()}")
-        df_visits_users['game_code'] = df_visits_users['game_code'].apply(extract_domain_from_game_code)
-        print(f"  [DEBUG] Game code after extraction sample: {df_visits_users['game_code'].head(10).tolist()}")
+        if _DEBUG:
+            print(f"  [DEBUG] Game code column sample values: {df_visits_users['game_code'].head(10).tolist()}")
+        df_visits_users['game_code'] = map_distinct(df_visits_users['game_code'], extract_domain_from_game_code)
+        if _DEBUG:
+            print(f"  [DEBUG] Game code after extraction sample: {df_visits_users['game_code'].head(10).tolist()}")
         print("  [OK] Game code extraction complete")
     else:
         print("  [INFO] Game code column not found in TPD time series data (expected - TPD query doesn't return game_code)")
@@ -3342,150 +3476,65 @@ def preprocess_time_series_data_visits_users(df_visits_users: pd.DataFrame) -> p
     unique_games = df_visits_users['game_name'].unique()
     print(f"Processing time series for {len(unique_games)} games")
     
-    # Prepare time series data for different periods
-    time_series_data = []
-    
-    # Process each game individually + "All Games" combined
-    games_to_process = list(unique_games) + ['All Games']
-    
-    for game_name in games_to_process:
-        if game_name == 'All Games':
-            game_df = df_visits_users.copy()
-        else:
-            game_df = df_visits_users[df_visits_users['game_name'] == game_name].copy()
-        
-        if game_df.empty:
-            continue
-            
-        print(f"  Processing time series for: {game_name}")
-    
-        # Daily aggregation - format: YYYY-MM-DD
-        game_df['date'] = game_df['server_time'].dt.date
-        for period_type, group_col in [('Day', 'date'), ('Month', None), ('Week', None)]:
-            # Build group_by_cols including game_code and language
-            base_group_cols = ['event', 'game_code', 'language']
-            if period_type == 'Day':
-                if game_name == 'All Games':
-                    group_by_cols = ['date'] + base_group_cols
-                else:
-                    group_by_cols = ['date', 'game_name'] + base_group_cols
-            elif period_type == 'Month':
-                game_df['year'] = game_df['server_time'].dt.year
-                game_df['month'] = game_df['server_time'].dt.month
-                game_df['period_label'] = game_df['year'].astype(str) + '_' + game_df['month'].astype(str).str.zfill(2)
-                if game_name == 'All Games':
-                    group_by_cols = ['period_label'] + base_group_cols
-                else:
-                    group_by_cols = ['period_label', 'game_name'] + base_group_cols
-            else:  # Week
-                game_df['shifted_date'] = game_df['server_time'] - pd.Timedelta(days=2)
-                game_df['year'] = game_df['shifted_date'].dt.year
-                game_df['week'] = game_df['shifted_date'].dt.strftime('%W').astype(int)
-                game_df['period_label'] = game_df['year'].astype(str) + '_' + game_df['week'].astype(str).str.zfill(2)
-                if game_name == 'All Games':
-                    group_by_cols = ['period_label'] + base_group_cols
-                else:
-                    group_by_cols = ['period_label', 'game_name'] + base_group_cols
-            
-            # Aggregate by event type, game_code, and language for each metric
-            agg_df = game_df.groupby(group_by_cols).agg({
-                'idlink_va': 'nunique',      # Instances
-                'idvisit': 'nunique',        # Visits
-                'idvisitor_converted': 'nunique'  # Users
-            }).reset_index()
-            
-            # Rename the aggregated columns to match our metric names
-            agg_df = agg_df.rename(columns={
-                'idlink_va': 'instances',
-                'idvisit': 'visits',
-                'idvisitor_converted': 'users'
-            })
-            
-            # Set period_label for Day period
-            if period_type == 'Day':
-                agg_df['period_label'] = agg_df['date'].astype(str)
-                agg_df = agg_df.drop(columns=['date'])
-            
-            # Add game_name if it's not in the groupby (for All Games)
-            if 'game_name' not in agg_df.columns:
-                agg_df['game_name'] = game_name
-            
-            # Ensure game_code and language columns exist
-            if 'game_code' not in agg_df.columns:
-                agg_df['game_code'] = None
-            else:
-                # Keep None values as None (don't fill with 'Unknown')
-                agg_df['game_code'] = agg_df['game_code'].where(pd.notna(agg_df['game_code']), None)
-            
-            if 'language' not in agg_df.columns:
-                agg_df['language'] = None
-            else:
-                # Keep None values as None (don't fill with 'Unknown')
-                agg_df['language'] = agg_df['language'].where(pd.notna(agg_df['language']), None)
-            
-            # Debug: Check what columns we have before reshaping
-            print(f"    [DEBUG] Aggregated columns after rename: {list(agg_df.columns)}")
-            print(f"    [DEBUG] Sample game_code values: {agg_df['game_code'].head(5).tolist() if 'game_code' in agg_df.columns else 'N/A'}")
-            print(f"    [DEBUG] Sample language values: {agg_df['language'].head(5).tolist() if 'language' in agg_df.columns else 'N/A'}")
-            
+    # game_name and event repeat a handful of values on every row; as categoricals the groupby keys
+    # below are small integer codes (observed=True keeps unused category combinations out)
+    df_visits_users['game_name'] = df_visits_users['game_name'].astype('category')
+    df_visits_users['event'] = df_visits_users['event'].astype('category')
+    
+    # Derive each period's labels once for all rows
+    period_labels = time_period_labels(df_visits_users['server_time'])
+    
+    # Distinct ids counted for each metric, aggregated straight into the metric names
+    # idlink_va is one row per action, so unless the query produced duplicates the distinct
+    # instances are just the non-null row count, which needs no hash table per group
+    instances_agg = 'count' if df_visits_users['idlink_va'].is_unique else 'nunique'
+    metric_aggs = {
+        'instances': ('idlink_va', instances_agg),
+        'visits': ('idvisit', 'nunique'),
+        'users': ('idvisitor_converted', 'nunique')
+    }
+    base_group_cols = ['event', 'game_code', 'language']
+    id_cols = ['period_label', 'game_name', 'event', 'game_code', 'language']
+    final_cols = id_cols + ['count', 'metric', 'period_type']
+    
+    # One groupby per period covers every game, and a second one gives the "All Games" totals
+    # (distinct visits/users are not additive across games, so they cannot be summed from by_game;
+    # rows with a missing game_code or language drop out of both, as groupby keys)
+    # When instances are plain row counts they are additive, so the Week/Month instances are
+    # rolled up from the (much smaller) Day aggregates and only visits/users go back to the raw rows
+    roll_up_instances = instances_agg == 'count'
+    distinct_aggs = {metric: agg for metric, agg in metric_aggs.items() if metric != 'instances'}
+    
+    def rolled_up_instances(day_agg: pd.DataFrame, period_type: str) -> pd.Series:
+        day_labels = pd.to_datetime(day_agg.index.get_level_values('period_label'), format='%Y-%m-%d')
+        coarse_labels = time_period_labels(pd.Series(day_labels))[period_type]
+        keys = [pd.Index(coarse_labels.to_numpy(), name='period_label')] + [
+            day_agg.index.get_level_values(name) for name in day_agg.index.names[1:]
+        ]
+        return day_agg['instances'].groupby(keys, sort=False, observed=True).sum()
+    
+    time_series_parts = []
+    day_aggs = {}
+    for period_type, labels in period_labels.items():
+        period_aggs = metric_aggs if period_type == 'Day' or not roll_up_instances else distinct_aggs
+        by_game = df_visits_users.groupby([labels, 'game_name'] + base_group_cols, sort=False, observed=True).agg(**period_aggs)
+        all_games = df_visits_users.groupby([labels] + base_group_cols, sort=False, observed=True).agg(**period_aggs)
+        if period_type == 'Day':
+            day_aggs = {'by_game': by_game, 'all_games': all_games}
+        elif roll_up_instances:
+            for period_agg, day_agg in ((by_game, day_aggs['by_game']), (all_games, day_aggs['all_games'])):
+                instances = rolled_up_instances(day_agg, period_type).reindex(period_agg.index)
+                period_agg.insert(0, 'instances', instances.to_numpy())
+        all_games = all_games.reset_index().assign(game_name='All Games')
+        for period_agg in (by_game.reset_index(), all_games):
             # Reshape to long format: one row per metric-event combination
-            for metric in ['instances', 'visits', 'users']:
-                # Check if the metric column exists in agg_df
-                if metric not in agg_df.columns:
-                    print(f"    [WARNING] Metric '{metric}' not found in aggregated data, skipping...")
-                    print(f"    [DEBUG] Available columns in agg_df: {list(agg_df.columns)}")
-                    continue
-                
-                # Select the columns we need (including the metric column)
-                base_cols = ['period_label', 'game_name', 'event', 'game_code', 'language']
-                # Only include columns that exist in agg_df
-                cols_to_select = [col for col in base_cols if col in agg_df.columns] + [metric]
-                print(f"    [DEBUG] Selecting columns for metric '{metric}': {cols_to_select}")
-                metric_df = agg_df[cols_to_select].copy()
-                print(f"    [DEBUG] Columns after selection: {list(metric_df.columns)}")
-                
-                # Rename the metric column to 'count'
-                if metric in metric_df.columns:
-                    metric_df = metric_df.rename(columns={metric: 'count'})
-                    print(f"    [DEBUG] Columns after rename: {list(metric_df.columns)}")
-                else:
-                    print(f"    [ERROR] Metric '{metric}' not in metric_df after selection!")
-                    continue
-                
-                # Add any missing columns (should already be there from groupby, but just in case)
-                if 'game_code' not in metric_df.columns:
-                    metric_df['game_code'] = None
-                if 'language' not in metric_df.columns:
-                    metric_df['language'] = None
-                if 'game_name' not in metric_df.columns:
-                    metric_df['game_name'] = game_name
-                if 'period_label' not in metric_df.columns:
-                    metric_df['period_label'] = None
-                if 'event' not in metric_df.columns:
-                    metric_df['event'] = None
-                
-                # Ensure all required columns exist and in correct order
-                # After rename, 'count' should exist, but verify
-                if 'count' not in metric_df.columns:
-                    print(f"    [ERROR] 'count' column not found after renaming '{metric}'")
-                    continue
-                
-                # Reorder columns to ensure consistent structure
-                final_cols = ['period_label', 'game_name', 'event', 'game_code', 'language', 'count']
-                # Make sure all columns exist (they should after the checks above)
-                missing_cols = [col for col in final_cols if col not in metric_df.columns]
-                if missing_cols:
-                    print(f"    [WARNING] Missing columns: {missing_cols}, adding with None values")
-                    for col in missing_cols:
-                        metric_df[col] = None
-                
-                metric_df = metric_df[final_cols]
-                
-                metric_df['metric'] = metric
-                metric_df['period_type'] = period_type
-                time_series_data.extend(metric_df.to_dict('records'))
+            long_df = period_agg.melt(
+                id_vars=id_cols, value_vars=list(metric_aggs), var_name='metric', value_name='count'
+            )
+            long_df['period_type'] = period_type
+            time_series_parts.append(long_df[final_cols])
     
-    time_series_df = pd.DataFrame(time_series_data)
+    time_series_df = pd.concat(time_series_parts, ignore_index=True)
     print(f"SUCCESS: Time series data (with Started/Completed): {len(time_series_df)} records")
     print(f"  Daily records: {len(time_series_df[time_series_df['period_type'] == 'Day'])}")
     print(f"  Weekly records: {len(time_series_df[time_series_df['period_type'] == 'Week'])}")
@@ -3499,12 +3548,12 @@ def preprocess_time_series_data_visits_users(df_visits_users: pd.DataFrame) -> p
     time_series_df_clean = time_series_df[
         (time_series_df['game_code'].notna()) & 
         (time_series_df['language'].notna())
-    ].copy()
+    ]
     
     if not time_series_df_clean.empty:
         # 1. Overall summary (game_code='All', language='All')
         print("    [1/4] Calculating overall totals (game_code='All', language='All')...")
-        overall = time_series_df_clean.groupby(['period_label', 'game_name', 'metric', 'event', 'period_type']).agg({
+        overall = time_series_df_clean.groupby(['period_label', 'game_name', 'metric', 'event', 'period_type'], sort=False, observed=True).agg({
             'count': 'sum'
         }).reset_index()
         overall['game_code'] = 'All'
@@ -3515,7 +3564,7 @@ def preprocess_time_series_data_visits_users(df_visits_users: pd.DataFrame) -> p
         # 2. By game_code only (language='All')
         if 'game_code' in time_series_df_clean.columns:
             print("    [2/4] Calculating by game_code (language='All')...")
-            by_game_code = time_series_df_clean.groupby(['period_label', 'game_name', 'metric', 'event', 'period_type', 'game_code']).agg({
+            by_game_code = time_series_df_clean.groupby(['period_label', 'game_name', 'metric', 'event', 'period_type', 'game_code'], sort=False, observed=True).agg({
                 'count': 'sum'
             }).reset_index()
             by_game_code['language'] = 'All'
@@ -3525,7 +3574,7 @@ def preprocess_time_series_data_visits_users(df_visits_users: pd.DataFrame) -> p
         # 3. By language only (game_code='All')
         if 'language' in time_series_df_clean.columns:
             print("    [3/4] Calculating by language (game_code='All')...")
-            by_language = time_series_df_clean.groupby(['period_label', 'game_name', 'metric', 'event', 'period_type', 'language']).agg({
+            by_language = time_series_df_clean.groupby(['period_label', 'game_name', 'metric', 'event', 'period_type', 'language'], sort=False, observed=True).agg({
                 'count': 'sum'
             }).reset_index()
             by_language['game_code'] = 'All'
@@ -3534,29 +3583,19 @@ def preprocess_time_series_data_visits_users(df_visits_users: pd.DataFrame) -> p
         
         # 4. By both game_code and language (already exists in time_series_df_clean)
         print("    [4/4] Using existing game_code+language combinations...")
-        by_both = time_series_df_clean.copy()
+        by_both = time_series_df_clean
         all_combinations.append(by_both)
         print(f"      Using {len(by_both):,} existing game_code+language records")
         
         # Combine all combinations
         if all_combinations:
             # Ensure all dataframes have the same columns in the same order
+            # (a missing game_code/language column means that level was rolled up to 'All')
             base_cols = ['period_label', 'game_name', 'event', 'game_code', 'language', 'count', 'metric', 'period_type']
-            reordered_combinations = []
-            for df in all_combinations:
-                # Only include columns that exist
-                available_cols = [col for col in base_cols if col in df.columns]
-                reordered_df = df[available_cols].copy()
-                # Add missing columns with default values
-                for col in base_cols:
-                    if col not in reordered_df.columns:
-                        if col == 'game_code':
-                            reordered_df['game_code'] = 'All'
-                        elif col == 'language':
-                            reordered_df['language'] = 'All'
-                # Reorder to match base_cols
-                reordered_df = reordered_df[base_cols]
-                reordered_combinations.append(reordered_df)
+            reordered_combinations = [
+                df.assign(**{col: 'All' for col in ('game_code', 'language') if col not in df.columns})[base_cols]
+                for df in all_combinations
+            ]
             
             time_series_df = pd.concat(reordered_combinations, ignore_index=True)
             print(f"  [OK] Combined all combinations: {len(time_series_df):,} total records")
@@ -3567,16 +3606,18 @@ def preprocess_time_series_data_visits_users(df_visits_users: pd.DataFrame) -> p
     
     # Debug: Check game_code and language values in final output
     if 'game_code' in time_series_df.columns:
-        unique_game_codes = time_series_df['game_code'].unique()
-        print(f"  [DEBUG] Unique game_code values in output: {sorted([str(x) for x in unique_game_codes if x is not None])}")
-        print(f"  [DEBUG] Game_code value counts: {time_series_df['game_code'].value_counts().head(10).to_dict()}")
+        if _DEBUG:
+            unique_game_codes = time_series_df['game_code'].unique()
+            print(f"  [DEBUG] Unique game_code values in output: {sorted([str(x) for x in unique_game_codes if x is not None])}")
+            print(f"  [DEBUG] Game_code value counts: {time_series_df['game_code'].value_counts().head(10).to_dict()}")
     else:
         print(f"  [WARNING] game_code column not in final output!")
     
     if 'language' in time_series_df.columns:
-        unique_languages = time_series_df['language'].unique()
-        print(f"  [DEBUG] Unique language values in output: {sorted([str(x) for x in unique_languages if x is not None])}")
-        print(f"  [DEBUG] Language value counts: {time_series_df['language'].value_counts().head(10).to_dict()}")
+        if _DEBUG:
+            unique_languages = time_series_df['language'].unique()
+            print(f"  [DEBUG] Unique language values in output: {sorted([str(x) for x in unique_languages if x is not None])}")
+            print(f"  [DEBUG] Language value counts: {time_series_df['language'].value_counts().head(10).to_dict()}")
     else:
         print(f"  [WARNING] language column not in final output!")
     
@@ -3601,18 +3642,6 @@ def fetch_hybrid_repeatability_data() -> pd.DataFrame:
     print(f"  User: {REDSHIFT_USER}")
     
     try:
-        # Connect to Redshift
-        print(f"  [ACTION] Establishing connection...")
-        connection = psycopg2.connect(
-            host=REDSHIFT_HOST,
-            database=REDSHIFT_DATABASE,
-            port=REDSHIFT_PORT,
-            user=REDSHIFT_USER,
-            password=REDSHIFT_PASSWORD,
-            connect_timeout=30
-        )
-        print(f"  ✓ Successfully connected to Redshift")
-        
         # TPD Games Dashboard - Repeatability Query
         # Filters: custom_dimension_2 IN ('149','150','160','166')
         # Date: server_time >= '2025-01-03' (with timezone adjustment)
@@ -3640,13 +3669,21 @@ def fetch_hybrid_repeatability_data() -> pd.DataFrame:
           AND mllva.custom_dimension_2 != ''
         """
         
-        print(f"  [DEBUG] Query to execute:")
-        print(f"  {repeatability_query.strip()}")
+        if _DEBUG:
+            print(f"  [DEBUG] Query to execute:")
+            print(f"  {repeatability_query.strip()}")
         print(f"  [ACTION] Executing SQL query...")
-        hybrid_df = pd.read_sql(repeatability_query, connection)
-        connection.close()
+        # connectorx when installed, else stream through a server-side cursor instead of
+        # materializing every row as Python tuples first
+        hybrid_df = read_sql_connectorx(repeatability_query)
+        if hybrid_df is None:
+            # Only the psycopg2 fallback needs a pooled connection
+            print(f"  [ACTION] Establishing connection...")
+            with redshift_connection() as connection:
+                print(f"  ✓ Successfully connected to Redshift")
+                hybrid_df = read_sql_chunked(connection, repeatability_query)
+            print(f"  ✓ Connection closed")
         print(f"  ✓ Query executed successfully")
-        print(f"  ✓ Connection closed")
         
         if hybrid_df.empty:
             print(f"\n[WARNING] No data found from Redshift query")
@@ -3691,7 +3728,6 @@ def fetch_hybrid_repeatability_data() -> pd.DataFrame:
                     print(f"    This might indicate a conversion issue")
             except Exception as e:
                 print(f"  ERROR: Could not convert idvisitor_hex to numeric: {str(e)}")
-                import traceback
                 traceback.print_exc()
                 return pd.DataFrame()
         
@@ -3714,27 +3750,36 @@ def fetch_hybrid_repeatability_data() -> pd.DataFrame:
         print(f"\n[STEP 4] Calculating repeatability metrics...")
         # Group by user and count distinct games played
         print(f"  [ACTION] Grouping by user and counting distinct games...")
-        user_game_counts = hybrid_df.groupby('idvisitor_converted')['game_name'].nunique().reset_index()
+        # Dropping duplicate (user, game) pairs first turns the distinct count into a plain count
+        # (count skips a missing game_name exactly like nunique)
+        user_game_counts = (
+            hybrid_df[['idvisitor_converted', 'game_name']].drop_duplicates()
+            .groupby('idvisitor_converted')['game_name'].count()
+            .reset_index()
+        )
         user_game_counts.columns = ['idvisitor_converted', 'games_played']
         print(f"  ✓ Calculated games played per user")
         print(f"  ✓ Total unique users: {len(user_game_counts):,}")
         
-        # Group by games_played count and count users
+        # Count users per games_played over the complete range from 1 to max games played
+        # (games_played is a small non-negative integer, so np.bincount is the histogram;
+        # index 0 - users whose only game_name was missing - is not part of the range)
         print(f"  [ACTION] Grouping by games_played count...")
-        repeatability_data = user_game_counts.groupby('games_played').size().reset_index()
-        repeatability_data.columns = ['games_played', 'user_count']
-        print(f"  ✓ Calculated user counts per games_played")
-        
-        # Create complete range from 1 to max games played
         max_games = user_game_counts['games_played'].max() if not user_game_counts.empty else 0
         print(f"  ✓ Max games played by any user: {max_games}")
         
         if max_games > 0:
             print(f"  [ACTION] Creating complete range from 1 to {max_games}...")
-            complete_range = pd.DataFrame({'games_played': range(1, max_games + 1)})
-            repeatability_data = complete_range.merge(repeatability_data, on='games_played', how='left').fillna(0)
-            repeatability_data['user_count'] = repeatability_data['user_count'].astype(int)
+            user_counts = np.bincount(user_game_counts['games_played'].to_numpy(), minlength=max_games + 1)
+            repeatability_data = pd.DataFrame({
+                'games_played': np.arange(1, max_games + 1),
+                'user_count': user_counts[1:]
+            })
             print(f"  ✓ Created complete range with {len(repeatability_data)} rows")
+        else:
+            repeatability_data = user_game_counts.groupby('games_played').size().reset_index()
+            repeatability_data.columns = ['games_played', 'user_count']
+        print(f"  ✓ Calculated user counts per games_played")
         
         print(f"\n[STEP 5] Final repeatability data summary:")
         print(f"  ✓ Total rows: {len(repeatability_data)}")
@@ -3752,7 +3797,6 @@ def fetch_hybrid_repeatability_data() -> pd.DataFrame:
         print(f"    - Redshift credentials are correct")
         print(f"    - Network connectivity to Redshift")
         print(f"    - Redshift cluster is accessible")
-        import traceback
         traceback.print_exc()
         return pd.DataFrame()
     except psycopg2.ProgrammingError as e:
@@ -3762,14 +3806,12 @@ def fetch_hybrid_repeatability_data() -> pd.DataFrame:
         print(f"    - Table names and schema are correct")
         print(f"    - Column names exist in Redshift")
         print(f"    - SQL syntax is valid for Redshift")
-        import traceback
         traceback.print_exc()
         return pd.DataFrame()
     except Exception as e:
         print(f"\n[ERROR] Unexpected error while fetching repeatability data:")
         print(f"  Error type: {type(e).__name__}")
         print(f"  Error message: {str(e)}")
-        import traceback
         traceback.print_exc()
         return pd.DataFrame()
 
@@ -3787,45 +3829,51 @@ def preprocess_repeatability_data(df: pd.DataFrame) -> pd.DataFrame:
     """
     print("Preprocessing repeatability data using CORRECT SQL query logic...")
     
-    # Filter for completed events only
-    completed_events = df[df['event'] == 'Completed']
+    # Filter for completed events only, keeping just the (user, game) columns the counts need
+    # (the filtered copy then holds two columns instead of every column of the main data)
+    completed_events = df.loc[df['event'] == 'Completed', ['idvisitor_converted', 'game_name']]
     
     if completed_events.empty:
         print("WARNING: No completed events found")
         return pd.DataFrame()
     
-    print(f"DEBUG: Total completed events: {len(completed_events)}")
-    print(f"DEBUG: Unique users in completed events: {completed_events['idvisitor_converted'].nunique()}")
-    print(f"DEBUG: Unique games in completed events: {completed_events['game_name'].nunique()}")
+    if _DEBUG:
+        print(f"DEBUG: Total completed events: {len(completed_events)}")
+        print(f"DEBUG: Unique users in completed events: {completed_events['idvisitor_converted'].nunique()}")
+        print(f"DEBUG: Unique games in completed events: {completed_events['game_name'].nunique()}")
     
     # The issue might be that we need to filter the data differently
     # Let me check what the actual data looks like
-    print("DEBUG: Sample of completed events:")
-    print(completed_events[['idvisitor_converted', 'game_name', 'event']].head(10))
+    if _DEBUG:
+        print("DEBUG: Sample of completed events:")
+        print(completed_events.head(10))
     
     # Group by hybrid_profile_id (using idvisitor_converted as proxy)
     # Count distinct non-null values of game_name for each hybrid_profile_id
-    user_game_counts = completed_events.groupby('idvisitor_converted')['game_name'].nunique().reset_index()
+    # (deduplicated (user, game) pairs, so a plain count - which skips NaN like nunique - suffices)
+    user_game_counts = (
+        completed_events.drop_duplicates()
+        .groupby('idvisitor_converted', sort=False, observed=True)['game_name'].count()
+        .reset_index()
+    )
     user_game_counts.columns = ['hybrid_profile_id', 'games_played']
     
-    print(f"DEBUG: User game counts sample:")
-    print(user_game_counts.head(10))
-    print(f"DEBUG: Games played distribution:")
-    print(user_game_counts['games_played'].value_counts().sort_index().head(10))
+    if _DEBUG:
+        print(f"DEBUG: User game counts sample:")
+        print(user_game_counts.head(10))
+        print(f"DEBUG: Games played distribution:")
+        print(user_game_counts['games_played'].value_counts().sort_index().head(10))
     
     # Group by the count of distinct non-null game_name
-    # Calculate CountDistinct_hybrid_profile_id for each distinct count value
-    repeatability_data = user_game_counts.groupby('games_played').size().reset_index()
-    repeatability_data.columns = ['games_played', 'user_count']
-    
-    print(f"DEBUG: Repeatability data before range completion:")
-    print(repeatability_data.head(10))
-    
-    # Create complete range from 1 to max games played
+    # Calculate CountDistinct_hybrid_profile_id for each distinct count value over the complete
+    # range from 1 to max games played (games_played is a small non-negative integer, so
+    # np.bincount is the histogram; index 0 is not part of the range)
     max_games = user_game_counts['games_played'].max()
-    complete_range = pd.DataFrame({'games_played': range(1, max_games + 1)})
-    repeatability_data = complete_range.merge(repeatability_data, on='games_played', how='left').fillna(0)
-    repeatability_data['user_count'] = repeatability_data['user_count'].astype(int)
+    user_counts = np.bincount(user_game_counts['games_played'].to_numpy(), minlength=max_games + 1)
+    repeatability_data = pd.DataFrame({
+        'games_played': np.arange(1, max_games + 1),
+        'user_count': user_counts[1:]
+    })
     
     print(f"SUCCESS: Repeatability data (SQL logic): {len(repeatability_data)} records")
     print(f"Max distinct games played: {max_games}")
@@ -3851,13 +3899,14 @@ def process_main_data() -> pd.DataFrame:
     initial_count = len(df_main)
     df_main = df_main.drop_duplicates(subset=['idlink_va'], keep='first')
     print(f"After removing duplicates on idlink_va: {len(df_main)} records (removed {initial_count - len(df_main)} duplicates)")
-    df_main['date'] = pd.to_datetime(df_main['server_time']).dt.date
+    # YYYY-MM-DD strings formatted once per distinct day (the same text date.astype(str) gave)
+    df_main['date'] = time_period_labels(parse_timestamps(df_main['server_time']), periods=('Day',))['Day']
     
     # Extract domain from game_code if it exists
     if 'game_code' in df_main.columns:
         print(f"\n[DOMAIN EXTRACTION] Extracting domain from game_code...")
         sys.stdout.flush()
-        df_main['domain'] = df_main['game_code'].apply(extract_domain_from_game_code)
+        df_main['domain'] = map_distinct(df_main['game_code'], extract_domain_from_game_code)
         print(f"  ✓ Extracted domain for {df_main['domain'].notna().sum():,} records")
         print(f"  ✓ Unique domains: {df_main['domain'].dropna().unique().tolist()}")
         sys.stdout.flush()
@@ -3872,7 +3921,7 @@ def process_main_data() -> pd.DataFrame:
     sys.stdout.flush()
     
     # Filter out NULL events for aggregation
-    df_main_valid = df_main[df_main['event'].notna()].copy()
+    df_main_valid = df_main[df_main['event'].notna()]
     print(f"  Processing {len(df_main_valid):,} records with valid events for aggregation")
     sys.stdout.flush()
     
@@ -3896,7 +3945,7 @@ def process_main_data() -> pd.DataFrame:
             if 'language' in batch_df.columns:
                 groupby_cols.append('language')
             
-            grouped = batch_df.groupby(groupby_cols).agg({
+            grouped = batch_df.groupby(groupby_cols, sort=False, observed=True).agg({
                 'idlink_va': 'count',  # Instances
                 'idvisit': 'nunique',  # Visits (distinct)
                 'idvisitor_converted': 'nunique'  # Users (distinct)
@@ -3930,7 +3979,8 @@ def process_main_data() -> pd.DataFrame:
         if 'language' in aggregated_df.columns:
             groupby_cols.append('language')
         
-        processed_data_aggregated = aggregated_df.groupby(groupby_cols).agg({
+        # Only the final (small) aggregation is sorted, so processed_data.csv stays in date order
+        processed_data_aggregated = aggregated_df.groupby(groupby_cols, observed=True).agg({
             'instances': 'sum',
             'visits': 'sum',  # Sum of distinct counts (approximation, but works for our use case)
             'users': 'sum'    # Sum of distinct counts (approximation, but works for our use case)
@@ -3950,7 +4000,7 @@ def process_main_data() -> pd.DataFrame:
         # Save aggregated data
         print(f"\nSaving aggregated processed_data.csv ({len(processed_data_aggregated):,} rows)...")
         sys.stdout.flush()
-        processed_data_aggregated.to_csv('data/processed_data.csv', index=False)
+        write_csv(processed_data_aggregated, 'data/processed_data.csv')
         print("✓ SUCCESS: Saved data/processed_data.csv (aggregated by date, game, event)")
         sys.stdout.flush()
         
@@ -3973,7 +4023,6 @@ def process_main_data() -> pd.DataFrame:
     
     # Create and save game-specific conversion numbers
     # Track all funnel stages for each game
-    game_conversion_data = []
     
     # Check if event column exists
     if 'event' not in df_main.columns:
@@ -3982,49 +4031,39 @@ def process_main_data() -> pd.DataFrame:
         return df_main
     
     # Filter out NULL events
-    df_main_valid = df_main[df_main['event'].notna()].copy()
+    df_main_valid = df_main[df_main['event'].notna()]
     print(f"Processing game conversion data: {len(df_main_valid)} records with valid events")
     
-    for game in df_main_valid['game_name'].unique():
-        if game != 'Unknown Game':
-            game_data = df_main_valid[df_main_valid['game_name'] == game]
-            
-            # Get domain for this game (take first non-null domain if available)
-            domain = None
-            if 'domain' in game_data.columns:
-                game_domains = game_data['domain'].dropna().unique()
-                if len(game_domains) > 0:
-                    domain = game_domains[0]
-            
-            # Get language for this game (take first non-null language if available)
-            language = None
-            if 'language' in game_data.columns:
-                game_languages = game_data['language'].dropna().unique()
-                if len(game_languages) > 0:
-                    language = game_languages[0]
-            
-            # Calculate metrics for each funnel stage
-            funnel_stages = ['started', 'introduction', 'questions', 'mid_introduction', 'validation', 'parent_poll', 'rewards', 'completed']
-            game_stats = {'game_name': game}
-            if domain:
-                game_stats['domain'] = domain
-            if language:
-                game_stats['language'] = language
-            
-            for stage in funnel_stages:
-                stage_data = game_data[game_data['event'] == stage]
-                game_stats[f'{stage}_users'] = stage_data['idvisitor_converted'].nunique() if 'idvisitor_converted' in stage_data.columns else 0
-                game_stats[f'{stage}_visits'] = stage_data['idvisit'].nunique() if 'idvisit' in stage_data.columns else 0
-                game_stats[f'{stage}_instances'] = len(stage_data)
-            
-            game_conversion_data.append(game_stats)
-    
-    print(f"Creating game conversion numbers for {len(game_conversion_data)} games...")
+    # One groupby over (game, stage) replaces a filtered scan per game and funnel stage; missing
+    # (game, stage) pairs count as 0 and games keep their order of first appearance
+    funnel_stages = ['started', 'introduction', 'questions', 'mid_introduction', 'validation', 'parent_poll', 'rewards', 'completed']
+    stage_metrics = ['users', 'visits', 'instances']
+    games = [game for game in df_main_valid['game_name'].unique() if game != 'Unknown Game']
+    stage_data = df_main_valid[df_main_valid['event'].isin(funnel_stages)]
+    stage_counts = stage_data.groupby(['game_name', 'event'], sort=False, observed=True).agg(
+        users=('idvisitor_converted', 'nunique'),
+        visits=('idvisit', 'nunique'),
+        instances=('idlink_va', 'size'),
+    ).unstack('event', fill_value=0)
+    stage_columns = [(metric, stage) for stage in funnel_stages for metric in stage_metrics]
+    stage_counts = stage_counts.reindex(index=games, columns=pd.MultiIndex.from_tuples(stage_columns), fill_value=0)
+    stage_counts.columns = [f'{stage}_{metric}' for metric, stage in stage_columns]
+    
+    # Domain and language of each game: its first non-null value, included only when set
+    game_conversion_df = pd.DataFrame({'game_name': games})
+    for col in ('domain', 'language'):
+        if col in df_main_valid.columns:
+            first_values = df_main_valid.groupby('game_name', sort=False)[col].first().reindex(games)
+            first_values = [value if pd.notna(value) and value else None for value in first_values]
+            if any(value is not None for value in first_values):
+                game_conversion_df[col] = first_values
+    game_conversion_df = pd.concat([game_conversion_df, stage_counts.reset_index(drop=True)], axis=1)
+    
+    print(f"Creating game conversion numbers for {len(game_conversion_df)} games...")
     sys.stdout.flush()
-    game_conversion_df = pd.DataFrame(game_conversion_data)
     print(f"Saving game_conversion_numbers.csv...")
     sys.stdout.flush()
-    game_conversion_df.to_csv('data/game_conversion_numbers.csv', index=False)
+    write_csv(game_conversion_df, 'data/game_conversion_numbers.csv')
     print("✓ SUCCESS: Saved data/game_conversion_numbers.csv")
     sys.stdout.flush()
     
@@ -4098,7 +4137,7 @@ def process_summary_data(df_main: Optional[pd.DataFrame] = None) -> pd.DataFrame
             return pd.DataFrame()
         
         # Create event column from name using the same logic
-        df_main['event'] = df_main['name'].apply(parse_event_from_name)
+        df_main['event'] = map_distinct(df_main['name'], parse_event_from_name)
         print(f"  - Created event column from name column")
     
     # Rename idvisitor to idvisitor_converted if needed
@@ -4118,7 +4157,7 @@ def process_summary_data(df_main: Optional[pd.DataFrame] = None) -> pd.DataFrame
     # Ensure domain and language columns exist (extract if needed)
     if 'domain' not in df_main.columns and 'game_code' in df_main.columns:
         print("  - Extracting domain from game_code...")
-        df_main['domain'] = df_main['game_code'].apply(extract_domain_from_game_code)
+        df_main['domain'] = map_distinct(df_main['game_code'], extract_domain_from_game_code)
     
     # Build summary with domain and language grouping (includes overall summary)
     print("Building summary statistics with domain and language grouping...")
@@ -4139,7 +4178,7 @@ def process_summary_data(df_main: Optional[pd.DataFrame] = None) -> pd.DataFrame
     
     print(f"Saving summary_data.csv ({len(summary_df)} records)...")
     sys.stdout.flush()
-    summary_df.to_csv('data/summary_data.csv', index=False)
+    write_csv(summary_df, 'data/summary_data.csv')
     print(f"✓ SUCCESS: Saved data/summary_data.csv ({len(summary_df)} records)")
     print(f"  - Includes overall totals (domain='All', language='All')")
     print(f"  - Includes breakdowns by domain and language")
@@ -4197,7 +4236,7 @@ def process_score_distribution(use_database: bool = False) -> pd.DataFrame:
     if 'server_time' in df_score.columns:
         try:
             print(f"  [ACTION] Converting server_time to datetime...")
-            df_score['server_time'] = pd.to_datetime(df_score['server_time'])
+            df_score['server_time'] = parse_timestamps(df_score['server_time'])
             print(f"  [OK] Datetime conversion complete")
         except Exception as e:
             print(f"  [WARNING] Could not convert server_time: {e}")
@@ -4219,8 +4258,8 @@ def process_score_distribution(use_database: bool = False) -> pd.DataFrame:
         print(f"  [INFO] Language column found: will be included in output")
         # Transform language column: if contains "mr-IN" then "mr", else "hi"
         print(f"  [ACTION] Transforming language column...")
-        df_score['language'] = df_score['language'].apply(
-            lambda x: 'mr' if pd.notna(x) and 'mr-IN' in str(x) else 'hi'
+        df_score['language'] = map_distinct(
+            df_score['language'], lambda x: 'mr' if pd.notna(x) and 'mr-IN' in str(x) else 'hi'
         )
         print(f"  [OK] Language transformation complete")
     if has_game_code:
@@ -4231,7 +4270,7 @@ def process_score_distribution(use_database: bool = False) -> pd.DataFrame:
     
     if not score_distribution_df.empty:
         print(f"\nStep 3: Saving score distribution data...")
-        score_distribution_df.to_csv('data/score_distribution_data.csv', index=False)
+        write_csv(score_distribution_df, 'data/score_distribution_data.csv')
         print(f"SUCCESS: Saved data/score_distribution_data.csv ({len(score_distribution_df)} records)")
         print(f"  - File size: {len(score_distribution_df)} rows x {len(score_distribution_df.columns)} columns")
     else:
@@ -4253,15 +4292,6 @@ def fetch_valid_group_ids() -> List[int]:
     print("Fetching valid group IDs from Redshift database...")
     
     try:
-        connection = psycopg2.connect(
-            host=REDSHIFT_HOST,
-            database=REDSHIFT_DATABASE,
-            port=REDSHIFT_PORT,
-            user=REDSHIFT_USER,
-            password=REDSHIFT_PASSWORD,
-            connect_timeout=30
-        )
-        
         group_query = """
         SELECT groups.id as group_id
         FROM rl_dwh_prod.live.groups 
@@ -4282,8 +4312,8 @@ def fetch_valid_group_ids() -> List[int]:
         ORDER BY group_id
         """
         
-        group_ids_df = pd.read_sql(group_query, connection)
-        connection.close()
+        with redshift_connection() as connection:
+            group_ids_df = pd.read_sql(group_query, connection)
         
         group_ids = group_ids_df['group_id'].dropna().astype(int).tolist()
         print(f"SUCCESS: Fetched {len(group_ids)} valid group IDs")
@@ -4291,7 +4321,6 @@ def fetch_valid_group_ids() -> List[int]:
         
     except Exception as e:
         print(f"ERROR: Failed to fetch group IDs: {str(e)}")
-        import traceback
         traceback.print_exc()
         return []
 
@@ -4347,7 +4376,6 @@ def fetch_rm_active_users(group_ids: List[int] = None) -> pd.DataFrame:
         
     except Exception as e:
         print(f"ERROR: Failed to load RM active users from CSV: {str(e)}")
-        import traceback
         traceback.print_exc()
         print("  Continuing without RM active users data...")
         return pd.DataFrame()
@@ -4362,81 +4390,25 @@ def process_rm_active_users_time_series(rm_df: pd.DataFrame) -> pd.DataFrame:
     
     # Convert sent_date to datetime
     rm_df['sent_date'] = pd.to_datetime(rm_df['sent_date'])
-    rm_df['date'] = rm_df['sent_date'].dt.date
-    
-    time_series_data = []
-    
-    # Daily aggregation
-    daily_rm = rm_df.groupby('date')['phone'].nunique().reset_index()
-    daily_rm.columns = ['date', 'rm_active_users']
-    daily_rm['period_label'] = daily_rm['date'].astype(str)
-    daily_rm['period_type'] = 'Day'
-    daily_rm['game_name'] = 'All Games'
-    daily_rm['metric'] = 'rm_active_users'
-    daily_rm['event'] = 'RM Active Users'
-    
-    for _, row in daily_rm.iterrows():
-        time_series_data.append({
-            'period_label': row['period_label'],
-            'game_name': row['game_name'],
-            'metric': row['metric'],
-            'event': row['event'],
-            'count': int(row['rm_active_users']),
-            'period_type': row['period_type'],
-            'game_code': None,  # RM active users are not game-specific
-            'language': None    # RM active users are not language-specific
-        })
-    
-    # Weekly aggregation
-    rm_df['shifted_date'] = rm_df['sent_date'] - pd.Timedelta(days=2)
-    rm_df['year'] = rm_df['shifted_date'].dt.year
-    rm_df['week'] = rm_df['shifted_date'].dt.strftime('%W').astype(int)
-    rm_df['period_label'] = rm_df['year'].astype(str) + '_' + rm_df['week'].astype(str).str.zfill(2)
-    
-    weekly_rm = rm_df.groupby('period_label')['phone'].nunique().reset_index()
-    weekly_rm.columns = ['period_label', 'rm_active_users']
-    weekly_rm['period_type'] = 'Week'
-    weekly_rm['game_name'] = 'All Games'
-    weekly_rm['metric'] = 'rm_active_users'
-    weekly_rm['event'] = 'RM Active Users'
-    
-    for _, row in weekly_rm.iterrows():
-        time_series_data.append({
-            'period_label': row['period_label'],
-            'game_name': row['game_name'],
-            'metric': row['metric'],
-            'event': row['event'],
-            'count': int(row['rm_active_users']),
-            'period_type': row['period_type'],
-            'game_code': None,  # RM active users are not game-specific
-            'language': None    # RM active users are not language-specific
-        })
-    
-    # Monthly aggregation
-    rm_df['year'] = rm_df['sent_date'].dt.year
-    rm_df['month'] = rm_df['sent_date'].dt.month
-    rm_df['period_label'] = rm_df['year'].astype(str) + '_' + rm_df['month'].astype(str).str.zfill(2)
-    
-    monthly_rm = rm_df.groupby('period_label')['phone'].nunique().reset_index()
-    monthly_rm.columns = ['period_label', 'rm_active_users']
-    monthly_rm['period_type'] = 'Month'
-    monthly_rm['game_name'] = 'All Games'
-    monthly_rm['metric'] = 'rm_active_users'
-    monthly_rm['event'] = 'RM Active Users'
-    
-    for _, row in monthly_rm.iterrows():
-        time_series_data.append({
-            'period_label': row['period_label'],
-            'game_name': row['game_name'],
-            'metric': row['metric'],
-            'event': row['event'],
-            'count': int(row['rm_active_users']),
-            'period_type': row['period_type'],
+    period_labels = time_period_labels(rm_df['sent_date'])
+    
+    time_series_parts = []
+    
+    # Daily, weekly and monthly aggregation share the precomputed labels
+    for period_type in ['Day', 'Week', 'Month']:
+        period_rm = rm_df.groupby(period_labels[period_type])['phone'].nunique()
+        time_series_parts.append(pd.DataFrame({
+            'period_label': period_rm.index,
+            'game_name': 'All Games',
+            'metric': 'rm_active_users',
+            'event': 'RM Active Users',
+            'count': period_rm.to_numpy(dtype='int64'),
+            'period_type': period_type,
             'game_code': None,  # RM active users are not game-specific
             'language': None    # RM active users are not language-specific
-        })
+        }))
     
-    rm_time_series_df = pd.DataFrame(time_series_data)
+    rm_time_series_df = pd.concat(time_series_parts, ignore_index=True)
     print(f"SUCCESS: Processed {len(rm_time_series_df)} RM active users time series records")
     return rm_time_series_df
 
@@ -4466,21 +4438,17 @@ def process_time_series(df_main: Optional[pd.DataFrame] = None) -> pd.DataFrame:
         print("  Install with: pip install psycopg2-binary")
     else:
         try:
-            print(f"\n  [ACTION] Connecting to REDSHIFT...")
-            conn = psycopg2.connect(
-                host=REDSHIFT_HOST,
-                database=REDSHIFT_DATABASE,
-                port=REDSHIFT_PORT,
-                user=REDSHIFT_USER,
-                password=REDSHIFT_PASSWORD,
-                connect_timeout=30
-            )
-            print(f"  ✓ Successfully connected to REDSHIFT")
-            print(f"  [ACTION] Executing time series query on REDSHIFT...")
-            df_time_series = pd.read_sql(TIME_SERIES_QUERY, conn)
-            conn.close()
-            print(f"  ✓ Query executed successfully on REDSHIFT")
-            print(f"  ✓ Connection closed")
+            # Fast path: connectorx (falls through to a chunked psycopg2 read if unavailable or failing)
+            df_fetched = read_sql_connectorx(TIME_SERIES_QUERY)
+            if df_fetched is None:
+                print(f"\n  [ACTION] Connecting to REDSHIFT...")
+                with redshift_connection() as conn:
+                    print(f"  ✓ Successfully connected to REDSHIFT")
+                    print(f"  [ACTION] Executing time series query on REDSHIFT...")
+                    df_fetched = read_sql_chunked(conn, TIME_SERIES_QUERY)
+                print(f"  ✓ Query executed successfully on REDSHIFT")
+                print(f"  ✓ Connection closed")
+            df_time_series = df_fetched
             
             # Convert hex to int in Python (handles large values)
             if 'idvisitor_hex' in df_time_series.columns:
@@ -4497,13 +4465,11 @@ def process_time_series(df_main: Optional[pd.DataFrame] = None) -> pd.DataFrame:
             print(f"      - REDSHIFT credentials are correct in .env file")
             print(f"      - Network connectivity to Redshift cluster")
             print(f"      - Redshift cluster is running and accessible")
-            import traceback
             traceback.print_exc()
         except Exception as e:
             print(f"\n  ERROR: Failed to fetch time series data from REDSHIFT:")
             print(f"    Error Type: {type(e).__name__}")
             print(f"    Error Message: {str(e)}")
-            import traceback
             traceback.print_exc()
     
     # Process time series data (instances, visits, users all from same query)
@@ -4513,7 +4479,6 @@ def process_time_series(df_main: Optional[pd.DataFrame] = None) -> pd.DataFrame:
             time_series_df = preprocess_time_series_data_visits_users(df_time_series)
         except Exception as e:
             print(f"WARNING: Failed to process time series data: {str(e)}")
-            import traceback
             traceback.print_exc()
             time_series_df = pd.DataFrame()
     else:
@@ -4537,14 +4502,12 @@ def process_time_series(df_main: Optional[pd.DataFrame] = None) -> pd.DataFrame:
                 print("SUCCESS: RM active users data processed and will be included in time series")
             except Exception as e:
                 print(f"WARNING: Failed to process RM active users time series: {str(e)}")
-                import traceback
                 traceback.print_exc()
         else:
             print("WARNING: No RM active users data loaded, continuing without it")
     except Exception as e:
         print(f"WARNING: Error during RM active users processing: {str(e)}")
         print("  Continuing with time series processing without RM active users...")
-        import traceback
         traceback.print_exc()
     
     # Combine time series data with RM active users
@@ -4557,13 +4520,13 @@ def process_time_series(df_main: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     
     # Save to CSV
     if not time_series_df.empty:
-        time_series_df.to_csv('data/time_series_data.csv', index=False)
+        write_csv(time_series_df, 'data/time_series_data.csv')
         print(f"SUCCESS: Saved data/time_series_data.csv ({len(time_series_df)} records)")
         print(f"  Columns: {list(time_series_df.columns)}")
         print(f"  Sample row: {time_series_df.iloc[0].to_dict() if len(time_series_df) > 0 else 'N/A'}")
     else:
         print("WARNING: No time series data to save")
-        empty_df = pd.DataFrame(columns=['period_label', 'game_name', 'metric', 'event', 'count', 'period_type', 'game_code', 'language'])
+        empty_df = empty_frame(TIME_SERIES_OUTPUT_DTYPES)
         empty_df.to_csv('data/time_series_data.csv', index=False)
     
     return time_series_df
@@ -4595,7 +4558,7 @@ def process_repeatability(df_main: Optional[pd.DataFrame] = None) -> pd.DataFram
                 print(f"  ✓ Loaded {len(df_main):,} records from processed_data.csv")
                 
                 if 'server_time' in df_main.columns:
-                    df_main['server_time'] = pd.to_datetime(df_main['server_time'])
+                    df_main['server_time'] = parse_timestamps(df_main['server_time'])
                     print(f"  ✓ Converted server_time to datetime")
                 else:
                     print(f"  WARNING: server_time column not found in processed_data.csv")
@@ -4609,7 +4572,6 @@ def process_repeatability(df_main: Optional[pd.DataFrame] = None) -> pd.DataFram
                 print(f"  WARNING: Fallback processing returned empty data")
         except Exception as e:
             print(f"  ERROR: Fallback processing failed: {str(e)}")
-            import traceback
             traceback.print_exc()
     else:
         print(f"\n[STEP 2] Redshift data fetched successfully, skipping fallback")
@@ -4618,7 +4580,7 @@ def process_repeatability(df_main: Optional[pd.DataFrame] = None) -> pd.DataFram
     print(f"\n[STEP 3] Saving repeatability data to CSV...")
     if not repeatability_df.empty:
         print(f"  [ACTION] Writing to data/repeatability_data.csv...")
-        repeatability_df.to_csv('data/repeatability_data.csv', index=False)
+        write_csv(repeatability_df, 'data/repeatability_data.csv')
         file_size_kb = os.path.getsize('data/repeatability_data.csv') / 1024
         print(f"  ✓ SUCCESS: Saved data/repeatability_data.csv")
         print(f"    - Records: {len(repeatability_df):,}")
@@ -4637,190 +4599,202 @@ def process_repeatability(df_main: Optional[pd.DataFrame] = None) -> pd.DataFram
     return repeatability_df
 
 
-def process_parent_poll() -> pd.DataFrame:
-    """Process parent poll responses data from Excel file (NOT from database)"""
-    import sys
-    
-    print("\n" + "=" * 60, flush=True)
-    print("PROCESSING: Parent Poll Responses", flush=True)
-    print("=" * 60, flush=True)
-    print("NOTE: Reading from Excel file, NOT from database", flush=True)
-    
-    # Read poll data from CSV or Excel file (prefer CSV)
-    csv_file = 'poll_responses_raw_data.csv'
-    excel_file = 'poll_responses_raw_data.xlsx'
-    df_poll = None
-    
-    # Try CSV first
-    if os.path.exists(csv_file):
-        print(f"\n[STEP 1] Reading parent poll data from CSV file: {csv_file}", flush=True)
-        print("  This step reads the CSV file into memory...", flush=True)
-        try:
-            print("  [ACTION] Starting to read CSV file (this may take a moment for large files)...", flush=True)
-            sys.stdout.flush()
-            df_poll = pd.read_csv(csv_file, low_memory=False)
-            print(f"  [SUCCESS] CSV file loaded successfully!", flush=True)
-            print(f"  Total records loaded: {len(df_poll):,}", flush=True)
-            sys.stdout.flush()
-        except Exception as e:
-            print(f"  ERROR: Failed to read CSV file: {str(e)}")
-            import traceback
-            traceback.print_exc()
-    
-    # Fallback to Excel if CSV not found or failed
-    if df_poll is None and os.path.exists(excel_file):
-        print(f"\n[STEP 1] Reading parent poll data from Excel file: {excel_file}", flush=True)
-        print("  This step reads the Excel file into memory...", flush=True)
+def write_csv(df: pd.DataFrame, path: str):
+    """Write a DataFrame to CSV, using pyarrow's C++ writer when it is installed
+
+    pyarrow quotes the header and every string field, which pd.read_csv reads back to the
+    same values. It formats floats, bools and datetimes differently from to_csv though
+    (50.0 -> 50, True -> true, ...), so only all-int/string frames take that path; the rest,
+    and columns Arrow can't type (e.g. mixed ints and strings in one object column), use to_csv.
+    """
+    if PYARROW_AVAILABLE and all(
+        pd.api.types.is_integer_dtype(df[col]) or pd.api.types.is_string_dtype(df[col])
+        for col in df.columns
+    ):
         try:
-            print("  [ACTION] Starting to read Excel file (this may take a moment for large files)...", flush=True)
-            sys.stdout.flush()
-            df_poll = pd.read_excel(excel_file)
-            print(f"  [SUCCESS] Excel file loaded successfully!", flush=True)
-            print(f"  Total records loaded: {len(df_poll):,}", flush=True)
-            sys.stdout.flush()
-        except Exception as e:
-            print(f"  ERROR: Failed to read Excel file: {str(e)}")
-            import traceback
-            traceback.print_exc()
-    
-    if df_poll is None:
-        print(f"  ERROR: Neither '{csv_file}' nor '{excel_file}' found")
-        poll_df = pd.DataFrame(columns=['game_name', 'question', 'option', 'count', 'language', 'domain'])
-        poll_df.to_csv('data/poll_responses_data.csv', index=False)
-        return poll_df
-    
-    if df_poll.empty:
-        print("WARNING: No parent poll data found in file")
-        # Create empty dataframe with expected headers
-        poll_df = pd.DataFrame(columns=['game_name', 'question', 'option', 'count', 'language', 'domain'])
-        poll_df.to_csv('data/poll_responses_data.csv', index=False)
-        return poll_df
-    
-    # Ensure required columns exist
-    if 'custom_dimension_1' not in df_poll.columns:
-        print("ERROR: 'custom_dimension_1' column not found in file")
-        poll_df = pd.DataFrame(columns=['game_name', 'question', 'option', 'count', 'language', 'domain'])
-        poll_df.to_csv('data/poll_responses_data.csv', index=False)
-        return poll_df
-    
-    if 'game_name' not in df_poll.columns:
-        print("ERROR: 'game_name' column not found in file")
-        poll_df = pd.DataFrame(columns=['game_name', 'question', 'option', 'count', 'language', 'domain'])
-        poll_df.to_csv('data/poll_responses_data.csv', index=False)
-        return poll_df
-    
-    print(f"\n[STEP 2] Validating data structure...", flush=True)
-    print(f"  Available columns: {list(df_poll.columns)}", flush=True)
-    
-    # Normalize column names (handle case variations and spaces)
-    column_mapping = {}
-    for col in df_poll.columns:
-        col_lower = str(col).lower().strip()
-        if col_lower in ['language', 'lanuagae']:  # Handle typo
-            column_mapping['language'] = col
-        elif col_lower in ['game_code', 'gamecode', 'game code']:
-            column_mapping['game_code'] = col
-        elif col_lower == 'custom_dimension_1':
-            column_mapping['custom_dimension_1'] = col
-        elif col_lower == 'game_name':
-            column_mapping['game_name'] = col
-    
-    # Check for required columns
-    has_language = 'language' in column_mapping
-    has_game_code = 'game_code' in column_mapping
-    
-    if has_language:
-        print(f"  [INFO] Language column found in raw data: '{column_mapping['language']}'", flush=True)
-    else:
-        print(f"  [WARNING] Language column not found - checking available columns...", flush=True)
-        lang_cols = [c for c in df_poll.columns if 'lang' in str(c).lower()]
-        if lang_cols:
-            print(f"    Found potential language columns: {lang_cols}", flush=True)
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # from_pandas failed before anything was written
+    df.to_csv(path, index=False)
+
+
+def write_csv_with_parquet(df: pd.DataFrame, csv_path: str) -> bool:
+    """Write df to csv_path and, when pyarrow is installed, a Parquet copy next to it
+
+    The dashboard loads the .parquet file when it exists (columnar, compressed, typed)
+    and falls back to the CSV otherwise. If pyarrow is missing, any Parquet copy left
+    from an earlier run is removed so it can't shadow the fresh CSV.
+    Returns True if the Parquet copy was written.
+    """
+    write_csv(df, csv_path)
+    parquet_path = os.path.splitext(csv_path)[0] + '.parquet'
+    if not PYARROW_AVAILABLE:
+        if os.path.exists(parquet_path):
+            os.remove(parquet_path)
+        return False
+    # Parquet dictionary-encodes repeated strings on its own; writing categoricals as plain
+    # strings keeps the dashboard's groupbys free of unobserved categories
+    categorical_cols = df.select_dtypes(include='category').columns
+    if len(categorical_cols) > 0:
+        df = df.astype({col: object for col in categorical_cols})
+    df.to_parquet(parquet_path, engine='pyarrow', compression='zstd', index=False)
+    return True
+
+
+def _as_option_index(value) -> Optional[int]:
+    """Return a chosenOption/chosenAnswer value as an int index, or None if it isn't one.
+
+    JSON ints are returned as-is and strings only reach int() when they look numeric,
+    so free-text answers don't raise (and catch) a ValueError per poll item.
+    """
+    if type(value) is int:
+        return value
+    if isinstance(value, str) and not value.strip().lstrip('+-').replace('_', '').isdigit():
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+
+# Field order of the tuples produced by _extract_poll_records
+POLL_RECORD_COLUMNS = ['game_name', 'question', 'option', 'option_fallback', 'language', 'domain']
+
+
+# Poll item keys probed, in order, for the question label: number keys give "Question N",
+# text keys are used as-is. chosenAnswer items (Primary Emotion Labelling) also carry questionNo.
+OPTION_QUESTION_NUMBER_KEYS = ('_poll_question_number',)
+OPTION_QUESTION_TEXT_KEYS = ('question', 'questionText', 'questionId', 'question_id')
+ANSWER_QUESTION_NUMBER_KEYS = ('_poll_question_number', 'questionNo')
+ANSWER_QUESTION_TEXT_KEYS = ('question', 'questionText')
+
+# Poll sections hold a handful of questions, so the usual "Question N" labels are built once
+# and shared by every response instead of being formatted per poll item
+_QUESTION_LABELS = {number: f"Question {number}" for number in range(1, 11)}
+
+
+def _poll_question_text(poll_item: dict, number_keys: tuple, text_keys: tuple):
+    """Return the question label for a poll item: the first truthy number key as
+    "Question N", else the first truthy text key, else "Question (unknown)"."""
+    for key in number_keys:
+        question_number = poll_item.get(key)
+        if question_number:
+            # Exact int check: True and 1.0 hash like 1 but have always been labelled as-is
+            if type(question_number) is int and question_number in _QUESTION_LABELS:
+                return _QUESTION_LABELS[question_number]
+            return f"Question {question_number}"
+    for key in text_keys:
+        question_text = poll_item.get(key)
+        if question_text:
+            return question_text
+    return "Question (unknown)"
+
+
+def _clean_poll_options(results_df: pd.DataFrame) -> pd.DataFrame:
+    """Finish the option text of freshly extracted poll records, column-wise.
+
+    Options are stripped, and empty or dict/list-looking messages are replaced by the
+    record's option_fallback (the 1-based option number, formatted as "Option N", or the
+    chosenAnswer text). Records that still have no option text are dropped;
+    option_fallback is dropped as well.
+    """
+    if results_df.empty:
+        # Built from empty column lists, every column is float64 - no .str accessor
+        return results_df.drop(columns='option_fallback')
+    option = results_df['option'].str.strip()
+    use_fallback = (option == '') | option.str.startswith(('{', '['))
+    # Option numbers are only formatted for the (few) records that actually fall back
+    fallback = results_df.loc[use_fallback, 'option_fallback'].map(
+        lambda value: f"Option {value}" if type(value) is int else value
+    )
+    results_df = results_df.assign(option=option.mask(use_fallback, fallback))
+    results_df = results_df.drop(columns='option_fallback')
+    return results_df[results_df['option'] != '']
+
+
+def _is_poll_source_column(col) -> bool:
+    """usecols filter for the raw poll file.
+
+    Keeps the columns process_parent_poll reads (in any of the spellings it normalizes) and
+    any other language/game-code-like column it reports when those are missing, so the
+    (large) remaining columns of the export are never parsed or held in memory.
+    """
+    name = str(col).lower().strip()
+    return (name in ('custom_dimension_1', 'game_name', 'lanuagae')
+            or 'lang' in name
+            or ('game' in name and 'code' in name))
+
+
+def _extract_poll_records(rows) -> Tuple[dict, dict]:
+    """Extract poll responses from a chunk of raw parent poll rows.
+
+    `rows` is a list of (idx, custom_dimension_1, game_name, language, game_code)
+    tuples. Lives at module level so process_parent_poll can hand chunks to a
+    multiprocessing pool. Returns (records, stats): records maps each of
+    POLL_RECORD_COLUMNS to a list of values (one column per field rather than a tuple
+    per response) and stats holds the skip/error counters for the chunk.
+    """
+    game_names, questions, option_texts, option_fallbacks, languages, domains = ([] for _ in POLL_RECORD_COLUMNS)
     
-    if has_game_code:
-        print(f"  [INFO] game_code column found in raw data: '{column_mapping['game_code']}' - will extract domain", flush=True)
-    else:
-        print(f"  [WARNING] game_code column not found - checking available columns...", flush=True)
-        game_code_cols = [c for c in df_poll.columns if 'game' in str(c).lower() and 'code' in str(c).lower()]
-        if game_code_cols:
-            print(f"    Found potential game_code columns: {game_code_cols}", flush=True)
+    def add_record(record_game, question, option, option_fallback, record_language, record_domain):
+        game_names.append(record_game)
+        questions.append(question)
+        option_texts.append(option)
+        option_fallbacks.append(option_fallback)
+        languages.append(record_language)
+        domains.append(record_domain)
     
-    # Process each record
-    processed_records = []
     debug_count = 0
     skipped_no_json = 0
     skipped_no_structure = 0
     records_with_poll_items = 0
     total_poll_items_found = 0
     encoding_errors = 0
+    record_errors = 0
     
-    print(f"\n[STEP 3] Processing {len(df_poll):,} poll records...", flush=True)
-    print(f"  This step extracts poll responses from JSON in custom_dimension_1 column", flush=True)
-    print(f"  Progress will be shown every 10,000 records...", flush=True)
-    sys.stdout.flush()
-    
-    for idx, row in df_poll.iterrows():
+    for idx, custom_dim_1, game_name, language, game_code in rows:
         try:
-            # Get columns using normalized mapping or direct access
-            custom_dim_1 = row.get(column_mapping.get('custom_dimension_1', 'custom_dimension_1'))
-            game_name = row.get(column_mapping.get('game_name', 'game_name'))
             # Ensure game_name is a string and handle NaN/None values
-            if pd.isna(game_name) or game_name is None:
+            # (native checks - NaN is the only value not equal to itself - avoid pd.isna per row)
+            if game_name is None or game_name != game_name:
                 game_name = 'Unknown Game'
             else:
-                game_name = str(game_name).strip()
-            idvisit = row.get('idvisit')
+                # Intern so every record for the same game shares one string object
+                game_name = sys.intern(str(game_name).strip())
             
-            # Get language and game_code using normalized column names
-            language = None
-            if has_language:
-                language_col = column_mapping.get('language')
-                language = row.get(language_col) if language_col else None
-                # Handle NaN/None
-                if pd.isna(language):
-                    language = None
-            
-            game_code = None
-            if has_game_code:
-                game_code_col = column_mapping.get('game_code')
-                game_code = row.get(game_code_col) if game_code_col else None
-                # Handle NaN/None
-                if pd.isna(game_code):
-                    game_code = None
+            # Handle NaN/None in the optional language and game_code columns
+            if language != language:
+                language = None
+            if game_code != game_code:
+                game_code = None
             
             domain = None
             if game_code:
                 domain = extract_domain_from_game_code(game_code)
             
-            # Progress indicator
-            if (idx + 1) % 10000 == 0:
-                print(f"\n    [PROGRESS] {idx + 1:,}/{len(df_poll):,} records processed", flush=True)
-                print(f"      - Records with poll items: {records_with_poll_items:,}", flush=True)
-                print(f"      - Total poll responses extracted: {total_poll_items_found:,}", flush=True)
-                print(f"      - Skipped (no JSON): {skipped_no_json:,}", flush=True)
-                print(f"      - Skipped (no structure): {skipped_no_structure:,}", flush=True)
-                sys.stdout.flush()
-            
             # Parse JSON from custom_dimension_1
-            if not custom_dim_1 or pd.isna(custom_dim_1):
+            if not custom_dim_1 or custom_dim_1 != custom_dim_1:
                 skipped_no_json += 1
-                if debug_count < 3:
+                if _DEBUG and debug_count < 3:
                     print(f"    [SKIP] Record {idx+1}: custom_dimension_1 is empty or NaN")
                     debug_count += 1
                 continue
             
             try:
-                poll_data = json.loads(custom_dim_1)
-            except json.JSONDecodeError as e:
+                poll_data = load_json(custom_dim_1)
+            except (ValueError, TypeError) as e:
+                # ValueError covers both orjson's and json's decode errors; TypeError is a
+                # non-string cell (e.g. a number the CSV reader parsed) that is not JSON either
                 skipped_no_json += 1
-                if debug_count < 3:
+                if _DEBUG and debug_count < 3:
                     print(f"    [SKIP] Record {idx+1}: JSON decode error - {str(e)[:50]}")
                     debug_count += 1
                 continue
             
             if not isinstance(poll_data, dict):
                 skipped_no_structure += 1
-                if debug_count < 3:
+                if _DEBUG and debug_count < 3:
                     print(f"    [SKIP] Record {idx+1}: poll_data is not a dict (type: {type(poll_data)})")
                     debug_count += 1
                 continue
@@ -4838,17 +4812,17 @@ def process_parent_poll() -> pd.DataFrame:
                 poll_section = poll_data.get('poll')
                 if isinstance(poll_section, list):
                     poll_items.extend(poll_section)
-                    if debug_count < 2:
+                    if _DEBUG and debug_count < 2:
                         print(f"    [FOUND] Record {idx+1}: 'poll' key at root (list with {len(poll_section)} items)")
                 elif isinstance(poll_section, dict):
                     poll_items.append(poll_section)
-                    if debug_count < 2:
+                    if _DEBUG and debug_count < 2:
                         print(f"    [FOUND] Record {idx+1}: 'poll' key at root (dict)")
             
             # Check if root has poll-like structure
             if 'options' in poll_data and 'chosenOption' in poll_data:
                 poll_items.append(poll_data)
-                if debug_count < 2:
+                if _DEBUG and debug_count < 2:
                     print(f"    [FOUND] Record {idx+1}: Poll structure at root level")
             
             # Search through gameData array for poll responses
@@ -4856,31 +4830,32 @@ def process_parent_poll() -> pd.DataFrame:
             game_data = poll_data.get('gameData', [])
             if isinstance(game_data, list):
                 game_data_poll_count = 0
-                for game_item in game_data:
-                    if not isinstance(game_item, dict):
-                        continue
-                    
-                    # Check if this is the "Poll" section
-                    section = game_item.get('section', '')
-                    if section.lower() == 'poll':
-                        # This is the Poll section - extract poll questions from here
-                        nested_game_data = game_item.get('gameData', [])
-                        if isinstance(nested_game_data, list):
-                            for question_idx, nested_item in enumerate(nested_game_data):
-                                # Check for both chosenOption and chosenAnswer (Primary Emotion Labelling games use chosenAnswer)
-                                if isinstance(nested_item, dict) and 'options' in nested_item and ('chosenOption' in nested_item or 'chosenAnswer' in nested_item):
-                                    # Add question number (1, 2, or 3) to the poll item
-                                    nested_item['_poll_question_number'] = question_idx + 1
-                                    poll_items.append(nested_item)
-                                    game_data_poll_count += 1
+                # Pick out the "Poll" section(s) in one comprehension pass
+                # (JSON decoding only produces plain dicts, so an exact type check is enough)
+                poll_sections = [
+                    game_item for game_item in game_data
+                    if type(game_item) is dict and game_item.get('section', '').lower() == 'poll'
+                ]
+                for game_item in poll_sections:
+                    # This is the Poll section - extract poll questions from here
+                    nested_game_data = game_item.get('gameData', [])
+                    if isinstance(nested_game_data, list):
+                        # Question numbers are positional, so enumerate the unfiltered list
+                        for question_idx, nested_item in enumerate(nested_game_data):
+                            # Check for both chosenOption and chosenAnswer (Primary Emotion Labelling games use chosenAnswer)
+                            if type(nested_item) is dict and 'options' in nested_item and ('chosenOption' in nested_item or 'chosenAnswer' in nested_item):
+                                # Add question number (1, 2, or 3) to the poll item
+                                nested_item['_poll_question_number'] = question_idx + 1
+                                poll_items.append(nested_item)
+                                game_data_poll_count += 1
                 
-                if game_data_poll_count > 0 and debug_count < 2:
+                if _DEBUG and game_data_poll_count > 0 and debug_count < 2:
                     print(f"    [FOUND] Record {idx+1}: Found {game_data_poll_count} poll items in Poll section")
             
             # If no poll items found, skip this record
             if not poll_items:
                 skipped_no_structure += 1
-                if debug_count < 5:
+                if _DEBUG and debug_count < 5:
                     root_keys = list(poll_data.keys())[:10]
                     print(f"    [SKIP] Record {idx+1} ({game_name}): No poll structure found. Root keys: {root_keys}")
                     debug_count += 1
@@ -4890,7 +4865,7 @@ def process_parent_poll() -> pd.DataFrame:
             records_with_poll_items += 1
             total_poll_items_found += len(poll_items)
             
-            if debug_count < 2:
+            if _DEBUG and debug_count < 2:
                 print(f"    [PROCESSING] Record {idx+1} ({game_name}): Found {len(poll_items)} poll items")
             
             # Process each poll item found
@@ -4906,12 +4881,20 @@ def process_parent_poll() -> pd.DataFrame:
                 # Handle chosenOption (index-based selection)
                 if isinstance(options, list) and len(options) > 0 and chosen_option is not None:
                     try:
-                        chosen_option_idx = int(chosen_option)
-                        if 0 <= chosen_option_idx < len(options):
+                        chosen_option_idx = _as_option_index(chosen_option)
+                        if chosen_option_idx is not None and 0 <= chosen_option_idx < len(options):
                             selected_option = options[chosen_option_idx]
                             # Try different possible fields for option text
-                            # Handle encoding issues by using safe string conversion
-                            try:
+                            # (checked up front instead of wrapping every item in a try/except -
+                            # a non-object option is the only thing that can fail here)
+                            if not isinstance(selected_option, dict):
+                                encoding_errors += 1
+                                # Nothing to read a message from - use a safe representation
+                                option_message = f"Option_{chosen_option_idx}"
+                                if _DEBUG and debug_count < 3:
+                                    print(f"      [ENCODING ERROR] Record {idx+1}, Poll Item {poll_item_idx+1}: option is a {type(selected_option).__name__}, not an object")
+                                    debug_count += 1
+                            else:
                                 # First try to get message field
                                 message_field = selected_option.get('message', '')
                                 
@@ -4923,7 +4906,7 @@ def process_parent_poll() -> pd.DataFrame:
                                         message_field.get('en_US', '') or
                                         message_field.get('en_IN', '') or
                                         # If no English, get the first available value
-                                        (list(message_field.values())[0] if message_field else '')
+                                        next(iter(message_field.values()), '')
                                     )
                                 elif message_field:
                                     option_message = message_field
@@ -4937,203 +4920,334 @@ def process_parent_poll() -> pd.DataFrame:
                                         f"Option {chosen_option_idx + 1}"
                                     )
                                 
-                                # Ensure it's a string and handle encoding
-                                if isinstance(option_message, bytes):
-                                    option_message = option_message.decode('utf-8', errors='replace')
-                                else:
+                                # Ensure it's a string - decoded JSON has no bytes, so only numbers
+                                # and nested values need converting (stripping and the fallback to the
+                                # option number for empty or dict-like messages run vectorized after
+                                # extraction - see _clean_poll_options)
+                                if not isinstance(option_message, str):
                                     option_message = str(option_message)
-                                
-                                # Clean up the message - remove extra whitespace
-                                option_message = option_message.strip()
-                                
-                                # If still empty or looks like a dict string, use option number
-                                if not option_message or option_message.startswith('{') or option_message.startswith('['):
-                                    option_message = f"Option {chosen_option_idx + 1}"
-                                
-                                # Replace any problematic characters for display
-                                try:
-                                    option_message = option_message.encode('utf-8', errors='replace').decode('utf-8')
-                                except:
-                                    option_message = f"Option {chosen_option_idx + 1}"
-                            except Exception as e:
-                                encoding_errors += 1
-                                # If all else fails, use a safe representation
-                                option_message = f"Option_{chosen_option_idx}"
-                                if debug_count < 3:
-                                    print(f"      [ENCODING ERROR] Record {idx+1}, Poll Item {poll_item_idx+1}: {str(e)[:50]}")
-                                    debug_count += 1
                             
-                            if option_message:
-                                # Get question number from poll item (1, 2, or 3)
-                                question_number = poll_item.get('_poll_question_number')
-                                
-                                # If we have a question number, use it
-                                if question_number:
-                                    question_text = f"Question {question_number}"
-                                else:
-                                    # Fallback: try to get from poll_item fields
-                                    question_text = (
-                                        poll_item.get('question', '') or 
-                                        poll_item.get('questionText', '') or
-                                        poll_item.get('questionId', '') or
-                                        poll_item.get('question_id', '')
-                                    )
-                                    
-                                    # If still no question text, use a generic identifier
-                                    if not question_text:
-                                        question_text = "Question (unknown)"
-                                
-                                record = {
-                                    'game_name': game_name,
-                                    'question': question_text,
-                                    'option': option_message
-                                }
-                                # Add language and domain if available
-                                if language is not None:
-                                    record['language'] = language
-                                if domain is not None:
-                                    record['domain'] = domain
-                                
-                                processed_records.append(record)
+                            # Question number from the poll item (1, 2, or 3), else its question text fields
+                            question_text = _poll_question_text(
+                                poll_item, OPTION_QUESTION_NUMBER_KEYS, OPTION_QUESTION_TEXT_KEYS
+                            )
+                            
+                            # One value per POLL_RECORD_COLUMNS field (language/domain may be None)
+                            # (the option number stays an int - _clean_poll_options only formats it
+                            # as "Option N" for records that need the fallback)
+                            add_record(game_name, question_text, option_message, chosen_option_idx + 1, language, domain)
                     except (ValueError, IndexError, TypeError):
                         continue
                 
                 # Handle chosenAnswer (text-based or index-based selection for Primary Emotion Labelling games)
                 elif isinstance(options, list) and len(options) > 0 and chosen_answer is not None:
-                    try:
-                        option_message = None
-                        chosen_answer_str = str(chosen_answer).strip()
-                        
-                        # Try to interpret chosenAnswer as an index first
-                        try:
-                            chosen_option_idx = int(chosen_answer)
-                            if 0 <= chosen_option_idx < len(options):
-                                selected_option = options[chosen_option_idx]
-                                # Extract option message from selected option
-                                message_field = selected_option.get('message', '') if isinstance(selected_option, dict) else ''
-                                if isinstance(message_field, dict):
-                                    option_message = (
-                                        message_field.get('en', '') or
-                                        message_field.get('en_US', '') or
-                                        message_field.get('en_IN', '') or
-                                        (list(message_field.values())[0] if message_field else '')
-                                    )
-                                elif message_field:
-                                    option_message = message_field
-                                else:
-                                    if isinstance(selected_option, dict):
-                                        option_message = (
-                                            selected_option.get('text', '') or 
-                                            selected_option.get('label', '') or
-                                            chosen_answer_str
-                                        )
-                                    else:
-                                        option_message = str(selected_option)
-                        except (ValueError, TypeError):
-                            # chosenAnswer is text, try to find matching option or use it directly
-                            selected_option = None
-                            for opt in options:
-                                if isinstance(opt, dict):
-                                    opt_text = opt.get('text', '') or opt.get('message', '') or opt.get('label', '')
-                                    if str(opt_text).strip() == chosen_answer_str:
-                                        selected_option = opt
-                                        break
-                            
-                            if selected_option:
-                                # Extract from matching option
-                                message_field = selected_option.get('message', '')
-                                if isinstance(message_field, dict):
-                                    option_message = (
-                                        message_field.get('en', '') or
-                                        message_field.get('en_US', '') or
-                                        message_field.get('en_IN', '') or
-                                        (list(message_field.values())[0] if message_field else '')
-                                    )
-                                elif message_field:
-                                    option_message = message_field
-                                else:
+                    # No try/except per item: every lookup below is type-checked, and the UTF-8
+                    # scrub runs once per distinct option after extraction (see process_parent_poll)
+                    option_message = None
+                    chosen_answer_str = str(chosen_answer).strip()
+                    
+                    # Try to interpret chosenAnswer as an index first
+                    chosen_option_idx = _as_option_index(chosen_answer)
+                    if chosen_option_idx is not None:
+                        if 0 <= chosen_option_idx < len(options):
+                            selected_option = options[chosen_option_idx]
+                            # Extract option message from selected option
+                            message_field = selected_option.get('message', '') if isinstance(selected_option, dict) else ''
+                            if isinstance(message_field, dict):
+                                option_message = (
+                                    message_field.get('en', '') or
+                                    message_field.get('en_US', '') or
+                                    message_field.get('en_IN', '') or
+                                    (list(message_field.values())[0] if message_field else '')
+                                )
+                            elif message_field:
+                                option_message = message_field
+                            else:
+                                if isinstance(selected_option, dict):
                                     option_message = (
                                         selected_option.get('text', '') or 
                                         selected_option.get('label', '') or
                                         chosen_answer_str
                                     )
-                            else:
-                                # Use chosenAnswer as the option text directly
-                                option_message = chosen_answer_str
+                                else:
+                                    option_message = str(selected_option)
+                    else:
+                        # chosenAnswer is text, try to find matching option or use it directly
+                        selected_option = None
+                        for opt in options:
+                            if isinstance(opt, dict):
+                                opt_text = opt.get('text', '') or opt.get('message', '') or opt.get('label', '')
+                                if str(opt_text).strip() == chosen_answer_str:
+                                    selected_option = opt
+                                    break
                         
-                        # Ensure it's a string and clean it up
-                        if option_message:
-                            if isinstance(option_message, bytes):
-                                option_message = option_message.decode('utf-8', errors='replace')
+                        if selected_option:
+                            # Extract from matching option
+                            message_field = selected_option.get('message', '')
+                            if isinstance(message_field, dict):
+                                option_message = (
+                                    message_field.get('en', '') or
+                                    message_field.get('en_US', '') or
+                                    message_field.get('en_IN', '') or
+                                    (list(message_field.values())[0] if message_field else '')
+                                )
+                            elif message_field:
+                                option_message = message_field
                             else:
-                                option_message = str(option_message)
-                            
-                            option_message = option_message.strip()
-                            
-                            if not option_message or option_message.startswith('{') or option_message.startswith('['):
-                                option_message = chosen_answer_str
-                            
-                            if option_message:
-                                # Get question number from poll item
-                                question_number = poll_item.get('_poll_question_number')
-                                if not question_number:
-                                    question_number = poll_item.get('questionNo')
-                                
-                                if question_number:
-                                    question_text = f"Question {question_number}"
-                                else:
-                                    question_text = (
-                                        poll_item.get('question', '') or 
-                                        poll_item.get('questionText', '') or
-                                        "Question (unknown)"
-                                    )
-                                
-                                record = {
-                                    'game_name': game_name,
-                                    'question': question_text,
-                                    'option': option_message
-                                }
-                                if language is not None:
-                                    record['language'] = language
-                                if domain is not None:
-                                    record['domain'] = domain
-                                
-                                processed_records.append(record)
-                    except Exception as e:
-                        encoding_errors += 1
-                        if debug_count < 3:
-                            print(f"      [ERROR] Record {idx+1}, Poll Item {poll_item_idx+1} (chosenAnswer): {str(e)[:50]}")
-                            debug_count += 1
-                        continue
+                                option_message = (
+                                    selected_option.get('text', '') or 
+                                    selected_option.get('label', '') or
+                                    chosen_answer_str
+                                )
+                        else:
+                            # Use chosenAnswer as the option text directly
+                            option_message = chosen_answer_str
+                    
+                    # Ensure it's a string (stripping and the fallback to chosenAnswer itself
+                    # run vectorized after extraction - see _clean_poll_options)
+                    if option_message:
+                        option_message = str(option_message)
+                        
+                        # Question number from the poll item, else its question text fields
+                        question_text = _poll_question_text(
+                            poll_item, ANSWER_QUESTION_NUMBER_KEYS, ANSWER_QUESTION_TEXT_KEYS
+                        )
+                        
+                        # One value per POLL_RECORD_COLUMNS field (language/domain may be None)
+                        add_record(game_name, question_text, option_message, chosen_answer_str, language, domain)
                 
         except Exception as e:
-            print(f"  WARNING: Error processing poll record {idx+1}: {str(e)}")
-            if debug_count < 3:
-                import traceback
-                traceback.print_exc()
-                debug_count += 1
+            # Counted for the STEP 4 summary; only the first few per chunk are printed, so a
+            # file full of bad records doesn't turn into one stdout write per record
+            record_errors += 1
+            if record_errors <= 3:
+                print(f"  WARNING: Error processing poll record {idx+1}: {str(e)}")
+                if _DEBUG and debug_count < 3:
+                    traceback.print_exc()
+                    debug_count += 1
             continue
     
-    print(f"\n[STEP 4] Processing Summary:", flush=True)
-    print(f"    - Total records processed: {len(df_poll):,}", flush=True)
-    print(f"    - Records with poll items: {records_with_poll_items:,}", flush=True)
-    print(f"    - Total poll items found: {total_poll_items_found:,}", flush=True)
-    print(f"    - Skipped (no JSON): {skipped_no_json:,}", flush=True)
-    print(f"    - Skipped (no poll structure): {skipped_no_structure:,}", flush=True)
-    print(f"    - Encoding errors handled: {encoding_errors:,}", flush=True)
-    print(f"    - Valid poll responses extracted: {len(processed_records):,}", flush=True)
+    stats = {
+        'skipped_no_json': skipped_no_json,
+        'skipped_no_structure': skipped_no_structure,
+        'records_with_poll_items': records_with_poll_items,
+        'total_poll_items_found': total_poll_items_found,
+        'encoding_errors': encoding_errors,
+        'record_errors': record_errors,
+    }
+    records = dict(zip(POLL_RECORD_COLUMNS, (game_names, questions, option_texts, option_fallbacks, languages, domains)))
+    return records, stats
+
+
+def process_parent_poll() -> pd.DataFrame:
+    """Process parent poll responses data from Excel file (NOT from database)"""
+    import sys
+    
+    print("\n" + "=" * 60, flush=True)
+    print("PROCESSING: Parent Poll Responses", flush=True)
+    print("=" * 60, flush=True)
+    print("NOTE: Reading from Excel file, NOT from database", flush=True)
+    
+    # Read poll data from CSV or Excel file (prefer CSV)
+    csv_file = 'poll_responses_raw_data.csv'
+    excel_file = 'poll_responses_raw_data.xlsx'
+    df_poll = None
+    
+    # Try CSV first
+    if os.path.exists(csv_file):
+        print(f"\n[STEP 1] Reading parent poll data from CSV file: {csv_file}", flush=True)
+        print("  This step reads the CSV file into memory...", flush=True)
+        try:
+            print("  [ACTION] Starting to read CSV file (this may take a moment for large files)...", flush=True)
+            sys.stdout.flush()
+            df_poll = pd.read_csv(csv_file, usecols=_is_poll_source_column, low_memory=False)
+            print(f"  [SUCCESS] CSV file loaded successfully!", flush=True)
+            print(f"  Total records loaded: {len(df_poll):,}", flush=True)
+            sys.stdout.flush()
+        except Exception as e:
+            print(f"  ERROR: Failed to read CSV file: {str(e)}")
+            traceback.print_exc()
+    
+    # Fallback to Excel if CSV not found or failed
+    if df_poll is None and os.path.exists(excel_file):
+        print(f"\n[STEP 1] Reading parent poll data from Excel file: {excel_file}", flush=True)
+        print("  This step reads the Excel file into memory...", flush=True)
+        try:
+            print("  [ACTION] Starting to read Excel file (this may take a moment for large files)...", flush=True)
+            sys.stdout.flush()
+            df_poll = pd.read_excel(excel_file, usecols=_is_poll_source_column)
+            print(f"  [SUCCESS] Excel file loaded successfully!", flush=True)
+            print(f"  Total records loaded: {len(df_poll):,}", flush=True)
+            sys.stdout.flush()
+        except Exception as e:
+            print(f"  ERROR: Failed to read Excel file: {str(e)}")
+            traceback.print_exc()
+    
+    if df_poll is None:
+        print(f"  ERROR: Neither '{csv_file}' nor '{excel_file}' found")
+        poll_df = empty_frame(POLL_OUTPUT_DTYPES)
+        write_csv_with_parquet(poll_df, 'data/poll_responses_data.csv')
+        return poll_df
+    
+    if df_poll.empty:
+        print("WARNING: No parent poll data found in file")
+        # Create empty dataframe with expected headers
+        poll_df = empty_frame(POLL_OUTPUT_DTYPES)
+        write_csv_with_parquet(poll_df, 'data/poll_responses_data.csv')
+        return poll_df
+    
+    # Ensure required columns exist
+    if 'custom_dimension_1' not in df_poll.columns:
+        print("ERROR: 'custom_dimension_1' column not found in file")
+        poll_df = empty_frame(POLL_OUTPUT_DTYPES)
+        write_csv_with_parquet(poll_df, 'data/poll_responses_data.csv')
+        return poll_df
+    
+    if 'game_name' not in df_poll.columns:
+        print("ERROR: 'game_name' column not found in file")
+        poll_df = empty_frame(POLL_OUTPUT_DTYPES)
+        write_csv_with_parquet(poll_df, 'data/poll_responses_data.csv')
+        return poll_df
+    
+    print(f"\n[STEP 2] Validating data structure...", flush=True)
+    print(f"  Available columns (poll-related columns only): {list(df_poll.columns)}", flush=True)
+    
+    # Normalize column names (handle case variations and spaces)
+    column_mapping = {}
+    for col in df_poll.columns:
+        col_lower = str(col).lower().strip()
+        if col_lower in ['language', 'lanuagae']:  # Handle typo
+            column_mapping['language'] = col
+        elif col_lower in ['game_code', 'gamecode', 'game code']:
+            column_mapping['game_code'] = col
+        elif col_lower == 'custom_dimension_1':
+            column_mapping['custom_dimension_1'] = col
+        elif col_lower == 'game_name':
+            column_mapping['game_name'] = col
+    
+    # Check for required columns
+    has_language = 'language' in column_mapping
+    has_game_code = 'game_code' in column_mapping
+    
+    if has_language:
+        print(f"  [INFO] Language column found in raw data: '{column_mapping['language']}'", flush=True)
+    else:
+        print(f"  [WARNING] Language column not found - checking available columns...", flush=True)
+        lang_cols = [c for c in df_poll.columns if 'lang' in str(c).lower()]
+        if lang_cols:
+            print(f"    Found potential language columns: {lang_cols}", flush=True)
+    
+    if has_game_code:
+        print(f"  [INFO] game_code column found in raw data: '{column_mapping['game_code']}' - will extract domain", flush=True)
+    else:
+        print(f"  [WARNING] game_code column not found - checking available columns...", flush=True)
+        game_code_cols = [c for c in df_poll.columns if 'game' in str(c).lower() and 'code' in str(c).lower()]
+        if game_code_cols:
+            print(f"    Found potential game_code columns: {game_code_cols}", flush=True)
+    
+    # Process each record
+    processed_records = {col: [] for col in POLL_RECORD_COLUMNS}
+    skipped_no_json = 0
+    skipped_no_structure = 0
+    records_with_poll_items = 0
+    total_poll_items_found = 0
+    encoding_errors = 0
+    record_errors = 0
+    
+    print(f"\n[STEP 3] Processing {len(df_poll):,} poll records...")
+    print(f"  This step extracts poll responses from JSON in custom_dimension_1 column")
+    print(f"  Progress will be shown every 10,000 records...")
+    sys.stdout.flush()
+    last_flush = time.monotonic()
+    
+    # Pull the needed columns out once and split into 10,000-row chunks. The JSON walk is
+    # CPU-bound and independent per row, so chunks are spread across a process pool.
+    # Each chunk is zipped straight from slices of the column lists, so the full table of
+    # row tuples is never built just to be sliced up again.
+    total_rows = len(df_poll)
+    missing_col = [None] * total_rows
+    columns = (
+        range(total_rows),
+        df_poll[column_mapping.get('custom_dimension_1', 'custom_dimension_1')].tolist(),
+        df_poll[column_mapping.get('game_name', 'game_name')].tolist(),
+        df_poll[column_mapping['language']].tolist() if has_language else missing_col,
+        df_poll[column_mapping['game_code']].tolist() if has_game_code else missing_col,
+    )
+    chunk_size = 10000
+    chunks = [
+        list(zip(*(col[i:i + chunk_size] for col in columns)))
+        for i in range(0, total_rows, chunk_size)
+    ]
+    del columns, missing_col
+    workers = min(os.cpu_count() or 1, len(chunks))
+    if workers > 1:
+        print(f"  [INFO] Using {workers} worker processes", flush=True)
+    
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        chunk_results = pool.imap(_extract_poll_records, chunks) if pool else map(_extract_poll_records, chunks)
+        rows_done = 0
+        for (chunk_records, chunk_stats), chunk in zip(chunk_results, chunks):
+            for col, values in chunk_records.items():
+                processed_records[col].extend(values)
+            skipped_no_json += chunk_stats['skipped_no_json']
+            skipped_no_structure += chunk_stats['skipped_no_structure']
+            records_with_poll_items += chunk_stats['records_with_poll_items']
+            total_poll_items_found += chunk_stats['total_poll_items_found']
+            encoding_errors += chunk_stats['encoding_errors']
+            record_errors += chunk_stats['record_errors']
+            rows_done += len(chunk)
+            
+            # Progress indicator (flush at most once a second so stdout doesn't throttle the loop)
+            if rows_done % chunk_size == 0:
+                print(f"\n    [PROGRESS] {rows_done:,}/{total_rows:,} records processed")
+                print(f"      - Records with poll items: {records_with_poll_items:,}")
+                print(f"      - Total poll responses extracted: {total_poll_items_found:,}")
+                print(f"      - Skipped (no JSON): {skipped_no_json:,}")
+                print(f"      - Skipped (no structure): {skipped_no_structure:,}")
+                now = time.monotonic()
+                if now - last_flush >= 1.0:
+                    sys.stdout.flush()
+                    last_flush = now
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    
+    # Summary lines are buffered and flushed once at the end of the block
+    print(f"\n[STEP 4] Processing Summary:")
+    print(f"    - Total records processed: {len(df_poll):,}")
+    print(f"    - Records with poll items: {records_with_poll_items:,}")
+    print(f"    - Total poll items found: {total_poll_items_found:,}")
+    print(f"    - Skipped (no JSON): {skipped_no_json:,}")
+    print(f"    - Skipped (no poll structure): {skipped_no_structure:,}")
+    print(f"    - Skipped (errors): {record_errors:,}")
+    # Option text is cleaned column-wise; items whose answer ends up blank are not responses
+    results_df = _clean_poll_options(pd.DataFrame(processed_records))
+    del processed_records
+    print(f"    - Encoding errors handled: {encoding_errors:,}")
+    print(f"    - Valid poll responses extracted: {len(results_df):,}")
     sys.stdout.flush()
     
-    if not processed_records:
+    if results_df.empty:
         print("\n  WARNING: No valid poll responses found after processing")
-        poll_df = pd.DataFrame(columns=['game_name', 'question', 'option', 'count', 'language', 'domain'])
-        poll_df.to_csv('data/poll_responses_data.csv', index=False)
+        poll_df = empty_frame(POLL_OUTPUT_DTYPES)
+        write_csv_with_parquet(poll_df, 'data/poll_responses_data.csv')
         return poll_df
     
     # Convert to DataFrame
-    print(f"\n[STEP 5] Converting to DataFrame...", flush=True)
-    results_df = pd.DataFrame(processed_records)
-    print(f"    Created DataFrame with {len(results_df)} rows", flush=True)
+    print(f"\n[STEP 5] Converting to DataFrame...")
+    # Replace anything that can't be encoded as UTF-8 (lone surrogates from \ud800-style JSON
+    # escapes) - once per distinct option instead of an encode/decode round trip per poll item
+    results_df['option'] = map_distinct(
+        results_df['option'], lambda text: text.encode('utf-8', errors='replace').decode('utf-8')
+    )
+    # language/domain are only meaningful when the raw file carried them
+    results_df = results_df.drop(columns=[c for c in ('language', 'domain') if results_df[c].isna().all()])
+    # game_name, question and option each repeat a few distinct values across all responses -
+    # category dtype keeps memory down and lets the groupby below work on integer codes
+    results_df = results_df.astype({'game_name': 'category', 'question': 'category', 'option': 'category'})
+    print(f"    Created DataFrame with {len(results_df)} rows")
     
     # Aggregate: generate all combinations like summary_data.csv
     # 1. Overall totals (domain='All', language='All')
@@ -5146,16 +5260,24 @@ def process_parent_poll() -> pd.DataFrame:
     # Fill NaN values in language and domain with 'Unknown' for grouping
     if 'language' in results_df.columns:
         results_df['language'] = results_df['language'].fillna('Unknown')
-        print(f"  [INFO] Language column found - unique values: {results_df['language'].nunique()}", flush=True)
+        if _DEBUG:
+            print(f"  [INFO] Language column found - unique values: {results_df['language'].nunique()}", flush=True)
     if 'domain' in results_df.columns:
         results_df['domain'] = results_df['domain'].fillna('Unknown')
-        print(f"  [INFO] Domain column found - unique values: {results_df['domain'].nunique()}", flush=True)
+        if _DEBUG:
+            print(f"  [INFO] Domain column found - unique values: {results_df['domain'].nunique()}", flush=True)
     
     all_combinations = []
     
+    # Count responses once at the finest grain; the counts are additive, so every coarser
+    # combination is summed from these (far fewer) rows instead of re-hashing all responses
+    response_cols = ['game_name', 'question', 'option']
+    detail_cols = response_cols + [c for c in ('domain', 'language') if c in results_df.columns]
+    detail_counts = results_df.groupby(detail_cols, sort=False, observed=True).size().reset_index(name='count')
+    
     # 1. Overall totals (domain='All', language='All')
     print(f"  [1/4] Calculating overall totals (domain='All', language='All')...", flush=True)
-    overall = results_df.groupby(['game_name', 'question', 'option']).size().reset_index(name='count')
+    overall = detail_counts.groupby(response_cols, sort=False, observed=True)['count'].sum().reset_index()
     overall['domain'] = 'All'
     overall['language'] = 'All'
     all_combinations.append(overall)
@@ -5164,7 +5286,7 @@ def process_parent_poll() -> pd.DataFrame:
     # 2. By domain only (domain='CG', language='All')
     if 'domain' in results_df.columns:
         print(f"  [2/4] Calculating by domain only (language='All')...", flush=True)
-        by_domain = results_df.groupby(['game_name', 'question', 'option', 'domain']).size().reset_index(name='count')
+        by_domain = detail_counts.groupby(response_cols + ['domain'], sort=False, observed=True)['count'].sum().reset_index()
         by_domain['language'] = 'All'
         # Remove rows where domain is 'Unknown'
         by_domain = by_domain[by_domain['domain'] != 'Unknown']
@@ -5174,7 +5296,7 @@ def process_parent_poll() -> pd.DataFrame:
     # 3. By language only (domain='All', language='hi')
     if 'language' in results_df.columns:
         print(f"  [3/4] Calculating by language only (domain='All')...", flush=True)
-        by_language = results_df.groupby(['game_name', 'question', 'option', 'language']).size().reset_index(name='count')
+        by_language = detail_counts.groupby(response_cols + ['language'], sort=False, observed=True)['count'].sum().reset_index()
         by_language['domain'] = 'All'
         # Remove rows where language is 'Unknown'
         by_language = by_language[by_language['language'] != 'Unknown']
@@ -5184,7 +5306,7 @@ def process_parent_poll() -> pd.DataFrame:
     # 4. By both (domain='CG', language='hi')
     if 'domain' in results_df.columns and 'language' in results_df.columns:
         print(f"  [4/4] Calculating by both domain and language...", flush=True)
-        by_both = results_df.groupby(['game_name', 'question', 'option', 'domain', 'language']).size().reset_index(name='count')
+        by_both = detail_counts
         # Remove rows where domain or language is 'Unknown'
         by_both = by_both[(by_both['domain'] != 'Unknown') & (by_both['language'] != 'Unknown')]
         all_combinations.append(by_both)
@@ -5213,14 +5335,15 @@ def process_parent_poll() -> pd.DataFrame:
         agg_df = pd.concat(reordered_combinations, ignore_index=True)
         
         print(f"  Total records after combining all combinations: {len(agg_df):,}", flush=True)
-        if 'language' in agg_df.columns:
+        # Listing the distinct values needs a full unique()+sort - debug runs only
+        if _DEBUG and 'language' in agg_df.columns:
             print(f"  Unique languages: {sorted(agg_df['language'].unique())}", flush=True)
-        if 'domain' in agg_df.columns:
+        if _DEBUG and 'domain' in agg_df.columns:
             print(f"  Unique domains: {sorted(agg_df['domain'].dropna().unique())}", flush=True)
     else:
         # Fallback: basic aggregation if no language/domain columns
         print(f"  [FALLBACK] Basic aggregation (no language/domain columns)...", flush=True)
-        agg_df = results_df.groupby(['game_name', 'question', 'option']).size().reset_index(name='count')
+        agg_df = results_df.groupby(['game_name', 'question', 'option'], sort=False, observed=True).size().reset_index(name='count')
         agg_df['domain'] = 'All'
         agg_df['language'] = 'All'
     
@@ -5243,7 +5366,7 @@ def process_parent_poll() -> pd.DataFrame:
     # Show sample of games
     if len(agg_df) > 0:
         print(f"\n  Games with poll data:", flush=True)
-        game_counts = agg_df.groupby('game_name')['count'].sum().sort_values(ascending=False)
+        game_counts = agg_df.groupby('game_name', observed=True)['count'].sum().sort_values(ascending=False)
         for game, count in game_counts.head(10).items():
             print(f"    - {game}: {count:,} responses", flush=True)
         if len(game_counts) > 10:
@@ -5251,14 +5374,15 @@ def process_parent_poll() -> pd.DataFrame:
     
     # Save to CSV
     print(f"\n[STEP 8] Saving to data/poll_responses_data.csv...", flush=True)
-    agg_df.to_csv('data/poll_responses_data.csv', index=False)
+    if write_csv_with_parquet(agg_df, 'data/poll_responses_data.csv'):
+        print(f"  [OK] Parquet copy saved to data/poll_responses_data.parquet")
     print(f"  [SUCCESS] Saved data/poll_responses_data.csv ({len(agg_df)} records)", flush=True)
     sys.stdout.flush()
     
     return agg_df
 
 
-def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
+def process_question_correctness(use_database: bool = False, df_score: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """Process question correctness data by fetching from Redshift database
     
     Uses the same query and processing method as score distribution for each game.
@@ -5266,21 +5390,24 @@ def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
     
     Args:
         use_database: If True, fetch directly from Redshift (always True now, CSV removed)
+        df_score: Result of QUESTION_CORRECTNESS_QUERY if it was already fetched (e.g. prefetched by main())
     """
     print("\n" + "=" * 60)
     print("PROCESSING: Question Correctness Data")
     print("=" * 60)
     
-    df_score = pd.DataFrame()
-    
-    print("\nStep 1: Fetching data from Redshift database...")
-    df_score = fetch_score_dataframe()
+    if df_score is None:
+        print("\nStep 1: Fetching data from Redshift database...")
+        print("  [INFO] Collapsing duplicate events to one row per user per payload in SQL...")
+        df_score = fetch_score_dataframe(QUESTION_CORRECTNESS_QUERY)
+    else:
+        print("\nStep 1: Using data prefetched from Redshift database...")
     
     if df_score.empty:
         print(f"  [ERROR] No data fetched from Redshift")
         print(f"  [ERROR] Please ensure Redshift is accessible and the query returns data")
-        question_correctness_df = pd.DataFrame(columns=['game_name','question_number','correctness','percent','user_count','total_users'])
-        question_correctness_df.to_csv('data/question_correctness_data.csv', index=False)
+        question_correctness_df = empty_frame(QUESTION_CORRECTNESS_OUTPUT_DTYPES)
+        write_csv_with_parquet(question_correctness_df, 'data/question_correctness_data.csv')
         return question_correctness_df
         
     # Check required columns
@@ -5295,8 +5422,8 @@ def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
         if not has_visitor_id:
             print(f"  [ERROR] Missing visitor ID column (need either 'idvisitor_hex' or 'idvisitor_converted')")
         print(f"  [INFO] Available columns: {list(df_score.columns)}")
-        question_correctness_df = pd.DataFrame(columns=['game_name','question_number','correctness','percent','user_count','total_users'])
-        question_correctness_df.to_csv('data/question_correctness_data.csv', index=False)
+        question_correctness_df = empty_frame(QUESTION_CORRECTNESS_OUTPUT_DTYPES)
+        write_csv_with_parquet(question_correctness_df, 'data/question_correctness_data.csv')
         return question_correctness_df
     print(f"  [OK] All required columns present")
     
@@ -5310,15 +5437,15 @@ def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
     if 'server_time' in df_score.columns:
         try:
             print(f"  [ACTION] Converting server_time to datetime...")
-            df_score['server_time'] = pd.to_datetime(df_score['server_time'])
+            df_score['server_time'] = parse_timestamps(df_score['server_time'])
             print(f"  [OK] Datetime conversion complete")
         except Exception as e:
             print(f"  [WARNING] Could not convert server_time: {e}")
     
     if df_score.empty:
         print("  [WARNING] No data found")
-        question_correctness_df = pd.DataFrame(columns=['game_name','question_number','correctness','percent','user_count','total_users'])
-        question_correctness_df.to_csv('data/question_correctness_data.csv', index=False)
+        question_correctness_df = empty_frame(QUESTION_CORRECTNESS_OUTPUT_DTYPES)
+        write_csv_with_parquet(question_correctness_df, 'data/question_correctness_data.csv')
         return question_correctness_df
     
     # Print success message
@@ -5332,8 +5459,8 @@ def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
         print(f"  [INFO] Language column found: will be included in output")
         # Transform language column: if contains "mr-IN" then "mr", else "hi" (same as score distribution)
         print(f"  [ACTION] Transforming language column...")
-        df_score['language'] = df_score['language'].apply(
-            lambda x: 'mr' if pd.notna(x) and 'mr-IN' in str(x) else 'hi'
+        df_score['language'] = map_distinct(
+            df_score['language'], lambda x: 'mr' if pd.notna(x) and 'mr-IN' in str(x) else 'hi'
         )
         print(f"  [OK] Language transformation complete")
     if has_game_code:
@@ -5347,8 +5474,8 @@ def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
     if per_question_df.empty:
         print("  [WARNING] No per-question correctness data extracted")
         print("  [WARNING] Check the logs above for processing details")
-        question_correctness_df = pd.DataFrame(columns=['game_name','question_number','correctness','percent','user_count','total_users'])
-        question_correctness_df.to_csv('data/question_correctness_data.csv', index=False)
+        question_correctness_df = empty_frame(QUESTION_CORRECTNESS_OUTPUT_DTYPES)
+        write_csv_with_parquet(question_correctness_df, 'data/question_correctness_data.csv')
         return question_correctness_df
     
     print(f"\n  [OK] Extracted {len(per_question_df):,} per-question records")
@@ -5368,18 +5495,31 @@ def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
         print("  [INFO] Game code column found: will be included in aggregation")
     
     print("  [ACTION] Calculating total users per question...")
-    # Calculate total users per question (users who attempted the question)
     # Group by game_name, question_number, and optionally language and game_code
     groupby_cols = ['game_name', 'question_number']
     if has_language_in_df:
         groupby_cols.append('language')
     if has_game_code_in_df:
         groupby_cols.append('game_code')
+    agg_groupby_cols = groupby_cols[:2] + ['is_correct'] + groupby_cols[2:]
+    
+    # Deduplicate users once at the finest grain, then count them instead of running
+    # nunique() over every per-question row twice. Rows without an idvisitor are kept (one
+    # per group after the dedupe) and skipped by count(), so a group with no known users
+    # still comes out with 0 as it did with nunique()
+    users_by_outcome = (
+        per_question_df[agg_groupby_cols + ['idvisitor_converted']]
+        .drop_duplicates()
+    )
     
+    # Calculate total users per question (users who attempted the question).
+    # A user can have both outcomes for the same question, so dedupe again without
+    # is_correct rather than summing the per-outcome counts.
     total_by_q = (
-        per_question_df
-        .groupby(groupby_cols)['idvisitor_converted']
-        .nunique()
+        users_by_outcome
+        .drop_duplicates(subset=groupby_cols + ['idvisitor_converted'])
+        .groupby(groupby_cols, observed=True, sort=False)['idvisitor_converted']
+        .count()
         .reset_index(name='total_users')
     )
     
@@ -5387,17 +5527,10 @@ def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
     
     print("  [ACTION] Calculating correct and incorrect user counts...")
     # Calculate correct and incorrect user counts per question
-    # Group by game_name, question_number, is_correct, and optionally language and game_code
-    agg_groupby_cols = ['game_name', 'question_number', 'is_correct']
-    if has_language_in_df:
-        agg_groupby_cols.append('language')
-    if has_game_code_in_df:
-        agg_groupby_cols.append('game_code')
-    
     agg = (
-        per_question_df
-        .groupby(agg_groupby_cols)['idvisitor_converted']
-        .nunique()
+        users_by_outcome
+        .groupby(agg_groupby_cols, observed=True, sort=False)['idvisitor_converted']
+        .count()
         .reset_index(name='user_count')
     )
     
@@ -5414,10 +5547,18 @@ def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
     
     # Calculate percentage
     print("  [ACTION] Calculating percentages...")
-    agg['percent'] = (agg['user_count'] / agg['total_users'].where(agg['total_users'] > 0, 1) * 100).round(2)
-    
-    # Map is_correct to Correct/Incorrect
-    agg['correctness'] = agg['is_correct'].map({1: 'Correct', 0: 'Incorrect'})
+    user_count = agg['user_count'].to_numpy(dtype=np.float64)
+    total_users = agg['total_users'].to_numpy(dtype=np.float64)
+    share = np.zeros_like(user_count)
+    np.divide(user_count, total_users, out=share, where=total_users > 0)
+    agg['percent'] = np.round(share * 100, 2)
+    
+    # Map is_correct to Correct/Incorrect (code -1 leaves anything else as NaN)
+    is_correct = agg['is_correct'].to_numpy()
+    agg['correctness'] = pd.Categorical.from_codes(
+        np.where(is_correct == 1, 0, np.where(is_correct == 0, 1, -1)),
+        categories=['Correct', 'Incorrect']
+    )
     
     # Select and order columns
     output_cols = ['game_name', 'question_number', 'correctness', 'percent', 'user_count', 'total_users']
@@ -5439,8 +5580,10 @@ def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
     print(f"  [OK] Sorting complete")
     
     print("\nStep 4: Saving results to CSV...")
-    question_correctness_df.to_csv('data/question_correctness_data.csv', index=False)
-    print(f"  [OK] Question correctness data saved to data/question_correctness_data.csv")
+    if write_csv_with_parquet(question_correctness_df, 'data/question_correctness_data.csv'):
+        print(f"  [OK] Question correctness data saved to data/question_correctness_data.csv (+ .parquet)")
+    else:
+        print(f"  [OK] Question correctness data saved to data/question_correctness_data.csv")
     
     print("\n" + "=" * 60)
     print("QUESTION CORRECTNESS PROCESSING COMPLETE")
@@ -5456,6 +5599,19 @@ def process_question_correctness(use_database: bool = False) -> pd.DataFrame:
     return question_correctness_df
 
 
+def _csv_row_count(path: str) -> int:
+    """Count data rows in a CSV (lines minus header) by scanning raw bytes, without parsing"""
+    line_count = 0
+    last_byte = b'\n'
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            line_count += block.count(b'\n')
+            last_byte = block[-1:]
+    if last_byte != b'\n':
+        line_count += 1  # Final line without a trailing newline
+    return line_count - 1  # Subtract header
+
+
 def update_metadata(df_main: Optional[pd.DataFrame] = None):
     """Update metadata JSON file"""
     print("\n" + "=" * 60)
@@ -5468,8 +5624,8 @@ def update_metadata(df_main: Optional[pd.DataFrame] = None):
     
     if os.path.exists(metadata_file):
         print("  Loading existing metadata...")
-        with open(metadata_file, 'r') as f:
-            metadata = json.load(f)
+        with open(metadata_file, 'rb') as f:
+            metadata = load_json(f.read())
         sys.stdout.flush()
     
     # Load data files to get current record counts
@@ -5490,8 +5646,7 @@ def update_metadata(df_main: Optional[pd.DataFrame] = None):
             sys.stdout.flush()
             # Just count lines instead of loading full CSV
             try:
-                with open('data/processed_data.csv', 'r', encoding='utf-8') as f:
-                    line_count = sum(1 for _ in f) - 1  # Subtract header
+                line_count = _csv_row_count('data/processed_data.csv')
                 record_counts['main_data_records'] = line_count
                 print(f"  ✓ Counted {line_count:,} records in processed_data.csv")
             except Exception as e:
@@ -5513,8 +5668,7 @@ def update_metadata(df_main: Optional[pd.DataFrame] = None):
         if os.path.exists(csv_file):
             try:
                 # Count lines instead of loading full CSV
-                with open(csv_file, 'r', encoding='utf-8') as f:
-                    line_count = sum(1 for _ in f) - 1  # Subtract header
+                line_count = _csv_row_count(csv_file)
                 record_counts[key] = line_count
                 print(f"    ✓ {key}: {line_count:,} records")
             except Exception as e:
@@ -5532,8 +5686,13 @@ def update_metadata(df_main: Optional[pd.DataFrame] = None):
         **record_counts
     })
     
-    with open(metadata_file, 'w') as f:
-        json.dump(metadata, f, indent=2)
+    if ORJSON_AVAILABLE:
+        # orjson encodes straight to UTF-8 bytes (same 2-space layout as json.dump)
+        with open(metadata_file, 'wb') as f:
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(metadata_file, 'w') as f:
+            json.dump(metadata, f, indent=2)
     print("  ✓ SUCCESS: Saved data/metadata.json")
     sys.stdout.flush()
         
@@ -5585,7 +5744,6 @@ def process_video_viewership() -> pd.DataFrame:
     
     # Step 1: Base interactions data
     print("\nStep 1: Fetching base interactions data...")
-    import time
     max_retries = 3
     retry_delay = 5
     
@@ -5593,29 +5751,16 @@ def process_video_viewership() -> pd.DataFrame:
     for attempt in range(1, max_retries + 1):
         try:
             print(f"  [ACTION] Connecting to REDSHIFT (Attempt {attempt}/{max_retries})...")
-            conn = psycopg2.connect(
-                host=REDSHIFT_HOST,
-                database=REDSHIFT_DATABASE,
-                port=REDSHIFT_PORT,
-                user=REDSHIFT_USER,
-                password=REDSHIFT_PASSWORD,
-                connect_timeout=60,
-                keepalives=1,
-                keepalives_idle=30,
-                keepalives_interval=10,
-                keepalives_count=5
-            )
+            with redshift_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SET statement_timeout = '1800000'")
+                    conn.commit()
             
-            with conn.cursor() as cur:
-                cur.execute("SET statement_timeout = '1800000'")
-                conn.commit()
-            
-            print(f"  ✓ Successfully connected to REDSHIFT")
-            print(f"  [ACTION] Executing base interactions query...")
-            df_base = pd.read_sql(VIDEO_BASE_QUERY, conn)
-            print(f"  ✓ Fetched {len(df_base)} records")
+                print(f"  ✓ Successfully connected to REDSHIFT")
+                print(f"  [ACTION] Executing base interactions query...")
+                df_base = read_sql_chunked(conn, VIDEO_BASE_QUERY)
+                print(f"  ✓ Fetched {len(df_base)} records")
             
-            conn.close()
             break
             
         except Exception as e:
@@ -5647,8 +5792,8 @@ def process_video_viewership() -> pd.DataFrame:
     
     # Step 2: Standardize language
     print("\nStep 2: Standardizing language...")
-    df_base['language'] = df_base['name1'].apply(
-        lambda x: 'mr' if pd.notna(x) and 'mr-IN' in str(x) else 'hi'
+    df_base['language'] = map_distinct(
+        df_base['name1'], lambda x: 'mr' if pd.notna(x) and 'mr-IN' in str(x) else 'hi'
     )
     print(f"  ✓ Language standardized: {df_base['language'].value_counts().to_dict()}")
     
@@ -5684,27 +5829,14 @@ def process_video_viewership() -> pd.DataFrame:
     df_game_mapping = pd.DataFrame()
     for attempt in range(1, max_retries + 1):
         try:
-            conn = psycopg2.connect(
-                host=REDSHIFT_HOST,
-                database=REDSHIFT_DATABASE,
-                port=REDSHIFT_PORT,
-                user=REDSHIFT_USER,
-                password=REDSHIFT_PASSWORD,
-                connect_timeout=60,
-                keepalives=1,
-                keepalives_idle=30,
-                keepalives_interval=10,
-                keepalives_count=5
-            )
-            
-            with conn.cursor() as cur:
-                cur.execute("SET statement_timeout = '1800000'")
-                conn.commit()
+            with redshift_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("SET statement_timeout = '1800000'")
+                    conn.commit()
             
-            df_game_mapping = pd.read_sql(VIDEO_GAME_MAPPING_QUERY, conn)
-            print(f"  ✓ Fetched {len(df_game_mapping)} game mappings")
+                df_game_mapping = pd.read_sql(VIDEO_GAME_MAPPING_QUERY, conn)
+                print(f"  ✓ Fetched {len(df_game_mapping)} game mappings")
             
-            conn.close()
             break
             
         except Exception as e:
@@ -5761,12 +5893,13 @@ def process_video_viewership() -> pd.DataFrame:
     before_join = len(df_base)
     
     # Debug: Check original data types and sample values
-    print(f"  [DEBUG] df_base['custom_dimension_2'] dtype: {df_base['custom_dimension_2'].dtype}")
-    print(f"  [DEBUG] df_game_mapping['activity_id'] dtype: {df_game_mapping['activity_id'].dtype}")
-    print(f"  [DEBUG] Sample custom_dimension_2 values: {df_base['custom_dimension_2'].dropna().head(10).tolist()}")
-    print(f"  [DEBUG] Sample activity_id values: {df_game_mapping['activity_id'].head(10).tolist()}")
-    print(f"  [DEBUG] Unique custom_dimension_2 count: {df_base['custom_dimension_2'].nunique()}")
-    print(f"  [DEBUG] Unique activity_id count: {df_game_mapping['activity_id'].nunique()}")
+    if _DEBUG:
+        print(f"  [DEBUG] df_base['custom_dimension_2'] dtype: {df_base['custom_dimension_2'].dtype}")
+        print(f"  [DEBUG] df_game_mapping['activity_id'] dtype: {df_game_mapping['activity_id'].dtype}")
+        print(f"  [DEBUG] Sample custom_dimension_2 values: {df_base['custom_dimension_2'].dropna().head(10).tolist()}")
+        print(f"  [DEBUG] Sample activity_id values: {df_game_mapping['activity_id'].head(10).tolist()}")
+        print(f"  [DEBUG] Unique custom_dimension_2 count: {df_base['custom_dimension_2'].nunique()}")
+        print(f"  [DEBUG] Unique activity_id count: {df_game_mapping['activity_id'].nunique()}")
     
     # Convert both columns to the same type (string) for merging
     # First, convert to numeric if possible, then to string to ensure exact match
@@ -5780,8 +5913,9 @@ def process_video_viewership() -> pd.DataFrame:
     df_game_mapping['activity_id'] = df_game_mapping['activity_id'].astype(int).astype(str)
     
     # Debug: Check converted values
-    print(f"  [DEBUG] After conversion - Sample custom_dimension_2: {df_base['custom_dimension_2'].head(10).tolist()}")
-    print(f"  [DEBUG] After conversion - Sample activity_id: {df_game_mapping['activity_id'].head(10).tolist()}")
+    if _DEBUG:
+        print(f"  [DEBUG] After conversion - Sample custom_dimension_2: {df_base['custom_dimension_2'].head(10).tolist()}")
+        print(f"  [DEBUG] After conversion - Sample activity_id: {df_game_mapping['activity_id'].head(10).tolist()}")
     
     # Check for overlapping values
     base_values = set(df_base['custom_dimension_2'].unique())
@@ -5849,12 +5983,14 @@ def process_video_viewership() -> pd.DataFrame:
     
     # Point 3: Join Metric Block A and B
     print("\nPoint 3: Joining Metric Block A and B...")
-    print(f"  [DEBUG] Metric A games: {sorted(metric_a_pivot['game_name'].unique().tolist())}")
-    print(f"  [DEBUG] Metric B games: {sorted(metric_b['game_name'].unique().tolist()) if not metric_b.empty else 'N/A'}")
+    if _DEBUG:
+        print(f"  [DEBUG] Metric A games: {sorted(metric_a_pivot['game_name'].unique().tolist())}")
+        print(f"  [DEBUG] Metric B games: {sorted(metric_b['game_name'].unique().tolist()) if not metric_b.empty else 'N/A'}")
     point_3 = metric_a_pivot.merge(metric_b, on=['game_name', 'language'], how='left')
     point_3['Video Started'] = point_3['Video Started'].fillna(0).astype(int)
     print(f"  ✓ Joined on game_name and language: {len(point_3)} rows")
-    print(f"  [DEBUG] Point 3 games: {sorted(point_3['game_name'].unique().tolist())}")
+    if _DEBUG:
+        print(f"  [DEBUG] Point 3 games: {sorted(point_3['game_name'].unique().tolist())}")
     
     # Metric Block C (Point 4): Watch time analysis
     print("\nMetric Block C: Calculating watch time analysis...")
@@ -5910,7 +6046,7 @@ def process_video_viewership() -> pd.DataFrame:
     print(f"  ✓ Filtered to {len(df_watch_time)} records with watch time data")
     
     # Debug: Check which games have watch time data
-    if not df_watch_time.empty:
+    if _DEBUG and not df_watch_time.empty:
         print(f"  [DEBUG] Games with watch time data: {sorted(df_watch_time['game_name'].unique().tolist())}")
         print(f"  [DEBUG] Languages with watch time data: {sorted(df_watch_time['language'].unique().tolist())}")
         
@@ -5928,15 +6064,18 @@ def process_video_viewership() -> pd.DataFrame:
     if not df_watch_time.empty:
         # Average watch time - group by game_name and language
         metric_c_avg = df_watch_time.groupby(['game_name', 'language'])['watch_time_value'].mean().reset_index(name='Average')
-        print(f"  [DEBUG] Metric C Avg: {len(metric_c_avg)} rows, games: {sorted(metric_c_avg['game_name'].unique().tolist())}")
+        if _DEBUG:
+            print(f"  [DEBUG] Metric C Avg: {len(metric_c_avg)} rows, games: {sorted(metric_c_avg['game_name'].unique().tolist())}")
         
         # Count distinct idlink_va where value <= 10 (min) - group by game_name and language
         metric_c_min = df_watch_time[df_watch_time['watch_time_value'] <= 10].groupby(['game_name', 'language'])['idlink_va'].nunique().reset_index(name='Min')
-        print(f"  [DEBUG] Metric C Min: {len(metric_c_min)} rows, games: {sorted(metric_c_min['game_name'].unique().tolist())}")
+        if _DEBUG:
+            print(f"  [DEBUG] Metric C Min: {len(metric_c_min)} rows, games: {sorted(metric_c_min['game_name'].unique().tolist())}")
         
         # Count distinct idlink_va where value >= 200 (max) - group by game_name and language
         metric_c_max = df_watch_time[df_watch_time['watch_time_value'] >= 200].groupby(['game_name', 'language'])['idlink_va'].nunique().reset_index(name='Max')
-        print(f"  [DEBUG] Metric C Max: {len(metric_c_max)} rows, games: {sorted(metric_c_max['game_name'].unique().tolist())}")
+        if _DEBUG:
+            print(f"  [DEBUG] Metric C Max: {len(metric_c_max)} rows, games: {sorted(metric_c_max['game_name'].unique().tolist())}")
         
         # Join all three metrics on game_name and language
         print(f"  [ACTION] Joining Metric C components on game_name and language...")
@@ -5945,8 +6084,9 @@ def process_video_viewership() -> pd.DataFrame:
         metric_c['Min'] = metric_c['Min'].fillna(0).astype(int)
         metric_c['Max'] = metric_c['Max'].fillna(0).astype(int)
         print(f"  ✓ Watch time analysis calculated: {len(metric_c)} rows")
-        print(f"  [DEBUG] Final Metric C games: {sorted(metric_c['game_name'].unique().tolist())}")
-        print(f"  [DEBUG] Final Metric C languages: {sorted(metric_c['language'].unique().tolist())}")
+        if _DEBUG:
+            print(f"  [DEBUG] Final Metric C games: {sorted(metric_c['game_name'].unique().tolist())}")
+            print(f"  [DEBUG] Final Metric C languages: {sorted(metric_c['language'].unique().tolist())}")
     else:
         metric_c = pd.DataFrame(columns=['game_name', 'language', 'Average', 'Min', 'Max'])
         print(f"  ⚠ No watch time data found")
@@ -5955,8 +6095,9 @@ def process_video_viewership() -> pd.DataFrame:
     # Use INNER join so we only get games that are in both Point 3 and Metric C
     # This naturally filters to only games with watch time data
     print("\nFinal Output: Joining Point 3 and Point 4...")
-    print(f"  [DEBUG] Games in Point 3: {len(point_3)} rows, unique games: {sorted(point_3['game_name'].unique().tolist())}")
-    print(f"  [DEBUG] Games in Metric C: {len(metric_c)} rows, unique games: {sorted(metric_c['game_name'].unique().tolist()) if not metric_c.empty else 'N/A'}")
+    if _DEBUG:
+        print(f"  [DEBUG] Games in Point 3: {len(point_3)} rows, unique games: {sorted(point_3['game_name'].unique().tolist())}")
+        print(f"  [DEBUG] Games in Metric C: {len(metric_c)} rows, unique games: {sorted(metric_c['game_name'].unique().tolist()) if not metric_c.empty else 'N/A'}")
     final_output = point_3.merge(metric_c, on=['game_name', 'language'], how='inner')
     final_output['Average'] = final_output['Average'].fillna(0)
     final_output['Min'] = final_output['Min'].fillna(0).astype(int)
@@ -6001,7 +6142,7 @@ def process_video_viewership() -> pd.DataFrame:
     # Save to CSV
     output_path = 'data/video_viewership_data.csv'
     print(f"\nSaving video viewership data to {output_path}...")
-    final_output.to_csv(output_path, index=False)
+    write_csv(final_output, output_path)
     print(f"✓ SUCCESS: Saved {output_path} ({len(final_output)} records)")
     
     return final_output
@@ -6045,6 +6186,8 @@ Available visuals:
   --video-viewership   Video viewership metrics
   --all                Process all visuals (default if no flags provided)
   --metadata           Update metadata file
+  --parallel           Run score distribution, parent poll and video viewership
+                       in worker processes alongside the other visuals
         """
     )
     
@@ -6059,6 +6202,7 @@ Available visuals:
     parser.add_argument('--all', action='store_true', help='Process all visuals (default)')
     parser.add_argument('--metadata', action='store_true', help='Update metadata file')
     parser.add_argument('--use-database', action='store_true', help='Fetch score data directly from Redshift instead of using scores_data.csv')
+    parser.add_argument('--parallel', action='store_true', help='Run the visuals that do not use the main data in worker processes')
     
     args = parser.parse_args()
     
@@ -6080,9 +6224,38 @@ Available visuals:
         print("  python preprocess_data.py --score-distribution --time-series")
         print("  See --help for more options.\n")
     
+    # Start the question correctness fetch on a worker thread right away so its Redshift
+    # round trip overlaps the earlier stages instead of running after them
+    question_fetch = None
+    if args.question_correctness or process_all:
+        prefetch_executor = ThreadPoolExecutor(max_workers=1)
+        question_fetch = prefetch_executor.submit(fetch_score_dataframe, QUESTION_CORRECTNESS_QUERY)
+        prefetch_executor.shutdown(wait=False)
+    
+    stage_executor = None
     try:
         df_main = None
         
+        # With --parallel, the visuals that don't use df_main (each reads its own source and
+        # writes its own CSV) run in worker processes while the main-data visuals run here.
+        # Their output interleaves with this process's; they are awaited before metadata.
+        # Workers are spawned, not forked: the question correctness prefetch thread may be
+        # inside the Redshift pool (holding its lock) at this point, and a forked child would
+        # inherit that lock already taken and block forever on its first connection.
+        background_stages = {}
+        if args.parallel:
+            stage_executor = ProcessPoolExecutor(max_workers=3, mp_context=get_context('spawn'))
+            if args.score_distribution or process_all:
+                background_stages['score_distribution'] = stage_executor.submit(
+                    process_score_distribution, use_database=args.use_database
+                )
+            if args.parent_poll or process_all:
+                background_stages['parent_poll'] = stage_executor.submit(process_parent_poll)
+            if args.video_viewership or process_all:
+                background_stages['video_viewership'] = stage_executor.submit(process_video_viewership)
+            print(f"[INFO] Running in worker processes: {', '.join(background_stages) or 'none'}")
+            sys.stdout.flush()
+        
         # Process main data if requested or if processing all
         if args.main or process_all:
             df_main = process_main_data()
@@ -6092,7 +6265,7 @@ Available visuals:
             process_summary_data(df_main)
         
         # Process score distribution if requested or if processing all
-        if args.score_distribution or process_all:
+        if (args.score_distribution or process_all) and 'score_distribution' not in background_stages:
             process_score_distribution(use_database=args.use_database)
         
         # Process time series if requested or if processing all
@@ -6105,16 +6278,29 @@ Available visuals:
         
         # Process question correctness if requested or if processing all
         if args.question_correctness or process_all:
-            process_question_correctness(use_database=args.use_database)
+            process_question_correctness(use_database=args.use_database, df_score=question_fetch.result())
         
         # Process parent poll if requested or if processing all
-        if args.parent_poll or process_all:
+        if (args.parent_poll or process_all) and 'parent_poll' not in background_stages:
             process_parent_poll()
         
         # Process video viewership if requested or if processing all
-        if args.video_viewership or process_all:
+        if (args.video_viewership or process_all) and 'video_viewership' not in background_stages:
             process_video_viewership()
         
+        # Wait for every --parallel stage and report each one before failing on any of them
+        failed_stages = []
+        for stage_name, stage_future in background_stages.items():
+            try:
+                stage_future.result()
+                print(f"[OK] Worker process finished: {stage_name}")
+            except Exception as e:
+                print(f"[ERROR] Worker process failed: {stage_name}: {str(e)}")
+                failed_stages.append(stage_name)
+        sys.stdout.flush()
+        if failed_stages:
+            raise RuntimeError(f"Worker process stage(s) failed: {', '.join(failed_stages)}")
+        
         # Update metadata if requested or if processing all
         if args.metadata or process_all:
             print("\n[FINAL STEP] Updating metadata...")
@@ -6138,10 +6324,15 @@ Available visuals:
         
     except Exception as e:
         print(f"\nERROR during preprocessing: {str(e)}")
-        import traceback
         traceback.print_exc()
         print("Please check your database connection and try again.")
         sys.exit(1)
+    
+    finally:
+        # On the error path, don't start queued --parallel stages and wait for running ones
+        # here, rather than leaving them writing data/ while the interpreter exits
+        if stage_executor is not None:
+            stage_executor.shutdown(wait=True, cancel_futures=True)
 
 
 if __name__ == "__main__":
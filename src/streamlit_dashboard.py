@@ -126,38 +126,46 @@ def try_refresh_poll_responses_data() -> None:
         "\n\tand `hybrid_games_links`.`activity_id` is not null;"
     )
 
+    # Build poll response aggregates with expected columns.
+    # Rows are streamed with a server-side (unbuffered) cursor and parsed batch by
+    # batch, so the full result set is never held in memory alongside `records`.
+    # Note: an SSCursor must be fully consumed/closed before the same connection
+    # can run another query.
+    import pymysql  # type: ignore
+    batch_size = 10000
+    records = []
     try:
-        with conn.cursor() as cur:
+        with conn.cursor(pymysql.cursors.SSDictCursor) as cur:
             cur.execute(SQL)
-            rows = cur.fetchall() or []
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                for r in rows:
+                    cd1 = r.get("custom_dimension_1")
+                    q, o = _parse_poll_fields(cd1)
+                    # Try different possible game name columns
+                    game_name = (
+                        r.get("game_name")
+                        or r.get("name")
+                        or r.get("title")
+                        or r.get("hybrid_games.name")
+                    )
+                    # Avoid collision with matomo_log_action.name; prefer hybrid_games column
+                    if isinstance(game_name, str) and r.get("name") == game_name:
+                        pass
+                    elif not isinstance(game_name, str):
+                        # If not found, and there is a separate games table alias, leave as Unknown
+                        game_name = "Unknown"
+                    records.append({"question": q, "option": o, "game_name": game_name})
     finally:
         try:
             conn.close()
         except Exception:
             pass
 
-    if not rows:
+    if not records:
         return
-    
-    # Build poll response aggregates with expected columns
-    records = []
-    for r in rows:
-        cd1 = r.get("custom_dimension_1")
-        q, o = _parse_poll_fields(cd1)
-        # Try different possible game name columns
-        game_name = (
-            r.get("game_name")
-            or r.get("name")
-            or r.get("title")
-            or r.get("hybrid_games.name")
-        )
-        # Avoid collision with matomo_log_action.name; prefer hybrid_games column
-        if isinstance(game_name, str) and r.get("name") == game_name:
-            pass
-        elif not isinstance(game_name, str):
-            # If not found, and there is a separate games table alias, leave as Unknown
-            game_name = "Unknown"
-        records.append({"question": q, "option": o, "game_name": game_name})
 
     df = pd.DataFrame.from_records(records)
     if df.empty:
@@ -178,6 +186,10 @@ def try_refresh_poll_responses_data() -> None:
     output_path = os.path.join(DATA_DIR, "poll_responses_data.csv")
     try:
         result_df.to_csv(output_path, index=False)
+        # Drop the preprocessing script's Parquet copy so it can't shadow the refreshed CSV
+        parquet_path = os.path.splitext(output_path)[0] + ".parquet"
+        if os.path.exists(parquet_path):
+            os.remove(parquet_path)
         st.info("Parent Poll Responses data refreshed from database.")
     except Exception as e:
         st.warning(f"Could not write refreshed poll data: {e}")
@@ -366,7 +378,17 @@ def load_processed_data():
             score_distribution_df['domain'] = score_distribution_df['game_code'].apply(extract_domain_from_game_code)
         
         # Load poll responses data
-        poll_responses_df = pd.read_csv(os.path.join(DATA_DIR, "poll_responses_data.csv"))
+        poll_responses_df = None
+        poll_parquet = os.path.join(DATA_DIR, "poll_responses_data.parquet")
+        if os.path.exists(poll_parquet):
+            # Columnar copy written by the preprocessing script; faster to load than the CSV
+            try:
+                poll_responses_df = pd.read_parquet(poll_parquet)
+            except Exception as e:
+                st.warning(f"Could not read {poll_parquet}, falling back to the CSV: {e}")
+                poll_responses_df = None
+        if poll_responses_df is None:
+            poll_responses_df = pd.read_csv(os.path.join(DATA_DIR, "poll_responses_data.csv"))
         
         # Extract domain from game_code if available
         if 'game_code' in poll_responses_df.columns and 'domain' not in poll_responses_df.columns:
@@ -384,8 +406,18 @@ def load_processed_data():
 
         # Load per-question correctness data (optional)
         qpath = os.path.join(DATA_DIR, "question_correctness_data.csv")
-        if os.path.exists(qpath):
-            question_correctness_df = pd.read_csv(qpath)
+        qpath_parquet = os.path.join(DATA_DIR, "question_correctness_data.parquet")
+        if os.path.exists(qpath_parquet) or os.path.exists(qpath):
+            question_correctness_df = None
+            if os.path.exists(qpath_parquet):
+                # Columnar copy written by the preprocessing script; faster to load than the CSV
+                try:
+                    question_correctness_df = pd.read_parquet(qpath_parquet)
+                except Exception as e:
+                    st.warning(f"Could not read {qpath_parquet}, falling back to the CSV: {e}")
+                    question_correctness_df = None
+            if question_correctness_df is None:
+                question_correctness_df = pd.read_csv(qpath)
             
             # Extract domain from game_code if available (similar to poll_responses_df)
             if 'game_code' in question_correctness_df.columns and 'domain' not in question_correctness_df.columns:
@@ -126,38 +126,46 @@ def try_refresh_poll_responses_data() -> None:
         "\n\tand `hybrid_games_links`.`activity_id` is not null;"
     )
 
+    # Build poll response aggregates with expected columns.
+    # Rows are streamed with a server-side (unbuffered) cursor and parsed batch by
+    # batch, so the full result set is never held in memory alongside `records`.
+    # Note: an SSCursor must be fully consumed/closed before the same connection
+    # can run another query.
+    import pymysql  # type: ignore
+    batch_size = 10000
+    records = []
     try:
-        with conn.cursor() as cur:
+        with conn.cursor(pymysql.cursors.SSDictCursor) as cur:
             cur.execute(SQL)
-            rows = cur.fetchall() or []
+            while True:
+                rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                for r in rows:
+                    cd1 = r.get("custom_dimension_1")
+                    q, o = _parse_poll_fields(cd1)
+                    # Try different possible game name columns
+                    game_name = (
+                        r.get("game_name")
+                        or r.get("name")
+                        or r.get("title")
+                        or r.get("hybrid_games.name")
+                    )
+                    # Avoid collision with matomo_log_action.name; prefer hybrid_games column
+                    if isinstance(game_name, str) and r.get("name") == game_name:
+                        pass
+                    elif not isinstance(game_name, str):
+                        # If not found, and there is a separate games table alias, leave as Unknown
+                        game_name = "Unknown"
+                    records.append({"question": q, "option": o, "game_name": game_name})
     finally:
         try:
             conn.close()
         except Exception:
             pass
 
-    if not rows:
+    if not records:
         return
-    
-    # Build poll response aggregates with expected columns
-    records = []
-    for r in rows:
-        cd1 = r.get("custom_dimension_1")
-        q, o = _parse_poll_fields(cd1)
-        # Try different possible game name columns
-        game_name = (
-            r.get("game_name")
-            or r.get("name")
-            or r.get("title")
-            or r.get("hybrid_games.name")
-        )
-        # Avoid collision with matomo_log_action.name; prefer hybrid_games column
-        if isinstance(game_name, str) and r.get("name") == game_name:
-            pass
-        elif not isinstance(game_name, str):
-            # If not found, and there is a separate games table alias, leave as Unknown
-            game_name = "Unknown"
-        records.append({"question": q, "option": o, "game_name": game_name})
 
     df = pd.DataFrame.from_records(records)
     if df.empty: